@@ -0,0 +1 @@
+"""Benchmarks and the local stand-in Odoo server."""
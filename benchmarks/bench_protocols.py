@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare XML-RPC and JSON-RPC on large search results.
+
+Runs ``OdooClient.search_records`` against the local stand-in Odoo with
+each protocol/transport combination and prints latency figures.
+
+Usage:
+    python benchmarks/bench_protocols.py [--records 5000] [--limit 2000] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from fake_odoo import FakeOdoo, start_fake_odoo
+
+from odoo_mcp.client import OdooClient
+from odoo_mcp.config import Settings
+
+
+COMBINATIONS = [
+    ("xmlrpc", "threaded"),
+    ("xmlrpc", "asyncio"),
+    ("jsonrpc", "asyncio"),
+]
+
+
+async def run(url: str, protocol: str, transport: str, limit: int, rounds: int) -> list:
+    client = OdooClient(
+        Settings(
+            odoo_url=url,
+            odoo_database="bench",
+            odoo_username="admin",
+            odoo_password="admin",
+            odoo_protocol=protocol,
+            odoo_transport=transport,
+            max_limit=limit,
+        )
+    )
+    # Warm up the connection and authentication
+    await client.search_records("res.partner", limit=1)
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        records = await client.search_records("res.partner", limit=limit)
+        timings.append(time.perf_counter() - start)
+        assert len(records) == limit
+    await client.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    options = parser.parse_args()
+
+    fake = FakeOdoo()
+    fake.seed("res.partner", options.records)
+    server, url = start_fake_odoo(fake)
+
+    print(f"search_records of {options.limit} rows x {options.rounds} rounds\n")
+    print(f"{'protocol':<10} {'transport':<10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    try:
+        for protocol, transport in COMBINATIONS:
+            timings = asyncio.run(
+                run(url, protocol, transport, options.limit, options.rounds)
+            )
+            timings_ms = sorted(t * 1000 for t in timings)
+            p95 = timings_ms[min(len(timings_ms) - 1, int(len(timings_ms) * 0.95))]
+            print(
+                f"{protocol:<10} {transport:<10} "
+                f"{statistics.mean(timings_ms):>9.1f} "
+                f"{statistics.median(timings_ms):>9.1f} {p95:>9.1f}"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
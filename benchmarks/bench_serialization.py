@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compare tool response serializers on large record lists.
+
+Serializes a search result shaped like the ``search_odoo_records`` response
+with each backend/style combination of ``ResponseSerializer`` (and the old
+``json.dumps(indent=2, default=str)``) and prints timings and payload sizes.
+
+Usage:
+    python benchmarks/bench_serialization.py [--records 5000] [--rounds 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import xmlrpc.client
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from fake_odoo import FakeOdoo
+
+from odoo_mcp.serialization import ResponseSerializer, orjson
+
+
+def build_response(count: int) -> dict:
+    fake = FakeOdoo()
+    fake.seed("res.partner", count)
+    records = fake.search_read("res.partner", [])
+    for record in records:
+        record["write_date"] = xmlrpc.client.DateTime("20240101T12:00:00")
+        record["parent_id"] = [1, "Parent Company"]
+    return {"model": "res.partner", "count": len(records), "records": records}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    options = parser.parse_args()
+
+    response = build_response(options.records)
+    candidates = [("json.dumps indent=2", lambda v: json.dumps(v, indent=2, default=str))]
+    for backend in ("json", "orjson"):
+        if backend == "orjson" and orjson is None:
+            continue
+        for compact in (False, True):
+            serializer = ResponseSerializer(compact=compact, backend=backend)
+            label = f"{backend} {'compact' if compact else 'indent'}"
+            candidates.append((label, serializer.dumps))
+
+    print(f"{options.records} records x {options.rounds} rounds\n")
+    print(f"{'serializer':<22} {'mean ms':>9} {'p50 ms':>9} {'KiB':>9}")
+    for label, dumps in candidates:
+        timings = []
+        for _ in range(options.rounds):
+            start = time.perf_counter()
+            payload = dumps(response)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(
+            f"{label:<22} {statistics.mean(timings):>9.1f} "
+            f"{statistics.median(timings):>9.1f} {len(payload.encode()) / 1024:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark suite over OdooClient and the server tools.
+
+Starts the local stand-in Odoo in a separate process, then runs search, read, create and
+fields_get workloads both directly on ``OdooClient`` and through the
+``server.py`` tool handlers (which add argument parsing and response
+serialization). Each workload reports throughput, latency percentiles and
+the peak memory allocated per operation. Results can be saved as JSON and
+compared against a previous run to catch regressions.
+
+Usage:
+    python benchmarks/bench_suite.py [--iterations 200] [--concurrency 8]
+        [--latency 0.002] [--protocol xmlrpc] [--transport threaded]
+        [--output results.json] [--compare baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from fake_odoo import FakeOdoo, start_fake_odoo, start_fake_odoo_process
+
+# Operations measured for memory, after the timed run
+MEMORY_SAMPLES = 20
+
+FIELDS = ["name", "email", "phone", "city", "credit_limit"]
+
+Operation = Callable[[int], Awaitable[Any]]
+
+
+def build_workloads(client: Any, server: Any, ids: List[int]) -> List[Tuple[str, Operation]]:
+    """
+    Create the benchmarked operations.
+
+    Args:
+        client: OdooClient connected to the fake Odoo
+        server: The odoo_mcp.server module, using the same fake Odoo
+        ids: Existing record ids
+
+    Returns:
+        (name, operation) pairs; each operation takes the iteration number
+    """
+    def page_ids(i: int) -> List[int]:
+        start = (i * 50) % max(1, len(ids) - 50)
+        return ids[start:start + 50]
+
+    return [
+        ("client.search", lambda i: client.search_records(
+            "res.partner", fields=FIELDS, limit=100, offset=i % 10 * 100)),
+        ("client.read", lambda i: client.call_method(
+            "res.partner", "read", [page_ids(i)], {"fields": FIELDS})),
+        ("client.create", lambda i: client.create_record(
+            "res.partner", {"name": f"Bench {i}", "email": f"bench{i}@example.com"})),
+        ("client.fields_get", lambda i: client.get_model_fields("res.partner")),
+        ("tool.search", lambda i: server.search_odoo_records(
+            "res.partner", fields=FIELDS, limit=100, offset=i % 10 * 100)),
+        ("tool.read", lambda i: server.call_odoo_method(
+            "res.partner", "read", args=json.dumps([page_ids(i)]),
+            kwargs=json.dumps({"fields": FIELDS}))),
+        ("tool.create", lambda i: server.create_odoo_record(
+            "res.partner", json.dumps({"name": f"Tool {i}"}))),
+        ("tool.fields_get", lambda i: server.get_odoo_model_fields("res.partner")),
+    ]
+
+
+async def run_workload(operation: Operation, iterations: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Time a workload and measure its memory use.
+
+    Args:
+        operation: Operation to run
+        iterations: Number of operations
+        concurrency: Operations in flight at once
+
+    Returns:
+        Throughput, latency percentiles (ms), errors and peak KiB per operation
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: List[float] = []
+    errors = 0
+
+    async def timed(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await operation(i)
+            except Exception:
+                errors += 1
+            timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for i in range(MEMORY_SAMPLES):
+        await operation(iterations + i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ordered = sorted(t * 1000 for t in timings)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
+
+    return {
+        "ops_per_s": round(iterations / elapsed, 1),
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "errors": errors,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+async def run_suite(options: argparse.Namespace, url: str) -> Dict[str, Dict[str, Any]]:
+    # The server module reads its settings from the environment on import
+    os.environ.update({
+        "ODOO_URL": url,
+        "ODOO_DATABASE": "bench",
+        "ODOO_USERNAME": "admin",
+        "ODOO_PASSWORD": "admin",
+        "ODOO_PROTOCOL": options.protocol,
+        "ODOO_TRANSPORT": options.transport,
+        "ODOO_RETRY_DELAY": "0.01",
+        "LOG_LEVEL": "WARNING",
+    })
+    from odoo_mcp import server
+
+    client = await server.get_odoo_client()
+    ids = [record["id"] for record in await client.search_records(
+        "res.partner", fields=["id"], limit=options.records)]
+
+    results = {}
+    for name, operation in build_workloads(client, server, ids):
+        if options.only and not any(part in name for part in options.only):
+            continue
+        results[name] = await run_workload(operation, options.iterations, options.concurrency)
+        print_row(name, results[name])
+    await client.close()
+    return results
+
+
+def print_row(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"{name:<18} {result['ops_per_s']:>9.1f} {result['p50_ms']:>9.2f} "
+        f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+        f"{result['peak_kib']:>10.1f} {result['errors']:>6}"
+    )
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline_path: str, threshold: float) -> bool:
+    """
+    Print the change against a saved run.
+
+    Args:
+        results: Workload results of this run
+        baseline_path: JSON file saved by a previous run
+        threshold: Relative slowdown of p50 or throughput reported as a regression
+
+    Returns:
+        True if no workload regressed beyond the threshold
+    """
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)["workloads"]
+
+    print(f"\nCompared with {baseline_path}\n")
+    print(f"{'workload':<18} {'ops/s':>9} {'p50':>9} {'p95':>9}")
+    ok = True
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        throughput = result["ops_per_s"] / before["ops_per_s"] - 1
+        p50 = result["p50_ms"] / before["p50_ms"] - 1 if before["p50_ms"] else 0.0
+        p95 = result["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        regressed = throughput < -threshold or p50 > threshold
+        ok = ok and not regressed
+        print(
+            f"{name:<18} {throughput:>+9.1%} {p50:>+9.1%} {p95:>+9.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--extra-fields", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.002, help="Server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random server latency")
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--fault-kind", default="unavailable", choices=FakeOdoo.FAULT_KINDS)
+    parser.add_argument("--protocol", default="xmlrpc", choices=["xmlrpc", "jsonrpc"])
+    parser.add_argument("--transport", default="threaded", choices=["threaded", "asyncio"])
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Serve the fake Odoo from a thread of this process instead of a separate process",
+    )
+    parser.add_argument("--only", nargs="*", help="Run the workloads whose name contains any of these")
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with results saved by --output")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    options = parser.parse_args()
+
+    fake_options = {
+        "latency": options.latency,
+        "jitter": options.jitter,
+        "fault_rate": options.fault_rate,
+        "fault_kind": options.fault_kind,
+        "seed": 0,
+    }
+    seeds = [("res.partner", options.records, {"extra_fields": options.extra_fields})]
+    if options.in_process:
+        fake = FakeOdoo(**fake_options)
+        for model, count, seed_options in seeds:
+            fake.seed(model, count, **seed_options)
+        http_server, url = start_fake_odoo(fake)
+        stop = http_server.shutdown
+    else:
+        process, url = start_fake_odoo_process(fake_options, seeds)
+        stop = process.terminate
+
+    print(
+        f"{options.protocol}/{options.transport}, {options.iterations} operations per "
+        f"workload, concurrency {options.concurrency}, server latency "
+        f"{options.latency * 1000:.1f} ms\n"
+    )
+    print(
+        f"{'workload':<18} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'peak KiB':>10} {'errors':>6}"
+    )
+    try:
+        results = asyncio.run(run_suite(options, url))
+    finally:
+        stop()
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as output_file:
+            json.dump({
+                "meta": {
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "python": platform.python_version(),
+                    "options": vars(options),
+                },
+                "workloads": results,
+            }, output_file, indent=2)
+        print(f"\nSaved results to {options.output}")
+
+    if options.compare and not compare(results, options.compare, options.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
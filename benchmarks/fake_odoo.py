@@ -0,0 +1,497 @@
+"""
+Local stand-in Odoo server for benchmarks.
+
+Serves the ``common`` and ``object`` services over both XML-RPC
+(``/xmlrpc/2/<service>``) and JSON-RPC (``/jsonrpc``) from in-memory models,
+so ``OdooClient`` can be measured without a live Odoo instance.
+
+Server latency, payload sizes (text length and number of extra fields per
+record) and faults can be configured to reproduce slower or flaky servers.
+"""
+
+import json
+import multiprocessing
+import random
+import socket
+import threading
+import time
+import xmlrpc.client
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class FakeOdoo:
+    """In-memory models answering a subset of the Odoo ORM API."""
+
+    # Injectable failures: an Odoo fault, an HTTP 503 answer, or a
+    # connection closed without any answer
+    FAULT_KINDS = ("fault", "unavailable", "disconnect")
+
+    def __init__(
+        self,
+        uid: int = 2,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fault_rate: float = 0.0,
+        fault_kind: str = "fault",
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the fake Odoo.
+
+        Args:
+            uid: User id returned by ``authenticate``
+            latency: Seconds added to every request
+            jitter: Extra random seconds (0 to jitter) added to every request
+            fault_rate: Probability that an ``object`` request fails
+            fault_kind: Failure injected by ``fault_rate`` (see FAULT_KINDS)
+            seed: Random seed, for reproducible jitter and faults
+        """
+        if fault_kind not in self.FAULT_KINDS:
+            raise ValueError(f"Unknown fault kind: {fault_kind}")
+        self.uid = uid
+        self.latency = latency
+        self.jitter = jitter
+        self.fault_rate = fault_rate
+        self.fault_kind = fault_kind
+        self.models: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.requests = 0
+        self._next_id: Dict[str, int] = {}
+        self._pending_faults: Deque[str] = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def fail_next(self, kind: str = "fault", count: int = 1) -> None:
+        """
+        Make the next ``object`` requests fail, regardless of ``fault_rate``.
+
+        Args:
+            kind: Failure to inject (see FAULT_KINDS)
+            count: Number of requests to fail
+        """
+        if kind not in self.FAULT_KINDS:
+            raise ValueError(f"Unknown fault kind: {kind}")
+        with self._lock:
+            self._pending_faults.extend([kind] * count)
+
+    def before_request(self, service: str) -> Optional[str]:
+        """
+        Apply the configured latency and pick the failure of a request.
+
+        Args:
+            service: Requested service (``common`` or ``object``)
+
+        Returns:
+            The failure to inject, or None
+        """
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            kind = None
+            if service == "object":
+                if self._pending_faults:
+                    kind = self._pending_faults.popleft()
+                elif self.fault_rate and self._random.random() < self.fault_rate:
+                    kind = self.fault_kind
+        if delay:
+            time.sleep(delay)
+        return kind
+
+    def seed(
+        self,
+        model: str,
+        count: int,
+        text_size: int = 20,
+        extra_fields: int = 0,
+    ) -> None:
+        """
+        Fill a model with generated records.
+
+        Args:
+            model: Model name
+            count: Number of records to create
+            text_size: Length of the generated text values
+            extra_fields: Number of additional text fields per record, for wide reads
+        """
+        filler = "x" * text_size
+        extra = {f"x_field_{index}": filler for index in range(extra_fields)}
+        for _ in range(count):
+            self.create(
+                model,
+                {
+                    "name": f"Record {filler}",
+                    "email": f"user@{filler}.example.com",
+                    "phone": "+1 555 0100",
+                    "street": f"{filler} Street 1",
+                    "city": "Springfield",
+                    "zip": "12345",
+                    "active": True,
+                    "is_company": False,
+                    "customer_rank": 1,
+                    "credit_limit": 1000.0,
+                    "comment": filler * 4,
+                    "parent_id": False,
+                    "category_id": [],
+                    **extra,
+                },
+            )
+
+    # Services
+
+    def common(self, method: str, args: List[Any]) -> Any:
+        """Dispatch a ``common`` service call."""
+        if method == "version":
+            return {
+                "server_version": "17.0",
+                "server_serie": "17.0",
+                "protocol_version": 1,
+            }
+        if method in ("authenticate", "login"):
+            return self.uid
+        raise xmlrpc.client.Fault(1, f"The method 'common.{method}' does not exist")
+
+    def object(self, method: str, args: List[Any]) -> Any:
+        """Dispatch an ``object`` service call (``execute_kw``)."""
+        if method != "execute_kw":
+            raise xmlrpc.client.Fault(1, f"The method 'object.{method}' does not exist")
+        _, uid, _, model, model_method, model_args, *rest = args
+        kwargs = rest[0] if rest else {}
+        handler = getattr(self, model_method, None)
+        if handler is None or model_method.startswith("_"):
+            raise xmlrpc.client.Fault(
+                1, f"The method '{model}.{model_method}' does not exist"
+            )
+        return handler(model, *model_args, **kwargs)
+
+    # ORM methods
+
+    def _records(self, model: str) -> Dict[int, Dict[str, Any]]:
+        return self.models.setdefault(model, {})
+
+    def _match(self, record: Dict[str, Any], domain: List[Any]) -> bool:
+        """Evaluate a domain (prefix notation) against a record."""
+        stack: List[bool] = []
+        for term in reversed(domain or []):
+            if term == "!":
+                stack.append(not stack.pop())
+            elif term in ("&", "|"):
+                first, second = stack.pop(), stack.pop()
+                stack.append(first and second if term == "&" else first or second)
+            else:
+                stack.append(self._leaf(record, term))
+        return all(stack)
+
+    def _leaf(self, record: Dict[str, Any], leaf: List[Any]) -> bool:
+        field, operator, value = leaf
+        current = record.get(field)
+        if isinstance(current, list) and len(current) == 2 and operator != "in":
+            current = current[0]
+        if operator == "=":
+            return current == value
+        if operator == "!=":
+            return current != value
+        if operator == "in":
+            return current in value
+        if operator == "not in":
+            return current not in value
+        if operator in ("like", "ilike"):
+            return str(value).lower() in str(current or "").lower()
+        if operator == ">":
+            return current > value
+        if operator == ">=":
+            return current >= value
+        if operator == "<":
+            return current < value
+        if operator == "<=":
+            return current <= value
+        raise xmlrpc.client.Fault(1, f"Invalid operator '{operator}'")
+
+    def _select(
+        self,
+        model: str,
+        domain: List[Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        records = [r for r in self._records(model).values() if self._match(r, domain)]
+        if order:
+            for part in reversed(order.split(",")):
+                name, _, direction = part.strip().partition(" ")
+                records.sort(
+                    key=lambda r: (r.get(name) is None, r.get(name)),
+                    reverse=direction.strip().lower() == "desc",
+                )
+        end = offset + limit if limit else None
+        return records[offset:end]
+
+    def _project(
+        self, record: Dict[str, Any], fields: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        if not fields:
+            return dict(record)
+        result = {"id": record["id"]}
+        for field in fields:
+            result[field] = record.get(field, False)
+        return result
+
+    def search(
+        self,
+        model: str,
+        domain: List[Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[int]:
+        return [r["id"] for r in self._select(model, domain, offset, limit, order)]
+
+    def search_count(self, model: str, domain: List[Any], **kwargs: Any) -> int:
+        return len(self._select(model, domain))
+
+    def read(
+        self,
+        model: str,
+        ids: List[int],
+        fields: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        records = self._records(model)
+        return [self._project(records[i], fields) for i in ids if i in records]
+
+    def search_read(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        return [
+            self._project(r, fields)
+            for r in self._select(model, domain, offset, limit, order)
+        ]
+
+    def create(self, model: str, values: Any, **kwargs: Any) -> Any:
+        vals_list = values if isinstance(values, list) else [values]
+        ids = []
+        with self._lock:
+            records = self._records(model)
+            for vals in vals_list:
+                record_id = self._next_id.get(model, 1)
+                self._next_id[model] = record_id + 1
+                records[record_id] = {"id": record_id, **vals}
+                ids.append(record_id)
+        return ids if isinstance(values, list) else ids[0]
+
+    def write(self, model: str, ids: List[int], values: Dict[str, Any], **kwargs: Any) -> bool:
+        records = self._records(model)
+        for record_id in ids:
+            if record_id not in records:
+                raise xmlrpc.client.Fault(
+                    2, f"Record does not exist or has been deleted: {model}({record_id})"
+                )
+            records[record_id].update(values)
+        return True
+
+    def unlink(self, model: str, ids: List[int], **kwargs: Any) -> bool:
+        records = self._records(model)
+        for record_id in ids:
+            records.pop(record_id, None)
+        return True
+
+    def fields_get(
+        self,
+        model: str,
+        allfields: Optional[List[str]] = None,
+        attributes: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        sample = next(iter(self._records(model).values()), {"id": 0})
+        result = {}
+        for name, value in sample.items():
+            if allfields and name not in allfields:
+                continue
+            definition = {
+                "type": _field_type(value),
+                "string": name.replace("_", " ").title(),
+                "required": name == "name",
+                "readonly": name == "id",
+                "help": f"Help text for {name}. " * 5,
+                "searchable": True,
+                "sortable": True,
+            }
+            if attributes:
+                definition = {k: v for k, v in definition.items() if k in attributes}
+            result[name] = definition
+        return result
+
+
+def _field_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, list):
+        return "many2many"
+    return "char"
+
+
+class FakeOdooHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler for the XML-RPC and JSON-RPC endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # keep-alive response would stall on delayed ACKs
+    disable_nagle_algorithm = True
+    fake: FakeOdoo
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/jsonrpc":
+            service = json.loads(body).get("params", {}).get("service")
+        elif self.path.startswith("/xmlrpc/2/"):
+            service = self.path.rsplit("/", 1)[1]
+        else:
+            self.send_error(404)
+            return
+
+        failure = self.fake.before_request(service)
+        if failure == "disconnect":
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        if failure == "unavailable":
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/jsonrpc":
+            payload, content_type = self._jsonrpc(body, failure), "application/json"
+        else:
+            payload, content_type = self._xmlrpc(service, body, failure), "text/xml"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _dispatch(
+        self,
+        service: str,
+        method: str,
+        args: List[Any],
+        failure: Optional[str] = None,
+    ) -> Any:
+        if failure == "fault":
+            raise xmlrpc.client.Fault(1, "Injected fault")
+        if service not in ("common", "object"):
+            raise xmlrpc.client.Fault(1, f"Unknown service '{service}'")
+        return getattr(self.fake, service)(method, args)
+
+    def _xmlrpc(self, service: str, body: bytes, failure: Optional[str] = None) -> bytes:
+        try:
+            args, method = xmlrpc.client.loads(body)
+            result = self._dispatch(service, method, list(args), failure)
+            response = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        except xmlrpc.client.Fault as fault:
+            response = xmlrpc.client.dumps(fault, allow_none=True)
+        return response.encode("utf-8")
+
+    def _jsonrpc(self, body: bytes, failure: Optional[str] = None) -> bytes:
+        request = json.loads(body)
+        params = request.get("params", {})
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            response["result"] = self._dispatch(
+                params.get("service"),
+                params.get("method"),
+                params.get("args", []),
+                failure,
+            )
+        except xmlrpc.client.Fault as fault:
+            response["error"] = {
+                "code": 200,
+                "message": "Odoo Server Error",
+                "data": {"name": "odoo.exceptions.UserError", "message": fault.faultString},
+            }
+        return json.dumps(response).encode("utf-8")
+
+
+def start_fake_odoo(
+    fake: FakeOdoo,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Serve a fake Odoo on a background thread.
+
+    Args:
+        fake: The in-memory Odoo to serve
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        The running server and its base URL
+    """
+    handler = type("BoundFakeOdooHandler", (FakeOdooHandler,), {"fake": fake})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def _serve_forever(
+    fake_options: Dict[str, Any],
+    seeds: List[Tuple[str, int, Dict[str, Any]]],
+    host: str,
+    port: int,
+    urls: "multiprocessing.Queue[str]",
+) -> None:
+    fake = FakeOdoo(**fake_options)
+    for model, count, seed_options in seeds:
+        fake.seed(model, count, **seed_options)
+    _, url = start_fake_odoo(fake, host, port)
+    urls.put(url)
+    threading.Event().wait()
+
+
+def start_fake_odoo_process(
+    fake_options: Optional[Dict[str, Any]] = None,
+    seeds: Optional[List[Tuple[str, int, Dict[str, Any]]]] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> Tuple[multiprocessing.Process, str]:
+    """
+    Serve a fake Odoo from a separate process.
+
+    Unlike ``start_fake_odoo``, the server does not compete with the
+    measured client for the GIL, which keeps throughput figures realistic.
+
+    Args:
+        fake_options: Keyword arguments for ``FakeOdoo``
+        seeds: (model, count, seed options) to generate before serving
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        The server process (terminate it when done) and its base URL
+    """
+    urls: "multiprocessing.Queue[str]" = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_serve_forever,
+        args=(fake_options or {}, seeds or [], host, port, urls),
+        daemon=True,
+    )
+    process.start()
+    return process, urls.get(timeout=30)
@@ -0,0 +1,297 @@
+"""
+In-process caches for the Odoo client.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after a fixed time.
+
+    Not thread-safe; it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept (0 disables the cache)
+            ttl: Seconds an entry stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: Cache key to drop
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, eviction and expiration counters
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            **self._stats,
+        }
+
+
+class RecordCache:
+    """
+    Least-recently-used cache of records, validated by their ``write_date``.
+
+    Entries are keyed by (model, id, field set) and store the record together
+    with the ``write_date`` it was read at. A cached record is only served
+    after the caller confirmed that its current ``write_date`` is unchanged.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of records kept (0 disables the cache)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def lookup(
+        self,
+        model: str,
+        fields_key: Hashable,
+        write_dates: Dict[int, Any],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the cached records whose ``write_date`` is still current.
+
+        Args:
+            model: Odoo model name
+            fields_key: Hashable identifier of the requested field set
+            write_dates: Current ``write_date`` per record id
+
+        Returns:
+            Copies of the fresh cached records, by id
+        """
+        fresh = {}
+        for record_id, write_date in write_dates.items():
+            key = (model, record_id, fields_key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+            elif entry[0] != write_date:
+                del self._entries[key]
+                self._stats["stale"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                fresh[record_id] = dict(entry[1])
+        return fresh
+
+    def store(
+        self,
+        model: str,
+        fields_key: Hashable,
+        records: List[Dict[str, Any]],
+        write_dates: Dict[int, Any],
+    ) -> None:
+        """
+        Cache records read at the given ``write_date`` values.
+
+        Args:
+            model: Odoo model name
+            fields_key: Hashable identifier of the requested field set
+            records: Records to cache
+            write_dates: ``write_date`` per record id at read time
+        """
+        if not self.enabled:
+            return
+        for record in records:
+            record_id = record.get("id")
+            if record_id not in write_dates:
+                continue
+            key = (model, record_id, fields_key)
+            self._entries[key] = (write_dates[record_id], dict(record))
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, model: str, ids: Optional[List[int]] = None) -> None:
+        """
+        Drop the cached records of a model, or only of some ids.
+
+        Args:
+            model: Odoo model name
+            ids: Record ids to drop (all records of the model when omitted)
+        """
+        id_set = set(ids) if ids is not None else None
+        for key in [
+            key
+            for key in self._entries
+            if key[0] == model and (id_set is None or key[1] in id_set)
+        ]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, stale and eviction counters
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            **self._stats,
+        }
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls onto a single in-flight call.
+
+    The first caller for a key starts the call; callers arriving with the same
+    key while it runs await its result instead of starting their own. The
+    result object is shared by all of them and must not be modified. The call
+    runs as its own task, so a cancelled caller does not cancel it for others.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the coalescing layer.
+
+        Args:
+            enabled: Coalesce calls (when False every call runs on its own)
+        """
+        self.enabled = enabled
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._stats = {"executed": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or join the identical call already in flight.
+
+        Args:
+            key: Hashable identity of the call
+            call: Function starting the call
+
+        Returns:
+            The call's result
+        """
+        if not self.enabled:
+            return await call()
+
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._stats["executed"] += 1
+        else:
+            self._stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def forget(self, match: Callable[[Hashable], bool]) -> None:
+        """
+        Stop coalescing onto the in-flight calls whose key matches.
+
+        The calls keep running for their current callers; new callers start
+        a fresh call instead of joining one that may predate a write.
+
+        Args:
+            match: Predicate selecting the keys to forget
+        """
+        for key in [key for key in self._calls if match(key)]:
+            del self._calls[key]
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the outcome as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with executed and coalesced call counters
+        """
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._calls),
+            **self._stats,
+        }
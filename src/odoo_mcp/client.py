@@ -3,12 +3,26 @@ Odoo XML-RPC client for async operations.
 """
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
+import time
 import xmlrpc.client
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, TYPE_CHECKING
 
+from .cache import RecordCache, SingleFlight, TTLCache
+from .metrics import MetricsRegistry, measure_payload, render_prometheus
+from .retry import OUTAGE_KINDS, CircuitBreaker, RetryPolicy, classify_error
+from .scheduler import CallScheduler
 from .config import OdooSettings
+from .tracing import get_tracer
+from .transport import (
+    AsyncXmlRpcTransport,
+    CallExecutor,
+    JsonRpcTransport,
+    ThreadedXmlRpcTransport,
+)
 
 if TYPE_CHECKING:
     from .config import Settings
@@ -39,9 +53,55 @@ class OdooError(Exception):
     """Base class for Odoo-related errors."""
 
 
+def _is_missing_method_fault(fault: xmlrpc.client.Fault, method: str) -> bool:
+    """Check whether a fault means the called method does not exist on the model."""
+    message = str(fault.faultString)
+    if method not in message:
+        return False
+    return any(
+        marker in message
+        for marker in (
+            "does not exist",
+            "has no attribute",
+            "unexpected keyword argument",
+        )
+    )
+
+
+def _query_digest(model: str, domain: List[Any]) -> str:
+    """Short digest identifying a model and domain."""
+    payload = json.dumps([model, domain], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _encode_cursor(model: str, domain: List[Any], last_id: int) -> str:
+    """Encode an opaque keyset cursor."""
+    payload = json.dumps({"q": _query_digest(model, domain), "id": last_id})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, model: str, domain: List[Any]) -> int:
+    """Decode a keyset cursor and return the last id it points past."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        last_id = int(payload["id"])
+        digest = payload["q"]
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if digest != _query_digest(model, domain):
+        raise ValueError("Cursor does not belong to this model and domain")
+    return last_id
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    size = max(1, size)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
 class OdooClient:
     """
-    Asynchronous client for interacting with Odoo via XML-RPC.
+    Asynchronous client for interacting with Odoo via XML-RPC or JSON-RPC.
     
     This client provides methods for authenticating with Odoo and performing
     CRUD operations on Odoo models.
@@ -59,16 +119,89 @@ class OdooClient:
         self.username = settings.odoo_username
         self.password = settings.odoo_password
         self.timeout = settings.odoo_timeout
-        self.max_retries = settings.odoo_max_retries
-        self.retry_delay = settings.odoo_retry_delay
         self.default_limit = settings.default_limit
         self.max_limit = settings.max_limit
+        self.use_web_search_read = settings.odoo_use_web_search_read
+        self.bulk_chunk_size = settings.bulk_chunk_size
+        
+        # Models known to reject the single round trip search methods
+        self._web_search_read_unsupported: Set[str] = set()
+        self._search_read_unsupported: Set[str] = set()
+        
+        # Records keyed by (model, id, field set), revalidated by write_date
+        self._record_cache = RecordCache(max_size=settings.odoo_record_cache_size)
+        
+        # fields_get results, keyed by (database, uid, model, lang, attributes)
+        self._metadata_cache = TTLCache(
+            max_size=settings.odoo_metadata_cache_size,
+            ttl=settings.odoo_metadata_cache_ttl,
+        )
+        
+        # Which failures are retried, how long to wait, and when to stop
+        # calling an Odoo that is down
+        self._retry_policy = RetryPolicy(
+            max_retries=settings.odoo_max_retries,
+            base_delay=settings.odoo_retry_delay,
+            max_delay=settings.odoo_retry_max_delay,
+            idempotent_methods=settings.odoo_idempotent_methods,
+        )
+        self._circuit = CircuitBreaker(
+            failure_threshold=settings.odoo_circuit_failure_threshold,
+            reset_timeout=settings.odoo_circuit_reset_timeout,
+        )
         
-        # Initialize connection state
-        self._common = None
-        self._models = None
+        # Calls, errors, retries, bytes and latency per (model, method)
+        self._metrics = MetricsRegistry(enabled=settings.odoo_metrics_enabled)
+        
+        # Identical reads in flight at the same time share one Odoo call
+        self._singleflight = SingleFlight(enabled=settings.odoo_coalesce_reads)
+        
+        # How many requests reach Odoo at once, and which go first
+        self._scheduler = CallScheduler(
+            max_concurrent=settings.odoo_max_concurrent_calls,
+            lane_limits={
+                "write": settings.odoo_max_concurrent_writes,
+                "method": settings.odoo_max_concurrent_method_calls,
+            },
+            rate=settings.odoo_rate_limit,
+            burst=settings.odoo_rate_limit_burst,
+        )
+        
+        # Pooled keep-alive connections. XML-RPC calls are either run on
+        # executor threads or driven by the event loop; JSON-RPC always runs
+        # on the event loop.
+        self.protocol = settings.odoo_protocol
+        transport_options: Dict[str, Any] = {
+            "size": settings.odoo_pool_size,
+            "timeout": self.timeout,
+            "idle_timeout": settings.odoo_pool_idle_timeout,
+        }
+        self._executor: Optional[CallExecutor] = None
+        if self.protocol == "jsonrpc":
+            transport_class = JsonRpcTransport
+        elif settings.odoo_transport == "asyncio":
+            transport_class = AsyncXmlRpcTransport
+        else:
+            # The client's own threads, so blocking calls neither compete
+            # with other users of the loop's default executor nor exceed
+            # what Odoo is meant to receive at once
+            transport_class = ThreadedXmlRpcTransport
+            self._executor = CallExecutor(
+                max_workers=settings.odoo_executor_workers or settings.odoo_pool_size,
+                max_queue=settings.odoo_executor_max_queue,
+                thread_name_prefix=f"odoo-rpc-{self.database}",
+            )
+            transport_options["executor"] = self._executor
+        self._transport = transport_class(self.url, **transport_options)
+        
+        # Initialize connection state. The uid is shared by every pooled
+        # connection; the lock keeps concurrent calls from authenticating
+        # at the same time, and the generation tells a call whether someone
+        # else already re-authenticated after its credentials were rejected.
         self._authenticated = False
         self.uid = None
+        self._auth_lock = asyncio.Lock()
+        self._auth_generation = 0
 
     async def authenticate(self) -> int:
         """
@@ -82,18 +215,10 @@ class OdooClient:
             OdooConnectionError: If connection fails
         """
         try:
-            # Create common client for authentication
-            common_url = f"{self.url}/xmlrpc/2/common"
-            try:
-                # Try with timeout parameter first
-                self._common = xmlrpc.client.ServerProxy(common_url, timeout=self.timeout)
-            except TypeError:
-                # Fallback without timeout for older Python versions
-                self._common = xmlrpc.client.ServerProxy(common_url)
-            
             # Authenticate and get user ID
-            self.uid = await self._run_in_executor(
-                self._common.authenticate,
+            self.uid = await self._rpc(
+                "common",
+                "authenticate",
                 self.database,
                 self.username,
                 self.password,
@@ -105,20 +230,14 @@ class OdooClient:
                     f"Authentication failed for user '{self.username}' on database '{self.database}'"
                 )
             
-            # Create models client
-            models_url = f"{self.url}/xmlrpc/2/object"
-            try:
-                # Try with timeout parameter first
-                self._models = xmlrpc.client.ServerProxy(models_url, timeout=self.timeout)
-            except TypeError:
-                # Fallback without timeout for older Python versions
-                self._models = xmlrpc.client.ServerProxy(models_url)
-            
             self._authenticated = True
+            self._auth_generation += 1
             logger.info(f"Successfully authenticated with Odoo as user {self.uid}")
             
             return self.uid
             
+        except OdooAuthenticationError:
+            raise
         except xmlrpc.client.Fault as e:
             raise OdooAuthenticationError(f"XML-RPC fault during authentication: {e}")
         except Exception as e:
@@ -132,22 +251,16 @@ class OdooClient:
             Dictionary with server information
         """
         try:
-            if not hasattr(self, '_common') or not self._common:
-                common_url = f"{self.url}/xmlrpc/2/common"
-                try:
-                    # Try with timeout parameter first
-                    self._common = xmlrpc.client.ServerProxy(common_url, timeout=self.timeout)
-                except TypeError:
-                    # Fallback without timeout for older Python versions
-                    self._common = xmlrpc.client.ServerProxy(common_url)
-            
-            version_info = await self._run_in_executor(self._common.version)
+            version_info = await self._rpc("common", "version")
             return {
                 "server_version": version_info.get("server_version"),
                 "server_serie": version_info.get("server_serie"),
                 "protocol_version": version_info.get("protocol_version"),
                 "database": self.database,
                 "connected": True,
+                "pool": self.get_pool_stats(),
+                "cache": self.get_cache_stats(),
+                "retry": self.get_retry_stats(),
             }
         except Exception as e:
             logger.error(f"Connection check failed: {e}")
@@ -189,37 +302,390 @@ class OdooClient:
         elif limit > self.max_limit:
             limit = self.max_limit
         
+        async def search() -> List[Dict[str, Any]]:
+            if self._record_cache.enabled:
+                return await self._cached_search(model, domain, fields, limit, offset, order)
+            return await self._search(model, domain, fields, limit, offset, order)
+        
+        key = (
+            "search_records",
+            model,
+            json.dumps([domain, fields, limit, offset, order], default=str),
+        )
+        
         try:
-            # Search for record IDs
-            search_kwargs = {
-                "offset": offset,
-                "limit": limit,
-            }
-            if order:
-                search_kwargs["order"] = order
+            return await self._singleflight.do(key, search)
             
-            record_ids = await self._execute_kw(
+        except Exception as e:
+            raise OdooError(f"Failed to search records in {model}: {e}")
+
+    async def _search(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]],
+        limit: int,
+        offset: int,
+        order: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Search and read records with the fastest method the model supports."""
+        use_web_search_read = (
+            fields
+            and self.use_web_search_read
+            and model not in self._web_search_read_unsupported
+        )
+        if use_web_search_read:
+            try:
+                return await self._web_search_read(model, domain, fields, limit, offset, order)
+            except xmlrpc.client.Fault as e:
+                if not _is_missing_method_fault(e, "web_search_read"):
+                    raise
+                logger.info(f"web_search_read not available on {model}, falling back: {e}")
+                self._web_search_read_unsupported.add(model)
+        
+        if model not in self._search_read_unsupported:
+            try:
+                return await self._search_read(model, domain, fields, limit, offset, order)
+            except xmlrpc.client.Fault as e:
+                if not _is_missing_method_fault(e, "search_read"):
+                    raise
+                logger.info(f"search_read not available on {model}, falling back: {e}")
+                self._search_read_unsupported.add(model)
+        
+        return await self._search_then_read(model, domain, fields, limit, offset, order)
+
+    async def _cached_search(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]],
+        limit: int,
+        offset: int,
+        order: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Search records, serving unchanged rows from the record cache.
+        
+        The search only fetches ``write_date`` for the matching ids; full rows
+        are then read for the ids that are not cached or changed since.
+        """
+        field_types = await self._get_field_types(model)
+        if "write_date" not in field_types:
+            return await self._search(model, domain, fields, limit, offset, order)
+        
+        stamps = await self._search(model, domain, ["write_date"], limit, offset, order)
+        write_dates = {record["id"]: record["write_date"] for record in stamps}
+        fields_key = tuple(sorted(fields)) if fields else None
+        
+        records = self._record_cache.lookup(model, fields_key, write_dates)
+        missing = [record_id for record_id in write_dates if record_id not in records]
+        if missing:
+            fetched = await self._execute_kw(
                 model,
-                "search",
-                [domain],
-                search_kwargs,
+                "read",
+                [missing],
+                {"fields": fields} if fields else {},
             )
+            self._record_cache.store(model, fields_key, fetched, write_dates)
+            records.update((record["id"], record) for record in fetched)
+        
+        return [records[record_id] for record_id in write_dates if record_id in records]
+
+    async def count_records(
+        self,
+        model: str,
+        domain: Optional[List[Any]] = None,
+    ) -> int:
+        """
+        Count the records matching a domain without transferring them.
+        
+        Args:
+            model: Odoo model name
+            domain: Search domain filters
             
-            if not record_ids:
-                return []
+        Returns:
+            Exact number of matching records
+        """
+        await self._ensure_authenticated()
+        
+        try:
+            return await self._execute_kw(model, "search_count", [domain or []])
             
-            # Read record data
-            records = await self._execute_kw(
+        except Exception as e:
+            raise OdooError(f"Failed to count records in {model}: {e}")
+
+    async def count_records_many(
+        self,
+        model: str,
+        domains: Dict[str, List[Any]],
+    ) -> Dict[str, int]:
+        """
+        Count the records matching several domains concurrently.
+        
+        Args:
+            model: Odoo model name
+            domains: Search domains by label
+            
+        Returns:
+            Exact number of matching records by label
+        """
+        counts = await asyncio.gather(
+            *(self.count_records(model, domain) for domain in domains.values())
+        )
+        return dict(zip(domains, counts))
+
+    async def read_group(
+        self,
+        model: str,
+        groupby: List[str],
+        aggregates: Optional[List[str]] = None,
+        domain: Optional[List[Any]] = None,
+        lazy: bool = True,
+        orderby: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate records server-side with read_group.
+        
+        Args:
+            model: Odoo model name
+            groupby: Fields to group by, optionally with a date granularity
+                (e.g., ['partner_id', 'date:month'])
+            aggregates: Aggregated fields (e.g., ['balance:sum', 'id:count_distinct']);
+                fields without a function use their default aggregator
+            domain: Search domain filters
+            lazy: Group by the first groupby field only, as Odoo does by default
+            orderby: Sort order of the groups (e.g., 'balance desc')
+            limit: Maximum number of groups to return (max: max_limit)
+            offset: Number of groups to skip
+            
+        Returns:
+            List of groups with their groupby values, aggregates and counts
+        """
+        await self._ensure_authenticated()
+        
+        if not groupby:
+            raise ValueError("read_group requires at least one groupby field")
+        
+        # Group count is bounded like search results
+        if limit is None or limit > self.max_limit:
+            limit = self.max_limit
+        
+        kwargs = {
+            "offset": offset,
+            "limit": limit,
+            "lazy": lazy,
+        }
+        if orderby:
+            kwargs["orderby"] = orderby
+        
+        try:
+            groups = await self._execute_kw(
                 model,
-                "read",
-                [record_ids],
-                {"fields": fields} if fields else {},
+                "read_group",
+                [domain or [], aggregates or [], groupby],
+                kwargs,
             )
             
-            return records
-            
         except Exception as e:
-            raise OdooError(f"Failed to search records in {model}: {e}")
+            raise OdooError(f"Failed to aggregate records in {model}: {e}")
+        
+        # The context only matters to the web client
+        for group in groups:
+            group.pop("__context", None)
+        return groups
+
+    async def iter_records(
+        self,
+        model: str,
+        domain: Optional[List[Any]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        after_id: int = 0,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream all matching records page by page with an id keyset cursor.
+        
+        Each page is fetched with ``id > last_id`` ordered by id instead of
+        an offset, so every page costs the same however deep the scan goes
+        and rows inserted meanwhile do not shift later pages.
+        
+        Args:
+            model: Odoo model name
+            domain: Search domain filters
+            fields: Fields to retrieve
+            page_size: Records per page (default: default_limit, max: max_limit)
+            after_id: Only return records with an id greater than this
+            
+        Yields:
+            Lists of record dictionaries, in ascending id order
+        """
+        page_size = min(page_size or self.default_limit, self.max_limit)
+        last_id = after_id
+        while True:
+            page = await self.search_records(
+                model,
+                domain=list(domain or []) + [["id", ">", last_id]],
+                fields=fields,
+                limit=page_size,
+                order="id asc",
+            )
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]["id"]
+
+    async def search_page(
+        self,
+        model: str,
+        domain: Optional[List[Any]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch one keyset page and an opaque cursor for the next one.
+        
+        Args:
+            model: Odoo model name
+            domain: Search domain filters; must match the cursor's domain
+            fields: Fields to retrieve
+            page_size: Records per page (default: default_limit, max: max_limit)
+            cursor: Cursor returned by the previous page, if any
+            
+        Returns:
+            Dictionary with ``records`` and ``next_cursor`` (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another query
+        """
+        domain = list(domain or [])
+        after_id = _decode_cursor(cursor, model, domain) if cursor else 0
+        page_size = min(page_size or self.default_limit, self.max_limit)
+        
+        records: List[Dict[str, Any]] = []
+        async for page in self.iter_records(model, domain, fields, page_size, after_id):
+            records = page
+            break
+        
+        next_cursor = None
+        if len(records) == page_size:
+            next_cursor = _encode_cursor(model, domain, records[-1]["id"])
+        return {"records": records, "next_cursor": next_cursor}
+
+    async def _web_search_read(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: List[str],
+        limit: int,
+        offset: int,
+        order: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Search and read records with Odoo 17+ ``web_search_read``.
+        
+        Many2one fields are requested with their display name and converted
+        back to ``[id, display_name]`` pairs, so records have the same shape
+        as ``search_read`` results.
+        """
+        field_types = await self._get_field_types(model)
+        many2one_fields = [
+            field for field in fields if field_types.get(field) == "many2one"
+        ]
+        specification: Dict[str, Any] = {field: {} for field in fields}
+        for field in many2one_fields:
+            specification[field] = {"fields": {"display_name": {}}}
+        
+        kwargs = {
+            "specification": specification,
+            "offset": offset,
+            "limit": limit,
+            "count_limit": 1,
+        }
+        if order:
+            kwargs["order"] = order
+        
+        result = await self._execute_kw(
+            model,
+            "web_search_read",
+            [domain],
+            kwargs,
+        )
+        records = result.get("records", [])
+        for record in records:
+            for field in many2one_fields:
+                value = record.get(field)
+                if isinstance(value, dict):
+                    record[field] = [value["id"], value.get("display_name")]
+        return records
+
+    async def _get_field_types(self, model: str) -> Dict[str, str]:
+        """Get the type of every field of a model."""
+        fields = await self.get_model_fields(model, attributes=["type"])
+        return {name: definition.get("type") for name, definition in fields.items()}
+
+    async def _search_read(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]],
+        limit: int,
+        offset: int,
+        order: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Search and read records in a single ``search_read`` round trip."""
+        kwargs = {
+            "offset": offset,
+            "limit": limit,
+        }
+        if fields:
+            kwargs["fields"] = fields
+        if order:
+            kwargs["order"] = order
+        
+        return await self._execute_kw(
+            model,
+            "search_read",
+            [domain],
+            kwargs,
+        )
+
+    async def _search_then_read(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]],
+        limit: int,
+        offset: int,
+        order: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Search for record IDs, then read them (two round trips)."""
+        search_kwargs = {
+            "offset": offset,
+            "limit": limit,
+        }
+        if order:
+            search_kwargs["order"] = order
+        
+        record_ids = await self._execute_kw(
+            model,
+            "search",
+            [domain],
+            search_kwargs,
+        )
+        
+        if not record_ids:
+            return []
+        
+        return await self._execute_kw(
+            model,
+            "read",
+            [record_ids],
+            {"fields": fields} if fields else {},
+        )
 
     async def create_record(
         self,
@@ -244,6 +710,7 @@ class OdooClient:
                 "create",
                 [values],
             )
+            self._invalidate_reads(model)
             
             logger.info(f"Created record {record_id} in {model}")
             return record_id
@@ -251,6 +718,65 @@ class OdooClient:
         except Exception as e:
             raise OdooError(f"Failed to create record in {model}: {e}")
 
+    async def create_records(
+        self,
+        model: str,
+        values_list: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Create many records, sending each chunk as one ``create`` call.
+        
+        A failing chunk does not stop the others; its error is reported
+        alongside the ids created by the successful chunks.
+        
+        Args:
+            model: Odoo model name
+            values_list: Field values for each new record
+            chunk_size: Records per ``create`` call (default: bulk_chunk_size)
+            concurrency: Number of chunks sent in parallel
+            
+        Returns:
+            Dictionary with created ``ids`` (in input order, failed chunks
+            omitted) and per-chunk ``errors``
+        """
+        await self._ensure_authenticated()
+        
+        chunks = _chunks(values_list, chunk_size or self.bulk_chunk_size)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def create_chunk(chunk: List[Dict[str, Any]]) -> List[int]:
+            async with semaphore:
+                return await self._execute_kw(model, "create", [chunk])
+        
+        outcomes = await asyncio.gather(
+            *(create_chunk(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+        self._invalidate_reads(model)
+        
+        ids: List[int] = []
+        errors: List[Dict[str, Any]] = []
+        start = 0
+        for index, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+            if isinstance(outcome, BaseException):
+                errors.append({
+                    "chunk": index,
+                    "start": start,
+                    "count": len(chunk),
+                    "error": str(outcome),
+                })
+            else:
+                ids.extend(outcome if isinstance(outcome, list) else [outcome])
+            start += len(chunk)
+        
+        logger.info(
+            f"Created {len(ids)} records in {model} "
+            f"({len(chunks)} chunks, {len(errors)} failed)"
+        )
+        return {"ids": ids, "errors": errors}
+
     async def update_record(
         self,
         model: str,
@@ -276,6 +802,7 @@ class OdooClient:
                 "write",
                 [[record_id], values],
             )
+            self._invalidate_reads(model, [record_id])
             
             logger.info(f"Updated record {record_id} in {model}")
             return result
@@ -283,6 +810,90 @@ class OdooClient:
         except Exception as e:
             raise OdooError(f"Failed to update record {record_id} in {model}: {e}")
 
+    async def update_records(
+        self,
+        model: str,
+        ids: Optional[List[int]] = None,
+        values: Optional[Dict[str, Any]] = None,
+        updates: Optional[List[Any]] = None,
+        chunk_size: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Update many records with as few ``write`` calls as possible.
+        
+        Either pass ``ids`` and one ``values`` dict applied to all of them, or
+        ``updates`` as a list of ``(id, values)`` pairs. The values of an id
+        listed several times are merged, later ones winning. Records sharing
+        the same values are grouped into one ``write`` over many ids, and
+        every group is chunked.
+        
+        Args:
+            model: Odoo model name
+            ids: IDs of the records to update with ``values``
+            values: Field values written to every id in ``ids``
+            updates: List of ``(id, values)`` pairs or ``{"id", "values"}`` dicts
+            chunk_size: IDs per ``write`` call (default: bulk_chunk_size)
+            concurrency: Number of ``write`` calls sent in parallel
+            
+        Returns:
+            Dictionary with ``updated_ids``, the number of ``calls`` made and
+            per-call ``errors``
+        """
+        if updates is None:
+            if ids is None or values is None:
+                raise ValueError("Pass either ids and values, or updates")
+            updates = [(record_id, values) for record_id in ids]
+        
+        await self._ensure_authenticated()
+        
+        # Merge repeated ids in request order, so the last value requested
+        # for a field wins as if the updates had been written one by one
+        merged: Dict[int, Dict[str, Any]] = {}
+        for update in updates:
+            if isinstance(update, dict):
+                record_id, record_values = update["id"], update["values"]
+            else:
+                record_id, record_values = update
+            merged[record_id] = {**merged.get(record_id, {}), **record_values}
+        
+        # Group ids by identical values, keeping first-seen order
+        groups: Dict[str, Any] = {}
+        for record_id, record_values in merged.items():
+            key = json.dumps(record_values, sort_keys=True, default=str)
+            groups.setdefault(key, (record_values, []))[1].append(record_id)
+        
+        calls = [
+            (chunk, group_values)
+            for group_values, group_ids in groups.values()
+            for chunk in _chunks(group_ids, chunk_size or self.bulk_chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def write_chunk(chunk: List[int], chunk_values: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._execute_kw(model, "write", [chunk, chunk_values])
+        
+        outcomes = await asyncio.gather(
+            *(write_chunk(chunk, chunk_values) for chunk, chunk_values in calls),
+            return_exceptions=True,
+        )
+        self._invalidate_reads(model, [i for chunk, _ in calls for i in chunk])
+        
+        updated_ids: List[int] = []
+        errors: List[Dict[str, Any]] = []
+        for (chunk, _), outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                errors.append({"ids": chunk, "error": str(outcome)})
+            else:
+                updated_ids.extend(chunk)
+        
+        logger.info(
+            f"Updated {len(updated_ids)} records in {model} "
+            f"({len(calls)} calls, {len(errors)} failed)"
+        )
+        return {"updated_ids": updated_ids, "calls": len(calls), "errors": errors}
+
     async def delete_record(
         self,
         model: str,
@@ -306,6 +917,7 @@ class OdooClient:
                 "unlink",
                 [[record_id]],
             )
+            self._invalidate_reads(model, [record_id])
             
             logger.info(f"Deleted record {record_id} from {model}")
             return result
@@ -313,30 +925,170 @@ class OdooClient:
         except Exception as e:
             raise OdooError(f"Failed to delete record {record_id} from {model}: {e}")
 
-    async def get_model_fields(self, model: str) -> Dict[str, Any]:
+    async def delete_records(
+        self,
+        model: str,
+        ids: Optional[List[int]] = None,
+        domain: Optional[List[Any]] = None,
+        dry_run: bool = False,
+        chunk_size: Optional[int] = None,
+        concurrency: int = 1,
+        allow_all: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Delete many records, by id list or by domain, in chunked ``unlink`` calls.
+        
+        A domain is resolved server-side with ``search``. In dry-run mode
+        nothing is deleted; only the number of matching records is returned.
+        An empty domain selects every record of the model, so it is refused
+        unless ``allow_all`` is set.
+        
+        Args:
+            model: Odoo model name
+            ids: IDs of the records to delete
+            domain: Search domain selecting the records to delete
+            dry_run: Only count the records that would be deleted
+            chunk_size: IDs per ``unlink`` call (default: bulk_chunk_size)
+            concurrency: Number of ``unlink`` calls sent in parallel
+            allow_all: Confirm that an empty domain may delete every record
+            
+        Returns:
+            Dictionary with the matching ``count`` and, unless dry-running,
+            ``deleted_ids``, the number of ``calls`` made and per-call ``errors``
+        """
+        if (ids is None) == (domain is None):
+            raise ValueError("Pass either ids or domain")
+        if domain is not None and not domain and not dry_run and not allow_all:
+            raise ValueError(
+                f"An empty domain would delete every {model} record; "
+                f"pass allow_all=True to confirm"
+            )
+        
+        await self._ensure_authenticated()
+        
+        try:
+            if dry_run:
+                count_domain = domain if domain is not None else [["id", "in", ids]]
+                count = await self._execute_kw(model, "search_count", [count_domain])
+                return {"dry_run": True, "count": count}
+            
+            if domain is not None:
+                ids = await self._execute_kw(model, "search", [domain])
+        except Exception as e:
+            raise OdooError(f"Failed to select records to delete in {model}: {e}")
+        
+        calls = _chunks(list(ids), chunk_size or self.bulk_chunk_size)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def unlink_chunk(chunk: List[int]) -> Any:
+            async with semaphore:
+                return await self._execute_kw(model, "unlink", [chunk])
+        
+        outcomes = await asyncio.gather(
+            *(unlink_chunk(chunk) for chunk in calls),
+            return_exceptions=True,
+        )
+        self._invalidate_reads(model, ids)
+        
+        deleted_ids: List[int] = []
+        errors: List[Dict[str, Any]] = []
+        for chunk, outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                errors.append({"ids": chunk, "error": str(outcome)})
+            else:
+                deleted_ids.extend(chunk)
+        
+        logger.info(
+            f"Deleted {len(deleted_ids)} records from {model} "
+            f"({len(calls)} calls, {len(errors)} failed)"
+        )
+        return {
+            "dry_run": False,
+            "count": len(ids),
+            "deleted_ids": deleted_ids,
+            "calls": len(calls),
+            "errors": errors,
+        }
+
+    async def get_model_fields(
+        self,
+        model: str,
+        attributes: Optional[List[str]] = None,
+        lang: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Get field definitions for an Odoo model.
         
+        Results are cached per database, user, model, language and attribute
+        set, with a TTL and LRU eviction. The returned dictionary is shared
+        with the cache and must not be modified.
+        
         Args:
             model: Odoo model name
+            attributes: Field attributes to return (e.g. ['type', 'string']);
+                all attributes when omitted
+            lang: Language code for translated labels (e.g. 'fr_FR')
             
         Returns:
             Dictionary of field definitions
         """
         await self._ensure_authenticated()
         
-        try:
+        attributes_key = tuple(sorted(attributes)) if attributes else None
+        cache_key = (self.database, self.uid, model, lang, attributes_key)
+        fields = self._metadata_cache.get(cache_key)
+        if fields is not None:
+            return fields
+        
+        kwargs: Dict[str, Any] = {}
+        if attributes:
+            kwargs["attributes"] = list(attributes)
+        if lang:
+            kwargs["context"] = {"lang": lang}
+        
+        async def fields_get() -> Dict[str, Any]:
             fields = await self._execute_kw(
                 model,
                 "fields_get",
                 [],
+                kwargs,
             )
-            
+            self._metadata_cache.set(cache_key, fields)
             return fields
+        
+        try:
+            return await self._singleflight.do(("fields_get",) + cache_key, fields_get)
             
         except Exception as e:
             raise OdooError(f"Failed to get fields for model {model}: {e}")
 
+    def _invalidate_reads(self, model: str, ids: Optional[List[int]] = None) -> None:
+        """
+        Keep reads issued after a write from seeing data from before it.
+        
+        Args:
+            model: Odoo model name
+            ids: Written or deleted record ids to drop from the record cache
+        """
+        if ids:
+            self._record_cache.invalidate(model, ids)
+        self._singleflight.forget(
+            lambda key: key[0] == "search_records" and key[1] == model
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get client cache statistics.
+        
+        Returns:
+            Dictionary with statistics for each cache
+        """
+        return {
+            "metadata": self._metadata_cache.stats(),
+            "records": self._record_cache.stats(),
+            "coalescing": self._singleflight.stats(),
+        }
+
     async def call_method(
         self,
         model: str,
@@ -378,7 +1130,7 @@ class OdooClient:
         kwargs: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """
-        Execute a method on an Odoo model with retry logic.
+        Execute a method on an Odoo model, retrying per the retry policy.
         
         Args:
             model: Odoo model name
@@ -392,36 +1144,218 @@ class OdooClient:
         if kwargs is None:
             kwargs = {}
         
-        for attempt in range(self.max_retries + 1):
+        attempt = 0
+        reauthenticated = False
+        error: Optional[BaseException] = None
+        start = time.perf_counter()
+        tracer = get_tracer()
+        span = tracer.start("odoo.execute_kw", model=model, method=method)
+        with measure_payload() as payload:
             try:
-                result = await self._run_in_executor(
-                    self._models.execute_kw,
-                    self.database,
-                    self.uid,
-                    self.password,
+                while True:
+                    self._circuit.before_call()
+                    generation = self._auth_generation
+                    rpc_span = tracer.start("odoo.rpc", attempt=attempt + 1)
+                    try:
+                        async with self._scheduler.slot(method):
+                            result = await self._rpc(
+                                "object",
+                                "execute_kw",
+                                self.database,
+                                self.uid,
+                                self.password,
+                                model,
+                                method,
+                                args,
+                                kwargs,
+                            )
+                    
+                    except Exception as e:
+                        kind = classify_error(e)
+                        tracer.end(rpc_span, error=e, error_kind=kind)
+                        if kind in OUTAGE_KINDS:
+                            self._circuit.record_failure()
+                        elif kind == "saturated":
+                            # Never reached Odoo: says nothing about its health
+                            self._circuit.record_abort()
+                        else:
+                            self._circuit.record_success()
+                        
+                        # Rejected credentials: authenticate again once and replay
+                        if kind == "auth" and not reauthenticated:
+                            reauthenticated = True
+                            logger.warning(
+                                f"Odoo rejected the credentials for {model}.{method}: {e}. "
+                                f"Re-authenticating..."
+                            )
+                            await self._reauthenticate(generation)
+                            continue
+                        
+                        # Once the circuit opens, surface the failure instead of retrying
+                        if self._circuit.state == "open":
+                            raise
+                        if not self._retry_policy.should_retry(method, kind, attempt):
+                            raise
+                        
+                        delay = self._retry_policy.backoff(attempt)
+                        logger.warning(
+                            f"Attempt {attempt + 1} failed for {model}.{method} ({kind}): {e}. "
+                            f"Retrying in {delay:.2f} seconds..."
+                        )
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                    
+                    except BaseException as e:
+                        # Cancelled: the attempt has no outcome, so release
+                        # the circuit breaker's probe if this call held it
+                        tracer.end(rpc_span, error=e)
+                        self._circuit.record_abort()
+                        raise
+                    
+                    else:
+                        tracer.end(rpc_span)
+                        self._circuit.record_success()
+                        return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._metrics.observe(
                     model,
                     method,
-                    args,
-                    kwargs,
+                    time.perf_counter() - start,
+                    failed=error is not None,
+                    retries=attempt,
+                    bytes_sent=payload[0],
+                    bytes_received=payload[1],
                 )
-                return result
-                
-            except Exception as e:
-                if attempt == self.max_retries:
-                    raise e
-                
-                logger.warning(
-                    f"Attempt {attempt + 1} failed for {model}.{method}: {e}. "
-                    f"Retrying in {self.retry_delay} seconds..."
+                tracer.end(
+                    span,
+                    error=error,
+                    retries=attempt,
+                    request_bytes=payload[0],
+                    response_bytes=payload[1],
                 )
-                await asyncio.sleep(self.retry_delay)
 
     async def _ensure_authenticated(self) -> None:
         """Ensure the client is authenticated."""
-        if not self._authenticated or not self.uid:
+        if self._authenticated and self.uid:
+            return
+        async with self._auth_lock:
+            if not self._authenticated or not self.uid:
+                await self.authenticate()
+
+    async def _reauthenticate(self, generation: int) -> None:
+        """
+        Authenticate again after Odoo rejected a call's credentials.
+        
+        Concurrent calls rejected together authenticate only once: calls
+        that waited for the lock skip it if the generation they were sent
+        with has already been replaced.
+        
+        Args:
+            generation: Authentication generation the rejected call used
+        """
+        async with self._auth_lock:
+            if self._auth_generation != generation:
+                return
+            self._authenticated = False
             await self.authenticate()
 
-    async def _run_in_executor(self, func, *args) -> Any:
-        """Run a blocking function in a thread executor."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, func, *args)
\ No newline at end of file
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get call metrics per model and method, with client statistics.
+        
+        Returns:
+            Dictionary with per (model, method) call metrics and the pool,
+            cache, retry and scheduler statistics
+        """
+        return {
+            "calls": self._metrics.snapshot(),
+            "pool": self.get_pool_stats(),
+            "cache": self.get_cache_stats(),
+            "retry": self.get_retry_stats(),
+            "scheduler": self._scheduler.stats(),
+        }
+
+    def get_metrics_prometheus(self) -> str:
+        """
+        Get call metrics per model and method in Prometheus text format.
+        
+        Returns:
+            Prometheus exposition text
+        """
+        return prometheus_metrics([({}, self)])
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """
+        Get retry and circuit breaker statistics.
+        
+        Returns:
+            Dictionary with retry counters and the circuit breaker state
+        """
+        return {
+            **self._retry_policy.stats(),
+            "circuit": self._circuit.stats(),
+        }
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+        
+        Returns:
+            Dictionary with connection counters and pool usage
+        """
+        return self._transport.stats()
+
+    async def close(self) -> None:
+        """Close all pooled connections and stop the executor threads."""
+        await self._transport.close()
+        if self._executor is not None:
+            # Calls still queued are cancelled; running ones finish on their
+            # own without blocking the event loop
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._authenticated = False
+
+    async def _rpc(self, endpoint: str, method: str, *args: Any) -> Any:
+        """Call an RPC method through the configured protocol and transport."""
+        return await self._transport.call(endpoint, method, *args)
+
+
+# Executor gauges: metric name, help text and the stats value they report
+_EXECUTOR_GAUGES = (
+    ("executor_queued_calls", "Odoo calls waiting for an executor thread",
+     lambda stats: stats["queued"]),
+    ("executor_running_calls", "Odoo calls running on executor threads",
+     lambda stats: stats["running"]),
+    ("executor_workers", "Executor threads",
+     lambda stats: stats["max_workers"]),
+    ("executor_wait_seconds_max", "Longest wait of a call for an executor thread",
+     lambda stats: stats["wait_ms"]["max"] / 1000),
+)
+
+
+def prometheus_metrics(clients: List[Any]) -> str:
+    """
+    Render the metrics of several clients in Prometheus text format.
+    
+    Args:
+        clients: (labels, client) pairs; the labels (e.g. the connection
+            profile) are added to every sample of that client
+    
+    Returns:
+        Prometheus exposition text
+    """
+    executors = [
+        (labels, client._executor.stats())
+        for labels, client in clients
+        if client._executor is not None
+    ]
+    gauges = [
+        (name, help_text, [(labels, value(stats)) for labels, stats in executors])
+        for name, help_text, value in _EXECUTOR_GAUGES
+    ] if executors else []
+    return render_prometheus(
+        [(labels, client._metrics) for labels, client in clients],
+        gauges=gauges,
+    )
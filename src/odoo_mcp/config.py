@@ -3,8 +3,8 @@ Configuration management for the Odoo MCP server.
 """
 
 from pathlib import Path
-from typing import Optional
-from pydantic import Field, HttpUrl
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Get the project root directory (two levels up from this file)
@@ -75,6 +75,27 @@ class OdooSettings(BaseSettings):
     )
 
 
+class OdooProfile(BaseModel):
+    """Connection settings of an additional Odoo instance or database."""
+
+    url: Optional[str] = Field(
+        default=None,
+        description="Odoo instance URL (default: ODOO_URL)",
+    )
+    database: str = Field(
+        ...,
+        description="Odoo database name",
+    )
+    username: Optional[str] = Field(
+        default=None,
+        description="Odoo username or email (default: ODOO_USERNAME)",
+    )
+    password: Optional[str] = Field(
+        default=None,
+        description="Odoo password or API key (default: ODOO_PASSWORD)",
+    )
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
@@ -113,6 +134,10 @@ class Settings(BaseSettings):
         ...,  # Required
         description="Odoo password or API key",
     )
+    odoo_profiles: Dict[str, OdooProfile] = Field(
+        default_factory=dict,
+        description="Additional connection profiles by name, selected with the tools' profile argument",
+    )
 
     # Optional Odoo settings
     odoo_timeout: int = Field(
@@ -125,7 +150,91 @@ class Settings(BaseSettings):
     )
     odoo_retry_delay: float = Field(
         default=1.0,
-        description="Delay between retries in seconds",
+        description="Delay before the first retry in seconds, doubled on each retry (with jitter)",
+    )
+    odoo_retry_max_delay: float = Field(
+        default=30.0,
+        description="Maximum delay between retries in seconds",
+    )
+    odoo_idempotent_methods: List[str] = Field(
+        default_factory=list,
+        description="Extra model methods safe to retry after a timeout or lost connection",
+    )
+    odoo_circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive connection failures before calls fail fast (0 disables)",
+    )
+    odoo_circuit_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds calls fail fast before a probe call is let through",
+    )
+    odoo_use_web_search_read: bool = Field(
+        default=False,
+        description="Use web_search_read (Odoo 17+) for searches that name their fields",
+    )
+    odoo_protocol: Literal["xmlrpc", "jsonrpc"] = Field(
+        default="xmlrpc",
+        description="RPC protocol used to talk to Odoo: 'xmlrpc' or 'jsonrpc'",
+    )
+    odoo_transport: Literal["threaded", "asyncio"] = Field(
+        default="threaded",
+        description="XML-RPC transport: 'threaded' (executor threads) or 'asyncio'",
+    )
+    odoo_pool_size: int = Field(
+        default=8,
+        description="Maximum number of pooled XML-RPC connections per endpoint",
+    )
+    odoo_pool_idle_timeout: float = Field(
+        default=60.0,
+        description="Seconds after which an idle pooled connection is closed",
+    )
+    odoo_executor_workers: int = Field(
+        default=0,
+        description="Threads running blocking XML-RPC calls (0: same as odoo_pool_size)",
+    )
+    odoo_executor_max_queue: int = Field(
+        default=0,
+        description="Maximum number of calls waiting for an executor thread (0: unbounded)",
+    )
+    odoo_max_concurrent_calls: int = Field(
+        default=0,
+        description="Maximum Odoo requests in flight; reads are admitted before writes and method calls (0: unlimited)",
+    )
+    odoo_max_concurrent_writes: int = Field(
+        default=0,
+        description="Maximum create/write/unlink/copy requests in flight (0: only the global cap)",
+    )
+    odoo_max_concurrent_method_calls: int = Field(
+        default=0,
+        description="Maximum requests to other model methods in flight (0: only the global cap)",
+    )
+    odoo_rate_limit: float = Field(
+        default=0.0,
+        description="Maximum Odoo requests started per second (0: unlimited)",
+    )
+    odoo_rate_limit_burst: int = Field(
+        default=10,
+        description="Requests that may start at once before the rate limit applies",
+    )
+    odoo_record_cache_size: int = Field(
+        default=0,
+        description="Maximum number of cached records, revalidated by write_date (0 disables)",
+    )
+    odoo_metadata_cache_size: int = Field(
+        default=128,
+        description="Maximum number of cached fields_get results (0 disables caching)",
+    )
+    odoo_metadata_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached fields_get result stays valid",
+    )
+    odoo_coalesce_reads: bool = Field(
+        default=True,
+        description="Let identical concurrent searches and fields_get calls share one Odoo call",
+    )
+    odoo_metrics_enabled: bool = Field(
+        default=True,
+        description="Record call counts, errors, latency and payload sizes per model and method",
     )
 
     # MCP server settings
@@ -137,6 +246,42 @@ class Settings(BaseSettings):
         default="0.1.0",
         description="MCP server version",
     )
+    server_transport: Literal["stdio", "streamable-http", "sse"] = Field(
+        default="stdio",
+        description="How MCP clients connect: 'stdio' (one client per process), 'streamable-http' or 'sse'",
+    )
+    server_host: str = Field(
+        default="127.0.0.1",
+        description="Interface the HTTP transports listen on",
+    )
+    server_port: int = Field(
+        default=8000,
+        description="Port the HTTP transports listen on",
+    )
+    server_workers: int = Field(
+        default=1,
+        description="Worker processes of the streamable HTTP transport, each with its own Odoo connections",
+    )
+    server_stateless_http: bool = Field(
+        default=False,
+        description="Serve streamable HTTP requests without server-side sessions (always on with several workers)",
+    )
+    response_compact_json: bool = Field(
+        default=False,
+        description="Return tool responses as compact JSON instead of indented JSON",
+    )
+    response_json_backend: Literal["auto", "json", "orjson"] = Field(
+        default="auto",
+        description="JSON encoder for tool responses: 'orjson', 'json' or 'auto' (orjson if installed)",
+    )
+    trace_exporter: Literal["none", "jsonl", "opentelemetry", "auto"] = Field(
+        default="none",
+        description="Where spans of Odoo calls and tools go: 'jsonl', 'opentelemetry' or 'auto' (OpenTelemetry if installed, else JSONL)",
+    )
+    trace_file: str = Field(
+        default="odoo-mcp-trace.jsonl",
+        description="File the JSONL trace writer appends spans to",
+    )
 
     # Default limits for operations
     default_limit: int = Field(
@@ -147,6 +292,14 @@ class Settings(BaseSettings):
         default=1000,
         description="Maximum limit for search operations",
     )
+    bulk_chunk_size: int = Field(
+        default=500,
+        description="Records sent per call by bulk create, update and delete",
+    )
+    batch_max_concurrency: int = Field(
+        default=4,
+        description="Maximum number of concurrent operations in a batch",
+    )
 
 
 # Global settings instance (lazy-loaded)
@@ -0,0 +1,252 @@
+"""
+Per-model, per-method call metrics for the Odoo client.
+
+``MetricsRegistry`` records, for every (model, method) pair, call and error
+counts, retries, request/response bytes and a latency histogram. Recording
+is a dictionary lookup, a few additions and a bisect, so it stays cheap on
+the hot path; percentiles are only computed when a snapshot is taken.
+
+Payload sizes are reported by the transports through ``record_payload``,
+which adds to the call currently measured by ``measure_payload`` (tracked in
+a context variable, so concurrent calls do not mix their sizes).
+"""
+
+import bisect
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Latest durations kept per method for percentiles
+_SAMPLE_SIZE = 1024
+
+_payload: ContextVar[Optional[List[int]]] = ContextVar("odoo_mcp_payload", default=None)
+
+
+def record_payload(sent: int, received: int) -> None:
+    """
+    Add the bytes of one HTTP exchange to the call being measured, if any.
+
+    Args:
+        sent: Request body size in bytes
+        received: Response body size in bytes
+    """
+    sizes = _payload.get()
+    if sizes is not None:
+        sizes[0] += sent
+        sizes[1] += received
+
+
+@contextmanager
+def measure_payload() -> Iterator[List[int]]:
+    """
+    Collect the bytes sent and received by the transports within the block.
+
+    Yields:
+        A [sent, received] list, updated as exchanges complete
+    """
+    sizes = [0, 0]
+    token = _payload.set(sizes)
+    try:
+        yield sizes
+    finally:
+        _payload.reset(token)
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class _MethodMetrics:
+    """Counters and latency histogram of one (model, method) pair."""
+
+    __slots__ = (
+        "calls", "errors", "retries", "bytes_sent", "bytes_received",
+        "duration_sum", "duration_max", "buckets", "samples",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.samples: Deque[float] = deque(maxlen=_SAMPLE_SIZE)
+
+
+class MetricsRegistry:
+    """Call metrics of an Odoo client, keyed by (model, method)."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled: Record metrics (when False, ``observe`` does nothing)
+        """
+        self.enabled = enabled
+        self._methods: Dict[Tuple[str, str], _MethodMetrics] = {}
+
+    def observe(
+        self,
+        model: str,
+        method: str,
+        duration: float,
+        failed: bool = False,
+        retries: int = 0,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record one call.
+
+        Args:
+            model: Odoo model name
+            method: Method name
+            duration: Seconds the call took, retries included
+            failed: Whether the call ended with an error
+            retries: Number of retries made
+            bytes_sent: Request bytes, retries included
+            bytes_received: Response bytes, retries included
+        """
+        if not self.enabled:
+            return
+        metrics = self._methods.get((model, method))
+        if metrics is None:
+            metrics = self._methods[(model, method)] = _MethodMetrics()
+        metrics.calls += 1
+        metrics.errors += failed
+        metrics.retries += retries
+        metrics.bytes_sent += bytes_sent
+        metrics.bytes_received += bytes_received
+        metrics.duration_sum += duration
+        if duration > metrics.duration_max:
+            metrics.duration_max = duration
+        metrics.buckets[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        metrics.samples.append(duration)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get the metrics of every (model, method) pair.
+
+        Returns:
+            One entry per pair, slowest total time first, with latencies in
+            milliseconds (percentiles over the latest calls)
+        """
+        entries = []
+        for (model, method), metrics in self._methods.items():
+            ordered = sorted(metrics.samples)
+            entries.append({
+                "model": model,
+                "method": method,
+                "calls": metrics.calls,
+                "errors": metrics.errors,
+                "retries": metrics.retries,
+                "bytes_sent": metrics.bytes_sent,
+                "bytes_received": metrics.bytes_received,
+                "latency_ms": {
+                    "total": round(metrics.duration_sum * 1000, 3),
+                    "mean": round(metrics.duration_sum / metrics.calls * 1000, 3),
+                    "p50": round(_percentile(ordered, 0.50) * 1000, 3),
+                    "p95": round(_percentile(ordered, 0.95) * 1000, 3),
+                    "p99": round(_percentile(ordered, 0.99) * 1000, 3),
+                    "max": round(metrics.duration_max * 1000, 3),
+                },
+            })
+        entries.sort(key=lambda entry: entry["latency_ms"]["total"], reverse=True)
+        return entries
+
+    def prometheus(self, prefix: str = "odoo_mcp") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Metrics text
+        """
+        return render_prometheus([({}, self)], prefix=prefix)
+
+
+# (name, help text, [(labels, value)]) of a gauge family
+Gauge = Tuple[str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def render_prometheus(
+    sources: List[Tuple[Dict[str, str], MetricsRegistry]],
+    gauges: Optional[List[Gauge]] = None,
+    prefix: str = "odoo_mcp",
+) -> str:
+    """
+    Render the metrics of several registries in the Prometheus text format.
+
+    Each metric family is written once, with the samples of every registry
+    told apart by that registry's labels (e.g. its connection profile).
+
+    Args:
+        sources: (extra labels, registry) pairs
+        gauges: Gauge families appended after the call metrics
+        prefix: Metric name prefix
+
+    Returns:
+        Metrics text
+    """
+    counters = (
+        ("calls_total", "Odoo calls", "calls"),
+        ("errors_total", "Odoo calls that failed", "errors"),
+        ("retries_total", "Retries of Odoo calls", "retries"),
+        ("request_bytes_total", "Request bytes sent to Odoo", "bytes_sent"),
+        ("response_bytes_total", "Response bytes received from Odoo", "bytes_received"),
+    )
+    labelled = [
+        (_labels({**extra, "model": model, "method": method}), metrics)
+        for extra, registry in sources
+        for (model, method), metrics in sorted(registry._methods.items())
+    ]
+
+    lines = []
+    for name, help_text, attribute in counters:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        for labels, metrics in labelled:
+            lines.append(f"{prefix}_{name}{{{labels}}} {getattr(metrics, attribute)}")
+
+    name = f"{prefix}_call_duration_seconds"
+    lines.append(f"# HELP {name} Duration of Odoo calls, retries included")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, metrics in labelled:
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), metrics.buckets):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {metrics.duration_sum}")
+        lines.append(f"{name}_count{{{labels}}} {metrics.calls}")
+
+    for name, help_text, samples in gauges or []:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} gauge")
+        for labels, value in samples:
+            rendered = _labels(labels)
+            if rendered:
+                lines.append(f"{prefix}_{name}{{{rendered}}} {value}")
+            else:
+                lines.append(f"{prefix}_{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
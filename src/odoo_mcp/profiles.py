@@ -0,0 +1,133 @@
+"""
+Connection profiles: several Odoo instances or databases in one server.
+
+The connection settings (``ODOO_URL``, ``ODOO_DATABASE``, ...) form the
+``default`` profile; ``ODOO_PROFILES`` adds named ones. ``ClientRegistry``
+creates one ``OdooClient`` per profile the first time it is used, with its
+own connection pool, caches and metrics, and keeps it for the lifetime of
+the process.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .client import OdooClient, prometheus_metrics
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+
+
+class ClientRegistry:
+    """Lazily created Odoo clients, one per connection profile."""
+
+    def __init__(self, settings: "Settings"):
+        """
+        Initialize the registry.
+
+        Args:
+            settings: Application settings, including the additional profiles
+        """
+        self.settings = settings
+        self._clients: Dict[str, OdooClient] = {}
+
+    def names(self) -> List[str]:
+        """Get the profile names, the default profile first."""
+        return [DEFAULT_PROFILE] + [
+            name for name in self.settings.odoo_profiles if name != DEFAULT_PROFILE
+        ]
+
+    def settings_for(self, name: str) -> "Settings":
+        """
+        Get the settings of a profile.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            The application settings with the profile's connection settings
+
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        if name == DEFAULT_PROFILE:
+            return self.settings
+        profile = self.settings.odoo_profiles.get(name)
+        if profile is None:
+            raise ValueError(
+                f"Unknown Odoo profile '{name}', expected one of: {', '.join(self.names())}"
+            )
+        return self.settings.model_copy(update={
+            "odoo_url": profile.url or self.settings.odoo_url,
+            "odoo_database": profile.database,
+            "odoo_username": profile.username or self.settings.odoo_username,
+            "odoo_password": profile.password or self.settings.odoo_password,
+        })
+
+    def get(self, name: Optional[str] = None) -> OdooClient:
+        """
+        Get the client of a profile, creating it on first use.
+
+        Args:
+            name: Profile name (default profile when omitted)
+
+        Returns:
+            The profile's client
+
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        name = name or DEFAULT_PROFILE
+        client = self._clients.get(name)
+        if client is None:
+            client = self._clients[name] = OdooClient(self.settings_for(name))
+            logger.info(f"Created Odoo client for profile '{name}' ({client.database})")
+        return client
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """
+        Describe every profile, without credentials.
+
+        Returns:
+            One entry per profile with its URL, database, username and
+            whether its client has been created yet
+        """
+        profiles = []
+        for name in self.names():
+            settings = self.settings_for(name)
+            profiles.append({
+                "name": name,
+                "url": settings.odoo_url,
+                "database": settings.odoo_database,
+                "username": settings.odoo_username,
+                "active": name in self._clients,
+            })
+        return profiles
+
+    def prometheus(self) -> str:
+        """
+        Get the call metrics of every active client in Prometheus text format.
+
+        The default profile's client is created if needed, so the output
+        always has its metric families. Samples carry a ``profile`` label.
+
+        Returns:
+            Prometheus exposition text
+        """
+        self.get()
+        return prometheus_metrics([
+            ({"profile": name}, client) for name, client in self._clients.items()
+        ])
+
+    async def close(self) -> None:
+        """Close the clients created so far."""
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error closing Odoo client for profile '{name}': {e}")
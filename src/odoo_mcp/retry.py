@@ -0,0 +1,277 @@
+"""
+Retry policy and circuit breaker for Odoo calls.
+
+Failures are classified before deciding whether to retry:
+
+- ``unavailable``: the request never reached Odoo (connection refused, DNS
+  failure, HTTP 429/503). Safe to retry for any method.
+- ``saturated``: the request never left this process because its executor
+  queue or connection pool was full. Safe to retry for any method, and not
+  a sign of Odoo being down.
+- ``conflict``: Odoo rolled the transaction back (serialization failure,
+  deadlock). Safe to retry for any method.
+- ``timeout``, ``connection``, ``server``: the request may or may not have
+  been executed. Only retried for idempotent methods, so that ``create``,
+  ``unlink`` and custom methods are never run twice.
+- ``auth``: Odoo rejected the credentials (``AccessDenied``, e.g. after the
+  database was restored or the session state was lost). Not retried by the
+  policy; the client re-authenticates once and replays the call instead.
+- ``fault``: any other Odoo fault (access, validation, missing record). The
+  same call would fail the same way, so it is never retried.
+- ``client``: other HTTP errors and everything else. Never retried.
+
+Retries wait with exponential backoff and full jitter. A circuit breaker
+counts consecutive failures that point at Odoo being down and, once open,
+fails calls immediately until a single probe call succeeds.
+"""
+
+import asyncio
+import random
+import socket
+import time
+import xmlrpc.client
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from .transport import PoolExhaustedError
+
+
+# Methods that can safely run twice with the same arguments
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({
+    "check_access_rights",
+    "default_get",
+    "fields_get",
+    "name_get",
+    "name_search",
+    "read",
+    "read_group",
+    "search",
+    "search_count",
+    "search_read",
+    "web_read",
+    "web_search_read",
+    "write",
+})
+
+RETRYABLE_KINDS = frozenset({"unavailable", "saturated", "conflict"})
+AMBIGUOUS_KINDS = frozenset({"timeout", "connection", "server"})
+
+# Failures that mean Odoo could not be reached, counted by the circuit breaker
+OUTAGE_KINDS = frozenset({"unavailable", "timeout", "connection", "server"})
+
+# Odoo's XML-RPC fault code for AccessDenied
+_ACCESS_DENIED_CODE = 3
+
+# Odoo faults raised when the credentials of a call are rejected
+_AUTH_MARKERS = (
+    "accessdenied",
+    "access denied",
+    "sessionexpired",
+    "session expired",
+)
+
+# Odoo faults raised after the database rolled the transaction back
+_CONFLICT_MARKERS = (
+    "could not serialize access",
+    "deadlock detected",
+    "concurrent update",
+)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised when calls are refused because Odoo is considered down."""
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Classify a failed call to decide whether it may be retried.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        One of 'unavailable', 'saturated', 'conflict', 'timeout', 'connection', 'server',
+        'auth', 'fault' or 'client'
+    """
+    if isinstance(error, xmlrpc.client.Fault):
+        message = str(error.faultString).lower()
+        if error.faultCode == _ACCESS_DENIED_CODE or any(
+            marker in message for marker in _AUTH_MARKERS
+        ):
+            return "auth"
+        if any(marker in message for marker in _CONFLICT_MARKERS):
+            return "conflict"
+        return "fault"
+    if isinstance(error, xmlrpc.client.ProtocolError):
+        if error.errcode in (429, 503):
+            return "unavailable"
+        if error.errcode >= 500:
+            return "server"
+        return "client"
+    if isinstance(error, PoolExhaustedError):
+        return "saturated"
+    if isinstance(error, (ConnectionRefusedError, socket.gaierror)):
+        return "unavailable"
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, socket.timeout)):
+        return "timeout"
+    if isinstance(error, (ConnectionError, OSError, EOFError, asyncio.IncompleteReadError)):
+        return "connection"
+    return "client"
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast after repeated failures, then probes for recovery.
+
+    Closed: calls go through, consecutive failures are counted. Open: calls
+    are refused until ``reset_timeout`` has passed. Half-open: one probe call
+    goes through; its success closes the circuit, its failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (0 disables it)
+            reset_timeout: Seconds the circuit stays open before a probe call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._stats = {"opened": 0, "rejected": 0}
+
+    def before_call(self) -> None:
+        """
+        Check that a call may go through.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a probe is already running
+        """
+        if self.failure_threshold <= 0 or self.state == "closed":
+            return
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                self._reject()
+            self.state = "half_open"
+        if self._probing:
+            self._reject()
+        self._probing = True
+
+    def record_success(self) -> None:
+        """Record a call that reached Odoo."""
+        self._failures = 0
+        self._probing = False
+        self.state = "closed"
+
+    def record_failure(self) -> None:
+        """Record a call that failed because Odoo could not be reached."""
+        self._probing = False
+        self._failures += 1
+        if self.failure_threshold <= 0:
+            return
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                self._stats["opened"] += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def record_abort(self) -> None:
+        """
+        Record a call that ended without an outcome (e.g. it was cancelled).
+
+        A probe aborted this way proves nothing, so the circuit goes back to
+        open, and the next call probes again right away.
+        """
+        if self._probing:
+            self._probing = False
+            self.state = "open"
+
+    def _reject(self) -> None:
+        self._stats["rejected"] += 1
+        retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(
+            f"Odoo is unavailable after {self._failures} consecutive failures; "
+            f"next attempt allowed in {retry_in:.0f}s"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get circuit breaker statistics.
+
+        Returns:
+            Dictionary with the state and failure counters
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            **self._stats,
+        }
+
+
+class RetryPolicy:
+    """Decides whether and when a failed call is retried."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        idempotent_methods: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            base_delay: Backoff delay before the first retry, doubled each time
+            max_delay: Upper bound of the backoff delay
+            idempotent_methods: Extra methods that are safe to run twice
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.idempotent_methods = IDEMPOTENT_METHODS | frozenset(idempotent_methods or ())
+        self._stats: Dict[str, int] = {"retries": 0, "not_retried": 0}
+
+    def should_retry(self, method: str, kind: str, attempt: int) -> bool:
+        """
+        Decide whether a failed call is retried.
+
+        Args:
+            method: Odoo model method that failed
+            kind: Failure classification from ``classify_error``
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            True if the call should be retried
+        """
+        retry = attempt < self.max_retries and (
+            kind in RETRYABLE_KINDS
+            or (kind in AMBIGUOUS_KINDS and method in self.idempotent_methods)
+        )
+        self._stats["retries" if retry else "not_retried"] += 1
+        return retry
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before a retry, with full jitter.
+
+        Args:
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Seconds to wait
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry statistics.
+
+        Returns:
+            Dictionary with retried and not retried failure counts
+        """
+        return dict(self._stats)
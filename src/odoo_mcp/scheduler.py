@@ -0,0 +1,269 @@
+"""
+Admission control for Odoo calls.
+
+``CallScheduler`` sits in front of every ``execute_kw`` request. It caps the
+number of requests in flight, and sorts waiting requests into lanes served
+in priority order:
+
+- ``read``: searches, reads and metadata, which interactive tool calls wait on
+- ``write``: ``create``, ``write``, ``unlink`` and ``copy``
+- ``method``: any other model method (workflow actions, reports, imports),
+  which may run for a long time on the Odoo side
+
+When a slot frees up, the oldest waiting read goes first, then writes, then
+method calls. Optional per-lane caps keep bulk writes and long method calls
+from taking every slot, so reads keep flowing under batch load. A token
+bucket can additionally limit the request rate.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, FrozenSet, Optional
+
+from .tracing import annotate
+
+# Lanes in priority order
+LANES = ("read", "write", "method")
+
+READ_METHODS: FrozenSet[str] = frozenset({
+    "check_access_rights",
+    "default_get",
+    "fields_get",
+    "name_get",
+    "name_search",
+    "read",
+    "read_group",
+    "search",
+    "search_count",
+    "search_read",
+    "web_read",
+    "web_search_read",
+})
+
+WRITE_METHODS: FrozenSet[str] = frozenset({
+    "copy",
+    "create",
+    "unlink",
+    "write",
+})
+
+
+def lane_for(method: str) -> str:
+    """
+    Get the lane of a model method.
+
+    Args:
+        method: Odoo model method name
+
+    Returns:
+        'read', 'write' or 'method'
+    """
+    if method in READ_METHODS:
+        return "read"
+    if method in WRITE_METHODS:
+        return "write"
+    return "method"
+
+
+class TokenBucket:
+    """Limits an average rate while allowing short bursts."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens stored
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        # Waiters take tokens one at a time, in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting until one is available.
+
+        Returns:
+            Seconds waited
+        """
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+        return time.monotonic() - start
+
+
+class CallScheduler:
+    """Concurrency cap, priority lanes and rate limit for Odoo calls."""
+
+    def __init__(
+        self,
+        max_concurrent: int = 0,
+        lane_limits: Optional[Dict[str, int]] = None,
+        rate: float = 0.0,
+        burst: int = 10,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum calls in flight (0: unlimited)
+            lane_limits: Maximum calls in flight per lane (missing or 0: only
+                the global cap applies)
+            rate: Maximum calls started per second (0: unlimited)
+            burst: Calls that may start at once before the rate applies
+        """
+        self.max_concurrent = max_concurrent
+        self.lane_limits = {lane: (lane_limits or {}).get(lane, 0) for lane in LANES}
+        self._bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {
+            lane: deque() for lane in LANES
+        }
+        self._active: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._total = 0
+        self._stats: Dict[str, Dict[str, Any]] = {
+            lane: {"admitted": 0, "queued": 0, "wait_total": 0.0, "wait_max": 0.0}
+            for lane in LANES
+        }
+        self._rate_waits = 0
+        self._rate_wait_total = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether calls can ever be held back."""
+        return bool(
+            self.max_concurrent or any(self.lane_limits.values()) or self._bucket
+        )
+
+    def _can_start(self, lane: str) -> bool:
+        limit = self.lane_limits[lane]
+        return (not self.max_concurrent or self._total < self.max_concurrent) and (
+            not limit or self._active[lane] < limit
+        )
+
+    def _start(self, lane: str) -> None:
+        self._active[lane] += 1
+        self._total += 1
+
+    def _dispatch(self) -> None:
+        """Start waiting calls that fit, highest priority lane first."""
+        for lane in LANES:
+            waiters = self._waiters[lane]
+            while waiters and self._can_start(lane):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self._start(lane)
+                waiter.set_result(None)
+
+    async def _acquire(self, lane: str) -> None:
+        if not self._waiters[lane] and self._can_start(lane):
+            self._start(lane)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        self._stats[lane]["queued"] += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation: pass the slot on
+                self._release(lane)
+            else:
+                try:
+                    self._waiters[lane].remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def _release(self, lane: str) -> None:
+        self._active[lane] -= 1
+        self._total -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, method: str) -> AsyncIterator[str]:
+        """
+        Hold a slot for one Odoo request.
+
+        Args:
+            method: Odoo model method about to be called
+
+        Yields:
+            The lane the call runs in
+        """
+        lane = lane_for(method)
+        if not self.enabled:
+            yield lane
+            return
+
+        start = time.monotonic()
+        await self._acquire(lane)
+        try:
+            waited = time.monotonic() - start
+            stats = self._stats[lane]
+            stats["admitted"] += 1
+            stats["wait_total"] += waited
+            if waited > stats["wait_max"]:
+                stats["wait_max"] = waited
+
+            if self._bucket is not None:
+                rate_waited = await self._bucket.acquire()
+                if rate_waited > 0.001:
+                    self._rate_waits += 1
+                    self._rate_wait_total += rate_waited
+                waited += rate_waited
+
+            annotate(lane=lane, schedule_ms=round(waited * 1000, 3))
+            yield lane
+        finally:
+            self._release(lane)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with the limits, and per lane the calls in flight and
+            waiting, lifetime counters and waiting time (milliseconds)
+        """
+        return {
+            "enabled": self.enabled,
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._total,
+            "lanes": {
+                lane: {
+                    "limit": self.lane_limits[lane],
+                    "in_flight": self._active[lane],
+                    "waiting": len(self._waiters[lane]),
+                    "admitted": stats["admitted"],
+                    "queued": stats["queued"],
+                    "wait_ms": {
+                        "total": round(stats["wait_total"] * 1000, 3),
+                        "max": round(stats["wait_max"] * 1000, 3),
+                    },
+                }
+                for lane, stats in self._stats.items()
+            },
+            "rate_limit": {
+                "rate": self._bucket.rate if self._bucket else 0.0,
+                "burst": self._bucket.burst if self._bucket else 0,
+                "waits": self._rate_waits,
+                "wait_ms": round(self._rate_wait_total * 1000, 3),
+            },
+        }
@@ -0,0 +1,108 @@
+"""
+JSON serialization of tool responses.
+
+Tool results are returned to the model as JSON text. ``ResponseSerializer``
+produces either indented or compact output, uses orjson when it is installed
+(``pip install odoo-mcp[fast]``), and encodes the values XML-RPC hands back
+that the json module does not know: ``xmlrpc.client.DateTime`` and
+``Binary``, ``bytes`` and ``datetime``/``date``.
+"""
+
+import base64
+import json
+import xmlrpc.client
+from typing import Any
+
+from .tracing import get_tracer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """
+    Encode a value the JSON encoders do not handle natively.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        A JSON-serializable representation of the value
+    """
+    if isinstance(value, xmlrpc.client.DateTime):
+        text = value.value
+        # 20240131T08:30:00 -> 2024-01-31 08:30:00, without strptime's cost
+        if len(text) == 17 and text[8] == "T":
+            return f"{text[:4]}-{text[4:6]}-{text[6:8]} {text[9:]}"
+        return text
+    if isinstance(value, xmlrpc.client.Binary):
+        value = value.data
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    return str(value)
+
+
+class ResponseSerializer:
+    """Serializes tool responses to JSON text."""
+
+    def __init__(self, compact: bool = False, backend: str = "auto"):
+        """
+        Initialize the serializer.
+
+        Args:
+            compact: Emit JSON without indentation or extra whitespace
+            backend: 'orjson', 'json' (standard library) or 'auto' (orjson if installed)
+        """
+        if backend not in ("auto", "json", "orjson"):
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == "orjson" and orjson is None:
+            raise ImportError("The orjson JSON backend requires the orjson package")
+
+        self.compact = compact
+        self.backend = "orjson" if backend != "json" and orjson is not None else "json"
+
+        if self.backend == "orjson":
+            # Datetimes go through _default so both backends format them alike
+            self._orjson_options = (
+                orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+            if not compact:
+                self._orjson_options |= orjson.OPT_INDENT_2
+
+    def dumps(self, value: Any) -> str:
+        """
+        Serialize a value to JSON text.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            JSON string
+        """
+        tracer = get_tracer()
+        span = tracer.start("serialize", backend=self.backend, compact=self.compact)
+        try:
+            text = self._dumps(value)
+        except BaseException as e:
+            tracer.end(span, error=e)
+            raise
+        tracer.end(span, response_bytes=len(text))
+        return text
+
+    def _dumps(self, value: Any) -> str:
+        if self.backend == "orjson":
+            try:
+                return orjson.dumps(
+                    value, default=_default, option=self._orjson_options
+                ).decode("utf-8")
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits, which the json module accepts
+                pass
+
+        if self.compact:
+            return json.dumps(
+                value, separators=(",", ":"), ensure_ascii=False, default=_default
+            )
+        return json.dumps(value, indent=2, ensure_ascii=False, default=_default)
@@ -16,19 +16,34 @@ import json
 import logging
 import sys
 import os
-from typing import Any, Dict, List, Optional, Sequence, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
 
 # Add the parent directory to sys.path to handle relative imports
 if __name__ == "__main__":
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent, Tool
+from starlette.applications import Starlette
 
 try:
     from .client import OdooClient, OdooError
     from .config import get_settings
+    from .profiles import ClientRegistry
+    from .serialization import ResponseSerializer
+    from .tracing import configure_tracing, traced_tool
     from .tools import (
+        RECORD_FORMATS,
+        format_records,
+        aggregate_records_tool,
+        batch_operations_tool,
+        count_records_tool,
+        create_records_tool,
+        delete_records_tool,
+        search_page_tool,
+        update_records_tool,
         create_record_tool,
         delete_record_tool,
         get_model_fields_tool,
@@ -40,7 +55,19 @@ except ImportError:
     # Fallback for direct execution
     from odoo_mcp.client import OdooClient, OdooError
     from odoo_mcp.config import get_settings
+    from odoo_mcp.profiles import ClientRegistry
+    from odoo_mcp.serialization import ResponseSerializer
+    from odoo_mcp.tracing import configure_tracing, traced_tool
     from odoo_mcp.tools import (
+        RECORD_FORMATS,
+        format_records,
+        aggregate_records_tool,
+        batch_operations_tool,
+        count_records_tool,
+        create_records_tool,
+        delete_records_tool,
+        search_page_tool,
+        update_records_tool,
         create_record_tool,
         delete_record_tool,
         get_model_fields_tool,
@@ -58,46 +85,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create the FastMCP server  
-app = FastMCP(settings.server_name)
+# Serializer for tool responses
+serializer = ResponseSerializer(
+    compact=settings.response_compact_json,
+    backend=settings.response_json_backend,
+)
+
+# Span hooks around Odoo calls and tool handlers
+configure_tracing(settings.trace_exporter, settings.trace_file)
+
+# Odoo clients, one per connection profile, created on first use and shared
+# by every MCP session of this process
+clients = ClientRegistry(settings)
 
-# Global Odoo client instance
-_odoo_client: Optional[OdooClient] = None
+
+# Create the FastMCP server. FastMCP's lifespan runs once per MCP session
+# (per request with stateless HTTP), so the Odoo clients are closed when the
+# process stops instead: see serve_stdio and create_http_app.
+app = FastMCP(
+    settings.server_name,
+    host=settings.server_host,
+    port=settings.server_port,
+    # Sessions live in one process, so several workers must not keep any
+    stateless_http=settings.server_stateless_http or settings.server_workers > 1,
+)
 
 
-async def get_odoo_client() -> OdooClient:
-    """Get or create the global Odoo client instance."""
-    global _odoo_client
+async def get_odoo_client(profile: Optional[str] = None) -> OdooClient:
+    """
+    Get or create the Odoo client of a connection profile.
     
-    if _odoo_client is None:
-        _odoo_client = OdooClient(settings)
-        
-    return _odoo_client
+    Args:
+        profile: Profile name (default profile when omitted)
+    
+    Returns:
+        The profile's client
+    """
+    return clients.get(profile)
 
 
 @app.tool()
-async def check_odoo_connection() -> str:
+@traced_tool
+async def check_odoo_connection(profile: Optional[str] = None) -> str:
     """
     Check the connection to the Odoo server and return status information.
     
+    Args:
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
     Returns:
         JSON string with connection status and server information
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
         connection_info = await client.check_connection()
         
-        return json.dumps(connection_info, indent=2)
+        return serializer.dumps(connection_info)
         
     except Exception as e:
         logger.error(f"Connection check failed: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "connected": False,
             "error": str(e),
-        }, indent=2)
+        })
 
 
 @app.tool()
+@traced_tool
 async def search_odoo_records(
     model: str,
     domain: Optional[Union[str, List[Any]]] = None,
@@ -105,6 +159,8 @@ async def search_odoo_records(
     limit: Optional[int] = None,
     offset: int = 0,
     order: Optional[str] = None,
+    format: str = "records",
+    profile: Optional[str] = None,
 ) -> str:
     """
     Search for records in an Odoo model.
@@ -116,12 +172,16 @@ async def search_odoo_records(
         limit: Maximum number of records to return (default: 100, max: 1000)
         offset: Number of records to skip (default: 0)
         order: Sort order (e.g., 'name ASC', 'create_date DESC')
+        format: Result shape (default: 'records', a list of objects). 'columnar' returns
+            "fields" and one value array per field in "columns"; 'rows' returns "fields"
+            and one value list per record in "rows". Both are much smaller on wide reads.
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
 
     Returns:
         JSON string with search results
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
 
         # Accept domain as a list directly or parse from JSON string
         parsed_domain = None
@@ -132,9 +192,9 @@ async def search_odoo_records(
                 try:
                     parsed_domain = json.loads(domain)
                 except json.JSONDecodeError as e:
-                    return json.dumps({
+                    return serializer.dumps({
                         "error": f"Invalid domain JSON: {e}"
-                    }, indent=2)
+                    })
         
         # Accept fields as a list directly or parse from comma-separated string
         parsed_fields = None
@@ -144,6 +204,11 @@ async def search_odoo_records(
             else:
                 parsed_fields = [f.strip() for f in fields.split(",")]
         
+        if format not in RECORD_FORMATS:
+            return serializer.dumps({
+                "error": f"Invalid format '{format}', expected one of: {', '.join(RECORD_FORMATS)}"
+            })
+        
         # Search records
         records = await client.search_records(
             model=model,
@@ -154,28 +219,242 @@ async def search_odoo_records(
             order=order,
         )
         
-        return json.dumps({
+        return serializer.dumps({
             "model": model,
             "count": len(records),
-            "records": records,
-        }, indent=2, default=str)
+            **format_records(records, format),
+        })
         
     except OdooError as e:
         logger.error(f"Odoo error in search_records: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Odoo error: {e}"
-        }, indent=2)
+        })
     except Exception as e:
         logger.error(f"Unexpected error in search_records: {e}")
-        return json.dumps({
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
+async def count_odoo_records(
+    model: str,
+    domain: Optional[Union[str, List[Any]]] = None,
+    domains: Optional[Union[str, Dict[str, List[Any]], List[List[Any]]]] = None,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Count records in an Odoo model exactly, without transferring them.
+    
+    Use this instead of searching and counting the results, which is slower
+    and wrong beyond the search limit.
+    
+    Args:
+        model: Odoo model name (e.g., 'account.move')
+        domain: Search domain as a list or JSON string (e.g., [["state", "=", "posted"]])
+        domains: Several domains counted concurrently, as an object of label -> domain
+            or a list of domains (labels are then "0", "1", ...), or a JSON string
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with "count", or "counts" by label when domains is given
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept each argument directly or parse it from a JSON string
+        parsed = {}
+        for name, value in (("domain", domain), ("domains", domains)):
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as e:
+                    return serializer.dumps({
+                        "error": f"Invalid {name} JSON: {e}"
+                    })
+            parsed[name] = value
+        
+        if isinstance(parsed["domains"], list):
+            parsed["domains"] = {
+                str(index): item for index, item in enumerate(parsed["domains"])
+            }
+        
+        result = await count_records_tool(client, model, **parsed)
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in count_records: {e}")
+        return serializer.dumps({
             "error": f"Unexpected error: {e}"
-        }, indent=2)
+        })
 
 
 @app.tool()
+@traced_tool
+async def aggregate_odoo_records(
+    model: str,
+    groupby: Union[str, List[str]],
+    aggregates: Optional[Union[str, List[str]]] = None,
+    domain: Optional[Union[str, List[Any]]] = None,
+    lazy: bool = True,
+    orderby: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Compute totals, counts and pivots in the Odoo database with read_group.
+    
+    Only the grouped summary is returned, so use this instead of searching
+    and summing records yourself.
+    
+    Args:
+        model: Odoo model name (e.g., 'account.move.line')
+        groupby: Fields to group by as a list or comma-separated string; dates accept
+            a granularity: day, week, month, quarter or year (e.g., 'account_id,date:month')
+        aggregates: Aggregated fields as 'field:function' (sum, avg, min, max, count,
+            count_distinct, array_agg), as a list or comma-separated string
+            (e.g., 'debit:sum,credit:sum')
+        domain: Search domain as a list or JSON string
+        lazy: Group by the first groupby field only (default: true); set false to
+            group by every groupby field at once
+        orderby: Sort order of the groups (e.g., 'debit desc')
+        limit: Maximum number of groups to return (max: 1000)
+        offset: Number of groups to skip (default: 0)
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with one entry per group, including its record count
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept domain as a list directly or parse from JSON string
+        parsed_domain = None
+        if domain is not None:
+            if isinstance(domain, list):
+                parsed_domain = domain
+            else:
+                try:
+                    parsed_domain = json.loads(domain)
+                except json.JSONDecodeError as e:
+                    return serializer.dumps({
+                        "error": f"Invalid domain JSON: {e}"
+                    })
+        
+        # Accept groupby and aggregates as lists or comma-separated strings
+        parsed_groupby = (
+            groupby if isinstance(groupby, list)
+            else [g.strip() for g in groupby.split(",") if g.strip()]
+        )
+        parsed_aggregates = None
+        if aggregates:
+            parsed_aggregates = (
+                aggregates if isinstance(aggregates, list)
+                else [a.strip() for a in aggregates.split(",") if a.strip()]
+            )
+        
+        result = await aggregate_records_tool(
+            client,
+            model,
+            parsed_groupby,
+            aggregates=parsed_aggregates,
+            domain=parsed_domain,
+            lazy=lazy,
+            orderby=orderby,
+            limit=limit,
+            offset=offset,
+        )
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in aggregate_records: {e}")
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
+async def stream_odoo_records(
+    model: str,
+    domain: Optional[Union[str, List[Any]]] = None,
+    fields: Optional[Union[str, List[str]]] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Page through all records of an Odoo model, without the max limit.
+    
+    Records are returned in ascending id order. Call again with the returned
+    next_cursor (and the same model and domain) to get the next page; a null
+    next_cursor means there are no more records. Every page costs the same,
+    however far into the model it is.
+    
+    Args:
+        model: Odoo model name (e.g., 'res.partner', 'account.move.line')
+        domain: Search domain as a list or JSON string
+        fields: List of fields to retrieve or comma-separated string
+        page_size: Records per page (default: 100, max: 1000)
+        cursor: next_cursor from the previous page; omit for the first page
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with the page of records and next_cursor
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept domain as a list directly or parse from JSON string
+        parsed_domain = None
+        if domain is not None:
+            if isinstance(domain, list):
+                parsed_domain = domain
+            else:
+                try:
+                    parsed_domain = json.loads(domain)
+                except json.JSONDecodeError as e:
+                    return serializer.dumps({
+                        "error": f"Invalid domain JSON: {e}"
+                    })
+        
+        # Accept fields as a list directly or parse from comma-separated string
+        parsed_fields = None
+        if fields:
+            if isinstance(fields, list):
+                parsed_fields = fields
+            else:
+                parsed_fields = [f.strip() for f in fields.split(",")]
+        
+        result = await search_page_tool(
+            client,
+            model,
+            domain=parsed_domain,
+            fields=parsed_fields,
+            page_size=page_size,
+            cursor=cursor,
+        )
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in stream_records: {e}")
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
 async def create_odoo_record(
     model: str,
     values: str,
+    profile: Optional[str] = None,
 ) -> str:
     """
     Create a new record in an Odoo model.
@@ -183,48 +462,109 @@ async def create_odoo_record(
     Args:
         model: Odoo model name (e.g., 'res.partner', 'sale.order')
         values: Record values as JSON string (e.g., '{"name": "New Customer", "email": "customer@example.com"}')
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
     
     Returns:
         JSON string with the created record ID
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
         
         # Parse values from JSON string
         try:
             parsed_values = json.loads(values)
         except json.JSONDecodeError as e:
-            return json.dumps({
+            return serializer.dumps({
                 "error": f"Invalid values JSON: {e}"
-            }, indent=2)
+            })
         
         # Create record
         record_id = await client.create_record(model, parsed_values)
         
-        return json.dumps({
+        return serializer.dumps({
             "model": model,
             "record_id": record_id,
             "values": parsed_values,
             "success": True,
-        }, indent=2)
+        })
         
     except OdooError as e:
         logger.error(f"Odoo error in create_record: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Odoo error: {e}"
-        }, indent=2)
+        })
     except Exception as e:
         logger.error(f"Unexpected error in create_record: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Unexpected error: {e}"
-        }, indent=2)
+        })
 
 
 @app.tool()
+@traced_tool
+async def create_odoo_records(
+    model: str,
+    values: Union[str, List[Dict[str, Any]]],
+    chunk_size: Optional[int] = None,
+    parallel: bool = False,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Create many records in an Odoo model with as few calls as possible.
+    
+    Args:
+        model: Odoo model name (e.g., 'res.partner', 'sale.order')
+        values: List of record values, or a JSON string of that list
+            (e.g., '[{"name": "Customer A"}, {"name": "Customer B"}]')
+        chunk_size: Records per create call (default: 500)
+        parallel: Send chunks concurrently instead of one after another
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with the created record IDs and any per-chunk errors
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept values as a list directly or parse from JSON string
+        if isinstance(values, list):
+            parsed_values = values
+        else:
+            try:
+                parsed_values = json.loads(values)
+            except json.JSONDecodeError as e:
+                return serializer.dumps({
+                    "error": f"Invalid values JSON: {e}"
+                })
+        if not isinstance(parsed_values, list):
+            return serializer.dumps({
+                "error": "Values must be a list of objects"
+            })
+        
+        result = await create_records_tool(
+            client,
+            model,
+            parsed_values,
+            chunk_size=chunk_size,
+            concurrency=settings.batch_max_concurrency if parallel else 1,
+        )
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in create_records: {e}")
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
 async def update_odoo_record(
     model: str,
     record_id: int,
     values: str,
+    profile: Optional[str] = None,
 ) -> str:
     """
     Update an existing record in an Odoo model.
@@ -233,47 +573,114 @@ async def update_odoo_record(
         model: Odoo model name (e.g., 'res.partner', 'sale.order')
         record_id: ID of the record to update
         values: Updated values as JSON string (e.g., '{"name": "Updated Name", "email": "new@example.com"}')
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
     
     Returns:
         JSON string with update status
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
         
         # Parse values from JSON string
         try:
             parsed_values = json.loads(values)
         except json.JSONDecodeError as e:
-            return json.dumps({
+            return serializer.dumps({
                 "error": f"Invalid values JSON: {e}"
-            }, indent=2)
+            })
         
         # Update record
         success = await client.update_record(model, record_id, parsed_values)
         
-        return json.dumps({
+        return serializer.dumps({
             "model": model,
             "record_id": record_id,
             "values": parsed_values,
             "success": success,
-        }, indent=2)
+        })
         
     except OdooError as e:
         logger.error(f"Odoo error in update_record: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Odoo error: {e}"
-        }, indent=2)
+        })
     except Exception as e:
         logger.error(f"Unexpected error in update_record: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Unexpected error: {e}"
-        }, indent=2)
+        })
 
 
 @app.tool()
+@traced_tool
+async def update_odoo_records(
+    model: str,
+    ids: Optional[Union[str, List[int]]] = None,
+    values: Optional[Union[str, Dict[str, Any]]] = None,
+    updates: Optional[Union[str, List[Any]]] = None,
+    chunk_size: Optional[int] = None,
+    parallel: bool = False,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Update many records in an Odoo model with as few calls as possible.
+    
+    Pass either ids + values (same change for every record) or updates (a
+    different change per record). Records receiving identical values are
+    written together in one call. When an id is listed several times in
+    updates, its values are merged and the later ones win.
+    
+    Args:
+        model: Odoo model name (e.g., 'res.partner', 'sale.order')
+        ids: Record IDs as a list or JSON string (e.g., '[1, 2, 3]')
+        values: Values written to every id, as an object or JSON string
+        updates: List of [id, values] pairs or {"id": ..., "values": ...} objects,
+            or a JSON string of that list
+        chunk_size: Records per write call (default: 500)
+        parallel: Send write calls concurrently instead of one after another
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with updated record IDs and any per-call errors
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept each argument directly or parse it from a JSON string
+        parsed = {}
+        for name, value in (("ids", ids), ("values", values), ("updates", updates)):
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as e:
+                    return serializer.dumps({
+                        "error": f"Invalid {name} JSON: {e}"
+                    })
+            parsed[name] = value
+        
+        result = await update_records_tool(
+            client,
+            model,
+            chunk_size=chunk_size,
+            concurrency=settings.batch_max_concurrency if parallel else 1,
+            **parsed,
+        )
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in update_records: {e}")
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
 async def delete_odoo_record(
     model: str,
     record_id: int,
+    profile: Optional[str] = None,
 ) -> str:
     """
     Delete a record from an Odoo model.
@@ -281,74 +688,165 @@ async def delete_odoo_record(
     Args:
         model: Odoo model name (e.g., 'res.partner', 'sale.order')
         record_id: ID of the record to delete
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
     
     Returns:
         JSON string with deletion status
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
         
         # Delete record
         success = await client.delete_record(model, record_id)
         
-        return json.dumps({
+        return serializer.dumps({
             "model": model,
             "record_id": record_id,
             "success": success,
-        }, indent=2)
+        })
         
     except OdooError as e:
         logger.error(f"Odoo error in delete_record: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Odoo error: {e}"
-        }, indent=2)
+        })
     except Exception as e:
         logger.error(f"Unexpected error in delete_record: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Unexpected error: {e}"
-        }, indent=2)
+        })
 
 
 @app.tool()
-async def get_odoo_model_fields(model: str) -> str:
+@traced_tool
+async def delete_odoo_records(
+    model: str,
+    ids: Optional[Union[str, List[int]]] = None,
+    domain: Optional[Union[str, List[Any]]] = None,
+    dry_run: bool = False,
+    chunk_size: Optional[int] = None,
+    parallel: bool = False,
+    allow_all: bool = False,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Delete many records from an Odoo model, by id list or by domain.
+    
+    ⚠️ Deletion is permanent. Run with dry_run=true first to see how many
+    records would be deleted. An empty domain ([]) matches every record of
+    the model and is refused unless allow_all=true.
+    
+    Args:
+        model: Odoo model name (e.g., 'res.partner', 'sale.order')
+        ids: Record IDs as a list or JSON string (e.g., '[1, 2, 3]')
+        domain: Search domain selecting the records, as a list or JSON string
+        dry_run: Only count the matching records, delete nothing
+        chunk_size: Records per unlink call (default: 500)
+        parallel: Send unlink calls concurrently instead of one after another
+        allow_all: Confirm that an empty domain deletes every record of the model
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with the matching count, deleted IDs and any per-call errors
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept each argument directly or parse it from a JSON string
+        parsed = {}
+        for name, value in (("ids", ids), ("domain", domain)):
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as e:
+                    return serializer.dumps({
+                        "error": f"Invalid {name} JSON: {e}"
+                    })
+            parsed[name] = value
+        
+        result = await delete_records_tool(
+            client,
+            model,
+            dry_run=dry_run,
+            chunk_size=chunk_size,
+            concurrency=settings.batch_max_concurrency if parallel else 1,
+            allow_all=allow_all,
+            **parsed,
+        )
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in delete_records: {e}")
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
+async def get_odoo_model_fields(
+    model: str,
+    attributes: Optional[Union[str, List[str]]] = None,
+    lang: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> str:
     """
     Get field definitions for an Odoo model.
     
     Args:
         model: Odoo model name (e.g., 'res.partner', 'sale.order')
+        attributes: Field attributes to return, as a list or comma-separated string
+            (e.g., 'type,string,relation,required'); all attributes when omitted
+        lang: Language code for translated labels (e.g., 'fr_FR')
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
     
     Returns:
         JSON string with field definitions
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
+        
+        # Accept attributes as a list directly or parse from comma-separated string
+        parsed_attributes = None
+        if attributes:
+            if isinstance(attributes, list):
+                parsed_attributes = attributes
+            else:
+                parsed_attributes = [a.strip() for a in attributes.split(",")]
         
         # Get model fields
-        fields = await client.get_model_fields(model)
+        fields = await client.get_model_fields(
+            model,
+            attributes=parsed_attributes,
+            lang=lang,
+        )
         
-        return json.dumps({
+        return serializer.dumps({
             "model": model,
             "fields": fields,
-        }, indent=2, default=str)
+        })
         
     except OdooError as e:
         logger.error(f"Odoo error in get_model_fields: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Odoo error: {e}"
-        }, indent=2)
+        })
     except Exception as e:
         logger.error(f"Unexpected error in get_model_fields: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Unexpected error: {e}"
-        }, indent=2)
+        })
 
 
 @app.tool()
+@traced_tool
 async def call_odoo_method(
     model: str,
     method: str,
     args: Optional[str] = None,
     kwargs: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> str:
     """
     Call a custom method on an Odoo model.
@@ -358,12 +856,13 @@ async def call_odoo_method(
         method: Method name to call
         args: Positional arguments as JSON string (e.g., '[1, 2, 3]')
         kwargs: Keyword arguments as JSON string (e.g., '{"context": {"lang": "en_US"}}')
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
     
     Returns:
         JSON string with method result
     """
     try:
-        client = await get_odoo_client()
+        client = await get_odoo_client(profile)
         
         # Parse arguments
         parsed_args = []
@@ -371,38 +870,95 @@ async def call_odoo_method(
             try:
                 parsed_args = json.loads(args)
             except json.JSONDecodeError as e:
-                return json.dumps({
+                return serializer.dumps({
                     "error": f"Invalid args JSON: {e}"
-                }, indent=2)
+                })
         
         parsed_kwargs = {}
         if kwargs:
             try:
                 parsed_kwargs = json.loads(kwargs)
             except json.JSONDecodeError as e:
-                return json.dumps({
+                return serializer.dumps({
                     "error": f"Invalid kwargs JSON: {e}"
-                }, indent=2)
+                })
         
         # Call method
         result = await client.call_method(model, method, parsed_args, parsed_kwargs)
         
-        return json.dumps({
+        return serializer.dumps({
             "model": model,
             "method": method,
             "result": result,
-        }, indent=2, default=str)
+        })
         
     except OdooError as e:
         logger.error(f"Odoo error in call_method: {e}")
-        return json.dumps({
+        return serializer.dumps({
             "error": f"Odoo error: {e}"
-        }, indent=2)
+        })
     except Exception as e:
         logger.error(f"Unexpected error in call_method: {e}")
-        return json.dumps({
+        return serializer.dumps({
+            "error": f"Unexpected error: {e}"
+        })
+
+
+@app.tool()
+@traced_tool
+async def batch_odoo_operations(
+    operations: Union[str, List[Dict[str, Any]]],
+    max_concurrency: Optional[int] = None,
+    profile: Optional[str] = None,
+) -> str:
+    """
+    Run several Odoo operations in one call, concurrently where possible.
+    
+    Args:
+        operations: List of operations (or JSON string). Each operation has a "type"
+            (search, create, update, delete, fields, call_method), the parameters of
+            the matching tool (model, domain, fields, values, record_id, method, ...),
+            an optional "id" and an optional "depends_on" list of operation ids that
+            must succeed first. Example:
+            [{"id": "p", "type": "create", "model": "res.partner", "values": {"name": "A"}},
+             {"id": "s", "type": "search", "model": "res.partner", "limit": 5}]
+        max_concurrency: Maximum operations running at once (default: 4)
+        profile: Connection profile (see odoo://profiles); the default profile when omitted
+    
+    Returns:
+        JSON string with per-operation results and timings, in input order
+    """
+    try:
+        client = await get_odoo_client(profile)
+        
+        # Accept operations as a list directly or parse from JSON string
+        if isinstance(operations, list):
+            parsed_operations = operations
+        else:
+            try:
+                parsed_operations = json.loads(operations)
+            except json.JSONDecodeError as e:
+                return serializer.dumps({
+                    "error": f"Invalid operations JSON: {e}"
+                })
+        if not isinstance(parsed_operations, list):
+            return serializer.dumps({
+                "error": "Operations must be a list"
+            })
+        
+        result = await batch_operations_tool(
+            client,
+            parsed_operations,
+            max_concurrency=max_concurrency or settings.batch_max_concurrency,
+        )
+        
+        return serializer.dumps(result)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in batch_operations: {e}")
+        return serializer.dumps({
             "error": f"Unexpected error: {e}"
-        }, indent=2)
+        })
 
 
 # Resources for model information and examples
@@ -452,7 +1008,7 @@ def get_common_models() -> str:
         },
     }
     
-    return json.dumps(common_models, indent=2)
+    return serializer.dumps(common_models)
 
 
 @app.resource("odoo://examples/domains")
@@ -486,7 +1042,61 @@ def get_domain_examples() -> str:
         },
     }
     
-    return json.dumps(examples, indent=2)
+    return serializer.dumps(examples)
+
+
+@app.resource("odoo://profiles")
+def get_profiles() -> str:
+    """
+    Get the Odoo connection profiles the tools' profile argument accepts.
+    
+    Returns:
+        JSON string with each profile's URL, database and username
+    """
+    return serializer.dumps(clients.describe())
+
+
+@app.resource("odoo://profiles/{profile}/metrics")
+async def get_profile_metrics(profile: str) -> str:
+    """
+    Get the call metrics of one connection profile's Odoo client.
+    
+    Args:
+        profile: Profile name
+    
+    Returns:
+        JSON string with the metrics
+    """
+    client = await get_odoo_client(profile)
+    return serializer.dumps(client.get_metrics())
+
+
+@app.resource("odoo://metrics")
+async def get_metrics() -> str:
+    """
+    Get call counts, errors, retries, payload sizes and latency percentiles
+    per Odoo model and method, slowest first, with pool and cache statistics.
+    
+    Covers the default profile; see odoo://profiles/{profile}/metrics for
+    the others.
+    
+    Returns:
+        JSON string with the metrics
+    """
+    client = await get_odoo_client()
+    return serializer.dumps(client.get_metrics())
+
+
+@app.resource("odoo://metrics/prometheus", mime_type="text/plain")
+async def get_metrics_prometheus() -> str:
+    """
+    Get the per model and method call metrics of every active connection
+    profile in Prometheus text format, labelled by profile.
+    
+    Returns:
+        Prometheus exposition text
+    """
+    return clients.prometheus()
 
 
 @app.prompt()
@@ -606,6 +1216,63 @@ Use the odoo_query_assistant prompt with a specific operation for detailed guida
 Requirements: {requirements}"""
 
 
+async def serve_stdio() -> None:
+    """Serve one MCP client over stdio, then close the Odoo clients."""
+    try:
+        await app.run_stdio_async()
+    finally:
+        await clients.close()
+
+
+def create_http_app() -> Starlette:
+    """
+    Create the ASGI app of the configured HTTP transport.
+    
+    Every MCP session of the process shares the same Odoo clients, which are
+    closed when the app shuts down.
+    
+    Returns:
+        Starlette app serving the streamable HTTP or SSE transport
+    """
+    if settings.server_transport == "sse":
+        http_app = app.sse_app()
+    else:
+        http_app = app.streamable_http_app()
+    
+    session_lifespan = http_app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(starlette_app: Starlette) -> AsyncIterator[None]:
+        async with session_lifespan(starlette_app):
+            try:
+                yield
+            finally:
+                await clients.close()
+    
+    http_app.router.lifespan_context = lifespan
+    return http_app
+
+
+def serve_http() -> None:
+    """Serve MCP clients over HTTP with uvicorn, in one or more workers."""
+    import uvicorn
+    
+    workers = max(1, settings.server_workers)
+    logger.info(
+        f"Serving MCP over {settings.server_transport} on "
+        f"http://{settings.server_host}:{settings.server_port} with {workers} worker(s)"
+    )
+    uvicorn.run(
+        # Each worker process imports the module and builds its own app
+        "odoo_mcp.server:create_http_app" if workers > 1 else create_http_app(),
+        factory=workers > 1,
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=workers,
+        log_level=settings.log_level.lower(),
+    )
+
+
 def main() -> None:
     """Main entry point for the MCP server."""
     import sys
@@ -627,8 +1294,17 @@ def main() -> None:
         print("\nOr create a .env file with these settings.")
         sys.exit(1)
     
+    # An SSE stream and the messages posted for it must reach the same process
+    if settings.server_transport == "sse" and settings.server_workers > 1:
+        print("Error: the sse transport supports a single worker (SERVER_WORKERS=1).")
+        print("Use SERVER_TRANSPORT=streamable-http to run several workers.")
+        sys.exit(1)
+    
     # Run the server
-    app.run()
+    if settings.server_transport == "stdio":
+        anyio.run(serve_stdio)
+    else:
+        serve_http()
 
 
 if __name__ == "__main__":
@@ -5,8 +5,11 @@ This module contains individual tool functions that can be used by the MCP serve
 to perform various Odoo operations.
 """
 
+import asyncio
+import inspect
 import json
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
 from .client import OdooClient, OdooError
@@ -14,6 +17,46 @@ from .client import OdooClient, OdooError
 
 logger = logging.getLogger(__name__)
 
+RECORD_FORMATS = ("records", "columnar", "rows")
+
+
+def format_records(
+    records: List[Dict[str, Any]],
+    format: str = "records",
+) -> Dict[str, Any]:
+    """
+    Shape search results for a response, naming each field only once.
+    
+    Args:
+        records: Records as returned by the client
+        format: 'records' (list of objects), 'columnar' (one value array per
+            field) or 'rows' (field names, then one value list per record)
+        
+    Returns:
+        Dictionary with "records", or "fields" plus "columns" or "rows"
+    """
+    if format not in RECORD_FORMATS:
+        raise ValueError(
+            f"Unknown format '{format}', expected one of: {', '.join(RECORD_FORMATS)}"
+        )
+    if format == "records":
+        return {"records": records}
+    
+    # Odoo returns the same keys for every record of a result
+    fields = list(records[0]) if records else []
+    if format == "columnar":
+        return {
+            "fields": fields,
+            "columns": {
+                field: [record.get(field) for record in records]
+                for field in fields
+            },
+        }
+    return {
+        "fields": fields,
+        "rows": [[record.get(field) for field in fields] for record in records],
+    }
+
 
 async def search_records_tool(
     client: OdooClient,
@@ -23,6 +66,7 @@ async def search_records_tool(
     limit: Optional[int] = None,
     offset: int = 0,
     order: Optional[str] = None,
+    format: str = "records",
 ) -> Dict[str, Any]:
     """
     Search for records in an Odoo model.
@@ -35,6 +79,7 @@ async def search_records_tool(
         limit: Maximum number of records
         offset: Records to skip
         order: Sort order
+        format: Result shape: 'records', 'columnar' or 'rows'
         
     Returns:
         Dictionary with search results
@@ -53,9 +98,15 @@ async def search_records_tool(
             "success": True,
             "model": model,
             "count": len(records),
-            "records": records,
+            **format_records(records, format),
         }
         
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "ValidationError",
+        }
     except OdooError as e:
         logger.error(f"Odoo error in search_records_tool: {e}")
         return {
@@ -72,6 +123,188 @@ async def search_records_tool(
         }
 
 
+async def count_records_tool(
+    client: OdooClient,
+    model: str,
+    domain: Optional[List[Any]] = None,
+    domains: Optional[Dict[str, List[Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Count records in an Odoo model, for one domain or several.
+    
+    Args:
+        client: Authenticated Odoo client
+        model: Odoo model name
+        domain: Search domain filters
+        domains: Several search domains by label, counted concurrently
+        
+    Returns:
+        Dictionary with the count, or counts by label
+    """
+    try:
+        if domains is not None:
+            counts = await client.count_records_many(model, domains)
+            return {
+                "success": True,
+                "model": model,
+                "counts": counts,
+            }
+        
+        count = await client.count_records(model, domain)
+        
+        return {
+            "success": True,
+            "model": model,
+            "count": count,
+        }
+        
+    except OdooError as e:
+        logger.error(f"Odoo error in count_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "OdooError",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in count_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "UnexpectedError",
+        }
+
+
+async def aggregate_records_tool(
+    client: OdooClient,
+    model: str,
+    groupby: List[str],
+    aggregates: Optional[List[str]] = None,
+    domain: Optional[List[Any]] = None,
+    lazy: bool = True,
+    orderby: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """
+    Aggregate records in an Odoo model with read_group.
+    
+    Args:
+        client: Authenticated Odoo client
+        model: Odoo model name
+        groupby: Fields to group by, optionally with a date granularity
+        aggregates: Aggregated fields with their functions
+        domain: Search domain filters
+        lazy: Group by the first groupby field only
+        orderby: Sort order of the groups
+        limit: Maximum number of groups
+        offset: Number of groups to skip
+        
+    Returns:
+        Dictionary with the groups
+    """
+    try:
+        groups = await client.read_group(
+            model,
+            groupby,
+            aggregates=aggregates,
+            domain=domain,
+            lazy=lazy,
+            orderby=orderby,
+            limit=limit,
+            offset=offset,
+        )
+        
+        return {
+            "success": True,
+            "model": model,
+            "groupby": groupby,
+            "count": len(groups),
+            "groups": groups,
+        }
+        
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "ValidationError",
+        }
+    except OdooError as e:
+        logger.error(f"Odoo error in aggregate_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "OdooError",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in aggregate_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "UnexpectedError",
+        }
+
+
+async def search_page_tool(
+    client: OdooClient,
+    model: str,
+    domain: Optional[List[Any]] = None,
+    fields: Optional[List[str]] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch one keyset page of records from an Odoo model.
+    
+    Args:
+        client: Authenticated Odoo client
+        model: Odoo model name
+        domain: Search domain filters
+        fields: Fields to retrieve
+        page_size: Records per page
+        cursor: Cursor from the previous page
+        
+    Returns:
+        Dictionary with the page of records and the next cursor
+    """
+    try:
+        page = await client.search_page(
+            model,
+            domain=domain,
+            fields=fields,
+            page_size=page_size,
+            cursor=cursor,
+        )
+        
+        return {
+            "success": True,
+            "model": model,
+            "count": len(page["records"]),
+            "records": page["records"],
+            "next_cursor": page["next_cursor"],
+        }
+        
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "ValidationError",
+        }
+    except OdooError as e:
+        logger.error(f"Odoo error in search_page_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "OdooError",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in search_page_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "UnexpectedError",
+        }
+
+
 async def create_record_tool(
     client: OdooClient,
     model: str,
@@ -114,6 +347,58 @@ async def create_record_tool(
         }
 
 
+async def create_records_tool(
+    client: OdooClient,
+    model: str,
+    values_list: List[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+    concurrency: int = 1,
+) -> Dict[str, Any]:
+    """
+    Create many records in an Odoo model.
+    
+    Args:
+        client: Authenticated Odoo client
+        model: Odoo model name
+        values_list: Field values for each new record
+        chunk_size: Records per create call
+        concurrency: Number of chunks sent in parallel
+        
+    Returns:
+        Dictionary with created record IDs and per-chunk errors
+    """
+    try:
+        result = await client.create_records(
+            model,
+            values_list,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        
+        return {
+            "success": not result["errors"],
+            "model": model,
+            "count": len(result["ids"]),
+            "record_ids": result["ids"],
+            "errors": result["errors"],
+        }
+        
+    except OdooError as e:
+        logger.error(f"Odoo error in create_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "OdooError",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in create_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "UnexpectedError",
+        }
+
+
 async def update_record_tool(
     client: OdooClient,
     model: str,
@@ -158,6 +443,71 @@ async def update_record_tool(
         }
 
 
+async def update_records_tool(
+    client: OdooClient,
+    model: str,
+    ids: Optional[List[int]] = None,
+    values: Optional[Dict[str, Any]] = None,
+    updates: Optional[List[Any]] = None,
+    chunk_size: Optional[int] = None,
+    concurrency: int = 1,
+) -> Dict[str, Any]:
+    """
+    Update many records in an Odoo model.
+    
+    Args:
+        client: Authenticated Odoo client
+        model: Odoo model name
+        ids: IDs of records to update with values
+        values: Field values written to every id in ids
+        updates: List of (id, values) pairs
+        chunk_size: IDs per write call
+        concurrency: Number of write calls sent in parallel
+        
+    Returns:
+        Dictionary with updated record IDs and per-call errors
+    """
+    try:
+        result = await client.update_records(
+            model,
+            ids=ids,
+            values=values,
+            updates=updates,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        
+        return {
+            "success": not result["errors"],
+            "model": model,
+            "count": len(result["updated_ids"]),
+            "record_ids": result["updated_ids"],
+            "calls": result["calls"],
+            "errors": result["errors"],
+        }
+        
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "ValidationError",
+        }
+    except OdooError as e:
+        logger.error(f"Odoo error in update_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "OdooError",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in update_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "UnexpectedError",
+        }
+
+
 async def delete_record_tool(
     client: OdooClient,
     model: str,
@@ -199,9 +549,76 @@ async def delete_record_tool(
         }
 
 
+async def delete_records_tool(
+    client: OdooClient,
+    model: str,
+    ids: Optional[List[int]] = None,
+    domain: Optional[List[Any]] = None,
+    dry_run: bool = False,
+    chunk_size: Optional[int] = None,
+    concurrency: int = 1,
+    allow_all: bool = False,
+) -> Dict[str, Any]:
+    """
+    Delete many records from an Odoo model, by ids or by domain.
+    
+    Args:
+        client: Authenticated Odoo client
+        model: Odoo model name
+        ids: IDs of records to delete
+        domain: Search domain selecting records to delete
+        dry_run: Only count the records that would be deleted
+        chunk_size: IDs per unlink call
+        concurrency: Number of unlink calls sent in parallel
+        allow_all: Confirm that an empty domain may delete every record
+        
+    Returns:
+        Dictionary with the matching count, deleted IDs and per-call errors
+    """
+    try:
+        result = await client.delete_records(
+            model,
+            ids=ids,
+            domain=domain,
+            dry_run=dry_run,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            allow_all=allow_all,
+        )
+        
+        return {
+            "success": not result.get("errors"),
+            "model": model,
+            **result,
+        }
+        
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "ValidationError",
+        }
+    except OdooError as e:
+        logger.error(f"Odoo error in delete_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "OdooError",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in delete_records_tool: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "UnexpectedError",
+        }
+
+
 async def get_model_fields_tool(
     client: OdooClient,
     model: str,
+    attributes: Optional[List[str]] = None,
+    lang: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Get field definitions for an Odoo model.
@@ -209,12 +626,14 @@ async def get_model_fields_tool(
     Args:
         client: Authenticated Odoo client
         model: Odoo model name
+        attributes: Field attributes to return
+        lang: Language code for translated labels
         
     Returns:
         Dictionary with field definitions
     """
     try:
-        fields = await client.get_model_fields(model)
+        fields = await client.get_model_fields(model, attributes=attributes, lang=lang)
         
         return {
             "success": True,
@@ -281,4 +700,169 @@ async def call_method_tool(
             "success": False,
             "error": str(e),
             "error_type": "UnexpectedError",
-        }
\ No newline at end of file
+        }
+
+# Operation type -> (tool function, accepted parameters)
+BATCH_OPERATIONS = {
+    "search": (
+        search_records_tool,
+        ("model", "domain", "fields", "limit", "offset", "order", "format"),
+    ),
+    "create": (create_record_tool, ("model", "values")),
+    "update": (update_record_tool, ("model", "record_id", "values")),
+    "delete": (delete_record_tool, ("model", "record_id")),
+    "fields": (get_model_fields_tool, ("model", "attributes", "lang")),
+    "call_method": (call_method_tool, ("model", "method", "args", "kwargs")),
+}
+
+
+def _required_parameters(tool: Any) -> List[str]:
+    """Names of the parameters a batch operation must provide for a tool."""
+    return [
+        name
+        for name, parameter in inspect.signature(tool).parameters.items()
+        if name != "client" and parameter.default is inspect.Parameter.empty
+    ]
+
+
+def _validate_batch(operations: List[Dict[str, Any]]) -> List[str]:
+    """
+    Validate batch operations and return their ids.
+    
+    Operations without an ``id`` are identified by their index. Raises
+    ValueError for unknown types, missing required parameters, unknown or
+    duplicate ids, and dependency cycles.
+    """
+    ids = [str(op.get("id", index)) for index, op in enumerate(operations)]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Operation ids must be unique")
+    
+    dependencies = {}
+    for op_id, op in zip(ids, operations):
+        if op.get("type") not in BATCH_OPERATIONS:
+            raise ValueError(
+                f"Operation '{op_id}' has unknown type '{op.get('type')}', "
+                f"expected one of {sorted(BATCH_OPERATIONS)}"
+            )
+        missing = [
+            name
+            for name in _required_parameters(BATCH_OPERATIONS[op["type"]][0])
+            if name not in op
+        ]
+        if missing:
+            raise ValueError(
+                f"Operation '{op_id}' ({op['type']}) is missing required parameters {missing}"
+            )
+        depends_on = [str(dep) for dep in op.get("depends_on", [])]
+        unknown = set(depends_on) - set(ids)
+        if unknown:
+            raise ValueError(
+                f"Operation '{op_id}' depends on unknown ids {sorted(unknown)}"
+            )
+        dependencies[op_id] = depends_on
+    
+    # Reject cycles with a depth-first search
+    state: Dict[str, int] = {}
+    
+    def visit(op_id: str) -> None:
+        if state.get(op_id) == 1:
+            raise ValueError(f"Dependency cycle involving operation '{op_id}'")
+        if state.get(op_id) == 2:
+            return
+        state[op_id] = 1
+        for dep in dependencies[op_id]:
+            visit(dep)
+        state[op_id] = 2
+    
+    for op_id in ids:
+        visit(op_id)
+    
+    return ids
+
+
+async def batch_operations_tool(
+    client: OdooClient,
+    operations: List[Dict[str, Any]],
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """
+    Run several Odoo operations concurrently.
+    
+    Each operation is a dictionary with a ``type`` (search, create, update,
+    delete, fields or call_method), the parameters of the matching tool, an
+    optional ``id`` and an optional ``depends_on`` list of operation ids.
+    Independent operations run concurrently, up to ``max_concurrency`` at a
+    time; an operation starts only after all its dependencies succeeded and
+    is skipped if any of them failed.
+    
+    Args:
+        client: Authenticated Odoo client
+        operations: Operations to run
+        max_concurrency: Maximum number of operations in flight
+        
+    Returns:
+        Dictionary with per-operation results and timings, in input order
+    """
+    try:
+        ids = _validate_batch(operations)
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "error_type": "ValidationError",
+        }
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+    batch_start = time.perf_counter()
+    
+    async def run(op_id: str, op: Dict[str, Any]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"id": op_id, "type": op["type"]}
+        depends_on = [str(dep) for dep in op.get("depends_on", [])]
+        if depends_on:
+            outcomes = await asyncio.gather(*(tasks[dep] for dep in depends_on))
+            failed = [
+                dep
+                for dep, outcome in zip(depends_on, outcomes)
+                if not outcome["success"]
+            ]
+            if failed:
+                result.update({
+                    "success": False,
+                    "skipped": True,
+                    "error": f"Dependencies failed: {failed}",
+                })
+                return result
+        
+        tool, parameters = BATCH_OPERATIONS[op["type"]]
+        kwargs = {name: op[name] for name in parameters if name in op}
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                outcome = await tool(client, **kwargs)
+            except Exception as e:
+                # Reported on this operation; the other operations carry on
+                logger.error(f"Batch operation '{op_id}' failed: {e}")
+                outcome = {"error": str(e), "error_type": type(e).__name__}
+            end = time.perf_counter()
+        
+        outcome.pop("success", None)
+        result.update({
+            "success": "error" not in outcome,
+            **outcome,
+            "started_ms": round((start - batch_start) * 1000, 3),
+            "duration_ms": round((end - start) * 1000, 3),
+        })
+        return result
+    
+    for op_id, op in zip(ids, operations):
+        tasks[op_id] = asyncio.ensure_future(run(op_id, op))
+    
+    results = await asyncio.gather(*(tasks[op_id] for op_id in ids))
+    
+    return {
+        "success": all(result["success"] for result in results),
+        "count": len(results),
+        "duration_ms": round((time.perf_counter() - batch_start) * 1000, 3),
+        "results": results,
+    }
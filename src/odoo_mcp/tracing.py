@@ -0,0 +1,276 @@
+"""
+Span-style tracing hooks for Odoo calls and tool invocations.
+
+The client opens an ``odoo.execute_kw`` span around every Odoo call, with an
+``odoo.rpc`` child span per attempt; tool handlers run in an ``mcp.tool``
+span and response serialization in a ``serialize`` span. Transports add
+details to the current span with ``annotate`` (e.g. executor queueing time).
+
+Spans are handed to hooks registered on the global ``Tracer``:
+``JsonlTraceWriter`` appends finished spans to a file, and
+``OpenTelemetryHook`` forwards them to OpenTelemetry when it is installed.
+Without hooks, starting and ending a span does nothing.
+"""
+
+import functools
+import itertools
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_span_ids = itertools.count(1)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("odoo_mcp_span", default=None)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class Span:
+    """One timed operation with its attributes and outcome."""
+
+    __slots__ = (
+        "name", "span_id", "parent", "attributes", "start_time",
+        "start", "end", "error", "handle", "_token",
+    )
+
+    def __init__(self, name: str, attributes: Dict[str, Any], parent: Optional["Span"]):
+        self.name = name
+        self.span_id = next(_span_ids)
+        self.parent = parent
+        self.attributes = attributes
+        self.start_time = time.time()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        # Hook specific state, e.g. the OpenTelemetry span
+        self.handle: Any = None
+        self._token: Optional[Token] = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds the span lasted (so far, while it is open)."""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @property
+    def outcome(self) -> str:
+        """'error' if the operation raised, otherwise 'ok'."""
+        return "error" if self.error is not None else "ok"
+
+
+class TraceHook:
+    """Receives spans as they start and end. Subclasses override either."""
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+
+class Tracer:
+    """Creates spans and passes them to the registered hooks."""
+
+    def __init__(self) -> None:
+        self.hooks: List[TraceHook] = []
+
+    def add_hook(self, hook: TraceHook) -> None:
+        """
+        Register a hook.
+
+        Args:
+            hook: Hook receiving every span from now on
+        """
+        self.hooks.append(hook)
+
+    def start(self, name: str, **attributes: Any) -> Optional[Span]:
+        """
+        Start a span as a child of the current one.
+
+        Args:
+            name: Span name
+            **attributes: Span attributes
+
+        Returns:
+            The span, or None when no hook is registered
+        """
+        if not self.hooks:
+            return None
+        span = Span(name, attributes, _current_span.get())
+        span._token = _current_span.set(span)
+        for hook in self.hooks:
+            try:
+                hook.on_start(span)
+            except Exception as e:
+                logger.debug(f"Trace hook {hook!r} failed on start: {e}")
+        return span
+
+    def end(
+        self,
+        span: Optional[Span],
+        error: Optional[BaseException] = None,
+        **attributes: Any,
+    ) -> None:
+        """
+        End a span started by ``start``.
+
+        Args:
+            span: Span to end (None is ignored)
+            error: Exception the operation raised, if any
+            **attributes: Attributes known once the operation finished
+        """
+        if span is None:
+            return
+        span.end = time.perf_counter()
+        span.error = error
+        span.attributes.update(attributes)
+        if span._token is not None:
+            try:
+                _current_span.reset(span._token)
+            except ValueError:
+                # Ended from another context; the span is no longer current there
+                pass
+        for hook in self.hooks:
+            try:
+                hook.on_end(span)
+            except Exception as e:
+                logger.debug(f"Trace hook {hook!r} failed on end: {e}")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer."""
+    return _tracer
+
+
+def annotate(**attributes: Any) -> None:
+    """
+    Add attributes to the current span, if there is one.
+
+    Args:
+        **attributes: Attributes to set
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def traced_tool(func: F) -> F:
+    """Run an async tool handler in an ``mcp.tool`` span."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        span = _tracer.start("mcp.tool", tool=func.__name__)
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            _tracer.end(span, error=e)
+            raise
+        if isinstance(result, str):
+            _tracer.end(span, response_bytes=len(result))
+        else:
+            _tracer.end(span)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+class JsonlTraceWriter(TraceHook):
+    """Appends every finished span as one JSON line to a file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the writer.
+
+        Args:
+            path: File the spans are appended to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps({
+            "name": span.name,
+            "span_id": span.span_id,
+            "parent_id": span.parent.span_id if span.parent else None,
+            "start": span.start_time,
+            "duration_ms": round(span.duration * 1000, 3),
+            "outcome": span.outcome,
+            "error": str(span.error) if span.error is not None else None,
+            "attributes": span.attributes,
+        }, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetryHook(TraceHook):
+    """Mirrors spans as OpenTelemetry spans (requires opentelemetry-api)."""
+
+    def __init__(self) -> None:
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("odoo_mcp")
+
+    def on_start(self, span: Span) -> None:
+        context = None
+        if span.parent is not None and span.parent.handle is not None:
+            context = self._trace.set_span_in_context(span.parent.handle)
+        span.handle = self._tracer.start_span(span.name, context=context)
+
+    def on_end(self, span: Span) -> None:
+        otel_span = span.handle
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if value is not None:
+                if not isinstance(value, (str, bool, int, float)):
+                    value = str(value)
+                otel_span.set_attribute(f"odoo_mcp.{key}", value)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(span.error))
+            )
+        otel_span.end()
+
+
+def configure_tracing(exporter: str, trace_file: str) -> Optional[TraceHook]:
+    """
+    Register the hook selected by the settings on the global tracer.
+
+    Args:
+        exporter: 'none', 'jsonl', 'opentelemetry' or 'auto' (OpenTelemetry
+            when installed, the JSONL writer otherwise)
+        trace_file: File written by the JSONL writer
+
+    Returns:
+        The registered hook, or None
+    """
+    hook: Optional[TraceHook] = None
+    if exporter in ("opentelemetry", "auto"):
+        try:
+            hook = OpenTelemetryHook()
+        except ImportError:
+            if exporter == "opentelemetry":
+                raise ImportError(
+                    "The opentelemetry trace exporter requires the opentelemetry-api package"
+                )
+    if hook is None and exporter in ("jsonl", "auto"):
+        hook = JsonlTraceWriter(trace_file)
+    if hook is not None:
+        _tracer.add_hook(hook)
+        logger.info(f"Tracing Odoo calls and tools with {type(hook).__name__}")
+    return hook
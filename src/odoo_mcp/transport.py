@@ -0,0 +1,962 @@
+"""
+Pooled XML-RPC transports for the Odoo client.
+
+``xmlrpc.client.ServerProxy`` is not thread-safe, so every executor thread
+checks a proxy out of the pool for the duration of one call and returns it
+afterwards. Each proxy owns a keep-alive transport, which lets consecutive
+calls reuse the same TCP/TLS connection instead of reconnecting.
+
+``AsyncXmlRpcTransport`` is the executor-free alternative: it speaks
+HTTP/1.1 directly over asyncio streams. ``JsonRpcTransport`` uses the same
+streams for Odoo's ``/jsonrpc`` endpoint.
+
+``CallExecutor`` is the thread pool the threaded transport runs its calls
+on. The client owns one, sized to what Odoo should receive at once, instead
+of sharing the event loop's default executor with the rest of the process.
+
+All transports share one interface: ``call(endpoint, method, *args)``,
+``close()`` and ``stats()``.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import json
+import logging
+import ssl
+import threading
+import time
+import urllib.parse
+import xmlrpc.client
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .metrics import record_payload
+from .tracing import annotate
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class _StaleConnectionError(ConnectionError):
+    """Raised when a connection fails before any response byte is read."""
+
+
+class _KeepAliveMixin:
+    """
+    Apply a socket timeout to the persistent connection of a transport, and
+    remember the body sizes of the last request.
+    """
+
+    timeout: Optional[float] = None
+    bytes_sent = 0
+    bytes_received = 0
+
+    def send_content(self, connection: Any, request_body: bytes) -> None:
+        self.bytes_sent = len(request_body)
+        super().send_content(connection, request_body)  # type: ignore[misc]
+
+    def parse_response(self, response: Any) -> Any:
+        self.bytes_received = int(response.getheader("Content-Length") or 0)
+        return super().parse_response(response)  # type: ignore[misc]
+
+    def make_connection(self, host: Any) -> Any:
+        connection = super().make_connection(host)  # type: ignore[misc]
+        if self.timeout is not None:
+            connection.timeout = self.timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(self.timeout)
+        return connection
+
+
+class KeepAliveTransport(_KeepAliveMixin, xmlrpc.client.Transport):
+    """HTTP transport that keeps its connection open between requests."""
+
+    def __init__(self, timeout: Optional[float] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+
+
+class KeepAliveSafeTransport(_KeepAliveMixin, xmlrpc.client.SafeTransport):
+    """HTTPS transport that keeps its connection open between requests."""
+
+    def __init__(self, timeout: Optional[float] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+
+
+class _PooledProxy:
+    """A server proxy together with its transport and last use time."""
+
+    __slots__ = ("proxy", "transport", "last_used")
+
+    def __init__(
+        self,
+        proxy: xmlrpc.client.ServerProxy,
+        transport: xmlrpc.client.Transport,
+    ):
+        self.proxy = proxy
+        self.transport = transport
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.transport.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive XML-RPC proxies.
+
+    Proxies are kept per endpoint (e.g. ``common`` and ``object``), up to
+    ``size`` proxies each. Connections idle for longer than ``idle_timeout``
+    seconds are closed by a background reaper thread, and whenever the pool
+    is used.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = 8,
+        timeout: Optional[float] = None,
+        idle_timeout: float = 60.0,
+        checkout_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the connection pool.
+
+        Args:
+            url: Odoo server URL
+            size: Maximum number of proxies per endpoint
+            timeout: Socket timeout in seconds for each request
+            idle_timeout: Seconds after which an idle connection is closed
+            checkout_timeout: Seconds to wait for a free proxy (default: timeout)
+        """
+        self.url = url.rstrip("/")
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = (
+            checkout_timeout if checkout_timeout is not None else timeout
+        )
+
+        self._lock = threading.Condition()
+        self._idle: Dict[str, Deque[_PooledProxy]] = {}
+        self._in_use: Dict[str, int] = {}
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+        self._stop_reaper = threading.Event()
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "reaped": 0,
+            "discarded": 0,
+        }
+
+    def _create(self, endpoint: str) -> _PooledProxy:
+        """Create a new proxy for an endpoint."""
+        endpoint_url = f"{self.url}/xmlrpc/2/{endpoint}"
+        transport: xmlrpc.client.Transport
+        if endpoint_url.startswith("https:"):
+            transport = KeepAliveSafeTransport(timeout=self.timeout)
+        else:
+            transport = KeepAliveTransport(timeout=self.timeout)
+        proxy = xmlrpc.client.ServerProxy(endpoint_url, transport=transport)
+        return _PooledProxy(proxy, transport)
+
+    def _reap_locked(self, now: float) -> int:
+        """Close idle connections past the idle timeout. Caller holds the lock."""
+        reaped = 0
+        for idle in self._idle.values():
+            while idle and now - idle[0].last_used > self.idle_timeout:
+                idle.popleft().close()
+                reaped += 1
+        self._stats["reaped"] += reaped
+        return reaped
+
+    def _start_reaper_locked(self) -> None:
+        """Start the reaper thread if not running. Caller holds the lock."""
+        if self._reaper is None:
+            self._reaper = threading.Thread(
+                target=self._reap_forever,
+                name="odoo-pool-reaper",
+                daemon=True,
+            )
+            self._reaper.start()
+
+    def _reap_forever(self) -> None:
+        """Periodically close idle connections until the pool is closed."""
+        interval = max(self.idle_timeout / 2, 1.0)
+        while not self._stop_reaper.wait(interval):
+            self.reap_idle()
+
+    def checkout(self, endpoint: str) -> _PooledProxy:
+        """
+        Take a proxy for an endpoint out of the pool.
+
+        Args:
+            endpoint: XML-RPC endpoint name (``common`` or ``object``)
+
+        Returns:
+            Pooled proxy, which must be handed back with ``checkin``
+
+        Raises:
+            PoolExhaustedError: If no proxy is freed within the checkout timeout
+        """
+        deadline = None
+        if self.checkout_timeout is not None:
+            deadline = time.monotonic() + self.checkout_timeout
+
+        with self._lock:
+            if self._closed:
+                raise PoolExhaustedError("Connection pool is closed")
+
+            self._start_reaper_locked()
+            idle = self._idle.setdefault(endpoint, deque())
+            self._reap_locked(time.monotonic())
+
+            waited = False
+            while not idle and self._in_use.get(endpoint, 0) >= self.size:
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolExhaustedError(
+                        f"No connection to '{endpoint}' available within "
+                        f"{self.checkout_timeout} seconds"
+                    )
+                self._lock.wait(remaining)
+
+            self._stats["checkouts"] += 1
+            self._in_use[endpoint] = self._in_use.get(endpoint, 0) + 1
+            if idle:
+                self._stats["reused"] += 1
+                return idle.pop()
+
+        try:
+            pooled = self._create(endpoint)
+        except Exception:
+            with self._lock:
+                self._in_use[endpoint] -= 1
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._stats["created"] += 1
+        return pooled
+
+    def checkin(
+        self,
+        endpoint: str,
+        pooled: _PooledProxy,
+        discard: bool = False,
+    ) -> None:
+        """
+        Return a proxy to the pool.
+
+        Args:
+            endpoint: Endpoint the proxy was checked out for
+            pooled: The pooled proxy
+            discard: Close the connection instead of keeping it for reuse
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._in_use[endpoint] -= 1
+            if discard or self._closed:
+                self._stats["discarded"] += 1
+                pooled.close()
+            else:
+                pooled.last_used = now
+                self._idle.setdefault(endpoint, deque()).append(pooled)
+            self._reap_locked(now)
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self, endpoint: str) -> Iterator[xmlrpc.client.ServerProxy]:
+        """
+        Check out a proxy for the duration of a ``with`` block.
+
+        Connections that fail with anything other than an XML-RPC fault are
+        discarded, since their HTTP state is unknown.
+        """
+        pooled = self.checkout(endpoint)
+        discard = False
+        try:
+            yield pooled.proxy
+        except xmlrpc.client.Fault:
+            raise
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self.checkin(endpoint, pooled, discard=discard)
+
+    def reap_idle(self) -> int:
+        """Close idle connections past the idle timeout and return how many."""
+        with self._lock:
+            return self._reap_locked(time.monotonic())
+
+    def close(self) -> None:
+        """Close all idle connections and stop handing out new ones."""
+        self._stop_reaper.set()
+        with self._lock:
+            self._closed = True
+            for idle in self._idle.values():
+                while idle:
+                    idle.pop().close()
+            self._lock.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with lifetime counters and current per-endpoint usage
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                **self._stats,
+                "endpoints": {
+                    endpoint: {
+                        "in_use": self._in_use.get(endpoint, 0),
+                        "idle": len(idle),
+                    }
+                    for endpoint, idle in self._idle.items()
+                },
+            }
+
+
+class CallExecutor(ThreadPoolExecutor):
+    """
+    Thread pool for blocking Odoo calls that reports its queue.
+
+    Calls waiting for a free thread are counted as queued, calls on a thread
+    as running, and the time each call waited is recorded. With
+    ``max_queue`` set, submitting a call while that many already wait raises
+    ``PoolExhaustedError`` instead of growing the backlog.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_queue: int = 0,
+        thread_name_prefix: str = "odoo-rpc",
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of threads
+            max_queue: Maximum number of waiting calls (0: unbounded)
+            thread_name_prefix: Name prefix of the threads
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "cancelled": 0,
+            "peak_queued": 0,
+            "peak_running": 0,
+        }
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            if self.max_queue and self._queued >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise PoolExhaustedError(
+                    f"{self._queued} Odoo calls are already waiting for a thread"
+                )
+            self._queued += 1
+            self._stats["submitted"] += 1
+            self._stats["peak_queued"] = max(self._stats["peak_queued"], self._queued)
+        try:
+            future = super().submit(self._run, time.perf_counter(), fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+        # A call cancelled while queued (its caller was cancelled, or the
+        # executor shut down) never reaches _run
+        future.add_done_callback(self._cancelled)
+        return future
+
+    def _cancelled(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+                self._stats["cancelled"] += 1
+
+    def _run(
+        self,
+        submitted: float,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Run a submitted call, moving it from queued to running."""
+        waited = time.perf_counter() - submitted
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._stats["peak_running"] = max(self._stats["peak_running"], self._running)
+            self._wait_total += waited
+            if waited > self._wait_max:
+                self._wait_max = waited
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._stats["completed"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary with the current queue, lifetime counters and the
+            time calls waited for a thread (milliseconds)
+        """
+        with self._lock:
+            started = self._stats["submitted"] - self._queued - self._stats["cancelled"]
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                **self._stats,
+                "wait_ms": {
+                    "total": round(self._wait_total * 1000, 3),
+                    "mean": round(self._wait_total / started * 1000, 3) if started else 0.0,
+                    "max": round(self._wait_max * 1000, 3),
+                },
+            }
+
+
+class ThreadedXmlRpcTransport:
+    """
+    XML-RPC through pooled ``ServerProxy`` objects on executor threads.
+
+    Each call checks a proxy out of a ``ConnectionPool`` on the executor
+    thread running it, so no proxy is ever used by two threads at once.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = 8,
+        timeout: Optional[float] = None,
+        idle_timeout: float = 60.0,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            url: Odoo server URL
+            size: Maximum number of pooled proxies per endpoint
+            timeout: Socket timeout in seconds for each request
+            idle_timeout: Seconds after which an idle connection is closed
+            executor: Executor running the blocking calls (default: loop's)
+        """
+        self.executor = executor
+        self._pool = ConnectionPool(
+            url,
+            size=size,
+            timeout=timeout,
+            idle_timeout=idle_timeout,
+        )
+
+    def _call(self, submitted: float, endpoint: str, method: str, *args: Any) -> Any:
+        """Call an XML-RPC method on a pooled proxy (blocking)."""
+        annotate(queue_ms=round((time.perf_counter() - submitted) * 1000, 3))
+        with self._pool.connection(endpoint) as proxy:
+            transport = proxy("transport")
+            transport.bytes_sent = transport.bytes_received = 0
+            try:
+                return getattr(proxy, method)(*args)
+            finally:
+                record_payload(transport.bytes_sent, transport.bytes_received)
+
+    async def call(self, endpoint: str, method: str, *args: Any) -> Any:
+        """
+        Call an XML-RPC method.
+
+        Args:
+            endpoint: XML-RPC endpoint name (``common`` or ``object``)
+            method: Remote method name
+            *args: Method arguments
+
+        Returns:
+            Method result
+
+        Raises:
+            xmlrpc.client.Fault: If the server returns a fault
+        """
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context so payload sizes and trace
+        # annotations reach it
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor,
+            context.run,
+            self._call,
+            time.perf_counter(),
+            endpoint,
+            method,
+            *args,
+        )
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get connection pool and executor statistics."""
+        stats = self._pool.stats()
+        if isinstance(self.executor, CallExecutor):
+            stats["executor"] = self.executor.stats()
+        return stats
+
+
+class _AsyncConnection:
+    """An open asyncio stream pair and its last use time."""
+
+    __slots__ = ("reader", "writer", "last_used")
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception as e:
+            logger.debug(f"Error closing async connection: {e}")
+
+
+class AsyncHTTPPool:
+    """
+    Minimal HTTP/1.1 client over asyncio streams with keep-alive pooling.
+
+    Only what the Odoo RPC endpoints need is supported: ``POST`` requests
+    answered with a ``Content-Length``, chunked or close-delimited body. At
+    most ``size`` requests are in flight at once; further requests wait.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = 8,
+        timeout: Optional[float] = None,
+        idle_timeout: float = 60.0,
+    ):
+        """
+        Initialize the asyncio HTTP pool.
+
+        Args:
+            url: Odoo server URL
+            size: Maximum number of concurrent connections
+            timeout: Seconds allowed for each request, including connecting
+            idle_timeout: Seconds after which an idle connection is closed
+        """
+        parsed = urllib.parse.urlsplit(url)
+        self.url = url.rstrip("/")
+        self.host = parsed.hostname or "localhost"
+        self.secure = parsed.scheme == "https"
+        self.port = parsed.port or (443 if self.secure else 80)
+        self.base_path = parsed.path.rstrip("/")
+        self.host_header = parsed.netloc.rpartition("@")[2]
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+
+        self._ssl = ssl.create_default_context() if self.secure else None
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._idle: Deque[_AsyncConnection] = deque()
+        self._in_use = 0
+        self._closed = False
+        self._reaper: Optional["asyncio.Task[None]"] = None
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "reaped": 0,
+            "discarded": 0,
+        }
+
+    def _reap(self, now: float) -> int:
+        """Close idle connections past the idle timeout."""
+        reaped = 0
+        while self._idle and now - self._idle[0].last_used > self.idle_timeout:
+            self._idle.popleft().close()
+            reaped += 1
+        self._stats["reaped"] += reaped
+        return reaped
+
+    def _start_reaper(self) -> None:
+        """Start the background task closing idle connections, if not running."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.get_running_loop().create_task(self._reap_forever())
+
+    async def _reap_forever(self) -> None:
+        """Periodically close idle connections past the idle timeout."""
+        interval = max(self.idle_timeout / 2, 1.0)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            self._reap(time.monotonic())
+
+    async def _acquire(self) -> Tuple[_AsyncConnection, bool]:
+        """Get an idle connection or open a new one."""
+        self._reap(time.monotonic())
+        self._stats["checkouts"] += 1
+        self._in_use += 1
+        if self._idle:
+            self._stats["reused"] += 1
+            return self._idle.pop(), True
+
+        try:
+            reader, writer = await asyncio.open_connection(
+                self.host,
+                self.port,
+                ssl=self._ssl,
+                server_hostname=self.host if self.secure else None,
+            )
+        except BaseException:
+            self._in_use -= 1
+            raise
+        self._stats["created"] += 1
+        return _AsyncConnection(reader, writer), False
+
+    def _release(
+        self,
+        connection: _AsyncConnection,
+        discard: bool = False,
+    ) -> None:
+        """Return a connection to the idle list or close it."""
+        self._in_use -= 1
+        now = time.monotonic()
+        if discard or self._closed:
+            self._stats["discarded"] += 1
+            connection.close()
+        else:
+            connection.last_used = now
+            self._idle.append(connection)
+        self._reap(now)
+
+    async def post(self, path: str, body: bytes, content_type: str) -> bytes:
+        """
+        Send a ``POST`` request and return the response body.
+
+        Args:
+            path: Request path below the server URL
+            body: Encoded request body
+            content_type: Request content type
+
+        Returns:
+            Raw response body
+
+        Raises:
+            ConnectionError: If the pool is closed
+            xmlrpc.client.ProtocolError: If the server answers with a non-200 status
+        """
+        if self._closed:
+            raise ConnectionError("Async HTTP pool is closed")
+
+        if self._semaphore.locked():
+            self._stats["waits"] += 1
+
+        self._start_reaper()
+        async with self._semaphore:
+            payload = await asyncio.wait_for(
+                self._exchange(path, body, content_type),
+                self.timeout,
+            )
+        record_payload(len(body), len(payload))
+        return payload
+
+    async def _exchange(self, path: str, body: bytes, content_type: str) -> bytes:
+        """Acquire a connection, send one request and return the body."""
+        # A reused keep-alive connection may have been closed by the server
+        # in the meantime. The request is replayed on a fresh connection only
+        # when the failure happened before any response byte arrived, as the
+        # standard library transport does.
+        for attempt in (0, 1):
+            connection, reused = await self._acquire()
+            try:
+                status, reason, keep_alive, payload = await self._request(
+                    connection, path, body, content_type
+                )
+            except _StaleConnectionError:
+                self._release(connection, discard=True)
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                self._release(connection, discard=True)
+                raise
+
+            self._release(connection, discard=not keep_alive)
+            if status != 200:
+                # Same error as the standard library transport, so callers
+                # can tell e.g. a 503 from a lost connection
+                raise xmlrpc.client.ProtocolError(
+                    f"{self.url}{path}", status, reason, {}
+                )
+            return payload
+
+        raise AssertionError("unreachable")
+
+    async def _request(
+        self,
+        connection: _AsyncConnection,
+        path: str,
+        body: bytes,
+        content_type: str,
+    ) -> Tuple[int, str, bool, bytes]:
+        """Write one request and read its response."""
+        head = (
+            f"POST {self.base_path}{path} HTTP/1.1\r\n"
+            f"Host: {self.host_header}\r\n"
+            f"User-Agent: odoo-mcp\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: keep-alive\r\n"
+            f"\r\n"
+        ).encode("latin-1")
+        reader = connection.reader
+        try:
+            connection.writer.write(head + body)
+            await connection.writer.drain()
+            status_line = await reader.readline()
+        except ConnectionError as e:
+            raise _StaleConnectionError(f"Connection lost before response: {e}")
+        if not status_line:
+            raise _StaleConnectionError("Connection closed by server before response")
+        version, status, reason = (
+            status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""]
+        )[:3]
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                chunk_size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if chunk_size == 0:
+                    # Skip trailers up to the terminating blank line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(chunk_size))
+                await reader.readexactly(2)
+            payload = b"".join(chunks)
+        elif "content-length" in headers:
+            payload = await reader.readexactly(int(headers["content-length"]))
+        else:
+            payload = await reader.read()
+            keep_alive = False
+
+        return int(status), reason, keep_alive, payload
+
+    async def close(self) -> None:
+        """Close all idle connections and reject further requests."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        while self._idle:
+            self._idle.pop().close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with lifetime counters and current usage
+        """
+        return {
+            "size": self.size,
+            **self._stats,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+        }
+
+
+class AsyncXmlRpcTransport:
+    """
+    XML-RPC over non-blocking asyncio streams.
+
+    Requests are marshalled and responses unmarshalled on the event loop, so
+    no executor thread is involved and the number of calls in flight is only
+    bounded by the pool size.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = 8,
+        timeout: Optional[float] = None,
+        idle_timeout: float = 60.0,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            url: Odoo server URL
+            size: Maximum number of concurrent connections
+            timeout: Seconds allowed for each request
+            idle_timeout: Seconds after which an idle connection is closed
+        """
+        self._http = AsyncHTTPPool(
+            url,
+            size=size,
+            timeout=timeout,
+            idle_timeout=idle_timeout,
+        )
+
+    async def call(self, endpoint: str, method: str, *args: Any) -> Any:
+        """
+        Call an XML-RPC method.
+
+        Args:
+            endpoint: XML-RPC endpoint name (``common`` or ``object``)
+            method: Remote method name
+            *args: Method arguments
+
+        Returns:
+            Method result
+
+        Raises:
+            xmlrpc.client.Fault: If the server returns a fault
+        """
+        body = xmlrpc.client.dumps(args, method).encode("utf-8")
+        payload = await self._http.post(f"/xmlrpc/2/{endpoint}", body, "text/xml")
+        params, _ = xmlrpc.client.loads(payload)
+        return params[0]
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        await self._http.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics."""
+        return self._http.stats()
+
+
+class JsonRpcTransport:
+    """
+    Odoo's ``/jsonrpc`` endpoint over non-blocking asyncio streams.
+
+    It exposes the same ``common`` and ``object`` services as XML-RPC. JSON
+    decoding is cheaper than XML unmarshalling for large results and has no
+    ``None`` or integer size limitations. Errors are raised as
+    ``xmlrpc.client.Fault`` so callers handle both protocols alike.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = 8,
+        timeout: Optional[float] = None,
+        idle_timeout: float = 60.0,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            url: Odoo server URL
+            size: Maximum number of concurrent connections
+            timeout: Seconds allowed for each request
+            idle_timeout: Seconds after which an idle connection is closed
+        """
+        self._http = AsyncHTTPPool(
+            url,
+            size=size,
+            timeout=timeout,
+            idle_timeout=idle_timeout,
+        )
+        self._request_id = itertools.count(1)
+
+    async def call(self, endpoint: str, method: str, *args: Any) -> Any:
+        """
+        Call a method of an Odoo JSON-RPC service.
+
+        Args:
+            endpoint: Service name (``common`` or ``object``)
+            method: Remote method name
+            *args: Method arguments
+
+        Returns:
+            Method result
+
+        Raises:
+            xmlrpc.client.Fault: If the server returns an error
+        """
+        body = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": endpoint, "method": method, "args": args},
+                "id": next(self._request_id),
+            }
+        ).encode("utf-8")
+        payload = await self._http.post("/jsonrpc", body, "application/json")
+        response = json.loads(payload)
+
+        error = response.get("error")
+        if error:
+            data = error.get("data") or {}
+            message = data.get("message") or error.get("message", "")
+            if data.get("name"):
+                message = f"{data['name']}: {message}"
+            if data.get("debug"):
+                message = f"{message}\n{data['debug']}"
+            raise xmlrpc.client.Fault(error.get("code", 0), message)
+        return response.get("result")
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        await self._http.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics."""
+        return self._http.stats()
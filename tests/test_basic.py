@@ -6,7 +6,12 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from odoo_mcp.client import OdooClient, OdooError
 from odoo_mcp.config import Settings
-from odoo_mcp.tools import search_records_tool, create_record_tool
+from odoo_mcp.tools import (
+    batch_operations_tool,
+    create_record_tool,
+    format_records,
+    search_records_tool,
+)
 
 
 @pytest.fixture
@@ -88,6 +93,99 @@ async def test_create_record_tool_error(mock_odoo_client):
     assert result["error_type"] == "OdooError"
 
 
+@pytest.mark.asyncio
+async def test_batch_operations_tool_respects_dependencies(mock_odoo_client):
+    """Test that dependent operations run after, and only if, their dependencies."""
+    order = []
+
+    async def create_record(model, values):
+        order.append("create")
+        return 42
+
+    async def search_records(**kwargs):
+        order.append("search")
+        return [{"id": 42}]
+
+    mock_odoo_client.create_record.side_effect = create_record
+    mock_odoo_client.search_records.side_effect = search_records
+    mock_odoo_client.delete_record.side_effect = OdooError("Access denied")
+
+    result = await batch_operations_tool(
+        client=mock_odoo_client,
+        operations=[
+            {"id": "s", "type": "search", "model": "res.partner", "depends_on": ["c"]},
+            {"id": "c", "type": "create", "model": "res.partner", "values": {"name": "A"}},
+            {"id": "d", "type": "delete", "model": "res.partner", "record_id": 1},
+            {"id": "u", "type": "update", "model": "res.partner", "record_id": 1,
+             "values": {}, "depends_on": ["d"]},
+        ],
+    )
+
+    assert order == ["create", "search"]
+    assert [r["id"] for r in result["results"]] == ["s", "c", "d", "u"]
+    assert result["results"][0]["records"] == [{"id": 42}]
+    assert result["results"][1]["record_id"] == 42
+    assert result["results"][2]["success"] is False
+    assert result["results"][3]["skipped"] is True
+    assert result["success"] is False
+    mock_odoo_client.update_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_tool_rejects_cycles(mock_odoo_client):
+    """Test that dependency cycles are rejected before anything runs."""
+    result = await batch_operations_tool(
+        client=mock_odoo_client,
+        operations=[
+            {"id": "a", "type": "search", "model": "res.partner", "depends_on": ["b"]},
+            {"id": "b", "type": "search", "model": "res.partner", "depends_on": ["a"]},
+        ],
+    )
+
+    assert result["success"] is False
+    assert result["error_type"] == "ValidationError"
+    mock_odoo_client.search_records.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_tool_rejects_missing_parameters(mock_odoo_client):
+    """Test that a malformed operation is rejected before a sibling write runs."""
+    result = await batch_operations_tool(
+        client=mock_odoo_client,
+        operations=[
+            {"id": "c", "type": "create", "model": "res.partner", "values": {"name": "A"}},
+            {"id": "u", "type": "update", "model": "res.partner", "values": {"name": "B"}},
+        ],
+    )
+
+    assert result["success"] is False
+    assert result["error_type"] == "ValidationError"
+    assert "record_id" in result["error"]
+    mock_odoo_client.create_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_tool_reports_unexpected_errors_per_operation(mock_odoo_client):
+    """Test that an operation raising does not abandon the others."""
+    mock_odoo_client.create_record.return_value = 7
+    mock_odoo_client.update_record.side_effect = TypeError("bad values")
+
+    result = await batch_operations_tool(
+        client=mock_odoo_client,
+        operations=[
+            {"id": "u", "type": "update", "model": "res.partner", "record_id": 1,
+             "values": {"name": "B"}},
+            {"id": "c", "type": "create", "model": "res.partner", "values": {"name": "A"}},
+        ],
+    )
+
+    update, create = result["results"]
+    assert update["success"] is False
+    assert "bad values" in update["error"]
+    assert create["success"] is True
+    assert create["record_id"] == 7
+
+
 def test_settings_validation():
     """Test that settings are properly validated."""
     settings = Settings(
@@ -116,4 +214,21 @@ def test_settings_from_env(monkeypatch):
     assert settings.odoo_url == "https://env.odoo.com"
     assert settings.odoo_database == "env_db"
     assert settings.odoo_username == "env_user"
-    assert settings.odoo_password == "env_password"
\ No newline at end of file
+    assert settings.odoo_password == "env_password"
+
+def test_format_records_names_fields_once():
+    """Test the columnar and rows result shapes."""
+    records = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+
+    assert format_records(records) == {"records": records}
+    assert format_records(records, "columnar") == {
+        "fields": ["id", "name"],
+        "columns": {"id": [1, 2], "name": ["A", "B"]},
+    }
+    assert format_records(records, "rows") == {
+        "fields": ["id", "name"],
+        "rows": [[1, "A"], [2, "B"]],
+    }
+    assert format_records([], "rows") == {"fields": [], "rows": []}
+    with pytest.raises(ValueError):
+        format_records(records, "csv")
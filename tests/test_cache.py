@@ -0,0 +1,31 @@
+"""
+Tests for the client caches.
+"""
+
+import time
+
+from odoo_mcp.cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test LRU eviction once the cache is full."""
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries expire after the TTL."""
+    cache = TTLCache(max_size=2, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
@@ -0,0 +1,420 @@
+"""
+Tests for the Odoo client request paths.
+"""
+
+import asyncio
+import xmlrpc.client
+
+import pytest
+from unittest.mock import AsyncMock
+from odoo_mcp.client import OdooClient, OdooError, _encode_cursor
+from odoo_mcp.config import Settings
+
+
+@pytest.fixture
+def settings():
+    """Create settings pointing at a dummy Odoo instance."""
+    return Settings(
+        odoo_url="https://test.odoo.com",
+        odoo_database="test_db",
+        odoo_username="test_user",
+        odoo_password="test_password",
+    )
+
+
+@pytest.fixture
+def client(settings):
+    """Create an Odoo client that is already authenticated."""
+    client = OdooClient(settings)
+    client._authenticated = True
+    client.uid = 2
+    return client
+
+
+@pytest.mark.asyncio
+async def test_search_records_uses_search_read(client):
+    """Test that a search is a single search_read round trip."""
+    records = [{"id": 1, "name": "Test"}]
+    client._execute_kw = AsyncMock(return_value=records)
+
+    result = await client.search_records("res.partner", fields=["name"], limit=5)
+
+    assert result == records
+    client._execute_kw.assert_awaited_once()
+    assert client._execute_kw.await_args.args[1] == "search_read"
+    assert client._execute_kw.await_args.args[3] == {
+        "offset": 0,
+        "limit": 5,
+        "fields": ["name"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_records_falls_back_to_search_and_read(client):
+    """Test the two-step fallback when search_read is rejected."""
+    records = [{"id": 7, "name": "Test"}]
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        if method == "search_read":
+            raise xmlrpc.client.Fault(
+                2, "The method 'res.partner.search_read' does not exist"
+            )
+        if method == "search":
+            return [7]
+        return records
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+
+    assert await client.search_records("res.partner") == records
+    assert await client.search_records("res.partner") == records
+
+    methods = [call.args[1] for call in client._execute_kw.await_args_list]
+    assert methods == ["search_read", "search", "read", "search", "read"]
+
+
+@pytest.mark.asyncio
+async def test_search_records_does_not_fall_back_on_other_faults(client):
+    """Test that faults other than a missing method are raised unchanged."""
+    client._execute_kw = AsyncMock(
+        side_effect=xmlrpc.client.Fault(1, "Invalid field 'bogus' in leaf")
+    )
+
+    with pytest.raises(OdooError):
+        await client.search_records("res.partner", domain=[("bogus", "=", 1)])
+
+    client._execute_kw.assert_awaited_once()
+    assert "res.partner" not in client._search_read_unsupported
+
+
+@pytest.mark.asyncio
+async def test_search_records_web_search_read(settings):
+    """Test the web_search_read path with a field specification."""
+    settings.odoo_use_web_search_read = True
+    client = OdooClient(settings)
+    client._authenticated = True
+    client.uid = 2
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        if method == "fields_get":
+            return {
+                "name": {"type": "char"},
+                "parent_id": {"type": "many2one"},
+                "category_id": {"type": "many2many"},
+            }
+        return {
+            "length": 2,
+            "records": [
+                {
+                    "id": 1,
+                    "name": "Child",
+                    "parent_id": {"id": 3, "display_name": "Parent"},
+                    "category_id": [4, 5],
+                },
+                {"id": 2, "name": "Orphan", "parent_id": False, "category_id": []},
+            ],
+        }
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+
+    result = await client.search_records(
+        "res.partner", fields=["name", "parent_id", "category_id"]
+    )
+
+    assert result == [
+        {"id": 1, "name": "Child", "parent_id": [3, "Parent"], "category_id": [4, 5]},
+        {"id": 2, "name": "Orphan", "parent_id": False, "category_id": []},
+    ]
+    assert client._execute_kw.await_args.args[1] == "web_search_read"
+    assert client._execute_kw.await_args.args[3]["specification"] == {
+        "name": {},
+        "parent_id": {"fields": {"display_name": {}}},
+        "category_id": {},
+    }
+
+
+def test_settings_reject_unknown_transport():
+    """Test that an unknown transport is rejected when settings load."""
+    with pytest.raises(ValueError):
+        Settings(
+            odoo_url="https://test.odoo.com",
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_transport="carrier-pigeon",
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_model_fields_is_cached_per_attributes(client):
+    """Test that fields_get results are cached per attribute set."""
+    client._execute_kw = AsyncMock(return_value={"name": {"type": "char"}})
+
+    await client.get_model_fields("res.partner", attributes=["type"])
+    await client.get_model_fields("res.partner", attributes=["type"])
+    await client.get_model_fields("res.partner")
+
+    assert client._execute_kw.await_count == 2
+    assert client._execute_kw.await_args_list[0].args[3] == {"attributes": ["type"]}
+    assert client.get_cache_stats()["metadata"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_records_chunks_and_reports_errors(client):
+    """Test that bulk create sends one call per chunk and reports failures."""
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        chunk = args[0]
+        if chunk[0]["name"] == "c":
+            raise xmlrpc.client.Fault(1, "Validation error")
+        return [ord(vals["name"]) for vals in chunk]
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+    values = [{"name": name} for name in "abcde"]
+
+    result = await client.create_records("res.partner", values, chunk_size=2, concurrency=2)
+
+    assert client._execute_kw.await_count == 3
+    assert result["ids"] == [ord("a"), ord("b"), ord("e")]
+    assert result["errors"] == [
+        {"chunk": 1, "start": 2, "count": 2, "error": "<Fault 1: 'Validation error'>"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_records_groups_identical_values(client):
+    """Test that records sharing values are written in one call."""
+    client._execute_kw = AsyncMock(return_value=True)
+
+    result = await client.update_records(
+        "sale.order",
+        updates=[
+            (1, {"state": "cancel"}),
+            {"id": 2, "values": {"state": "cancel"}},
+            (3, {"note": "VIP"}),
+            (4, {"state": "cancel"}),
+        ],
+        chunk_size=2,
+    )
+
+    calls = [call.args[2] for call in client._execute_kw.await_args_list]
+    assert calls == [
+        [[1, 2], {"state": "cancel"}],
+        [[4], {"state": "cancel"}],
+        [[3], {"note": "VIP"}],
+    ]
+    assert result == {"updated_ids": [1, 2, 4, 3], "calls": 3, "errors": []}
+
+
+@pytest.mark.asyncio
+async def test_update_records_applies_last_values_of_repeated_ids(client):
+    """Test that a repeated id ends with the values requested last."""
+    client._execute_kw = AsyncMock(return_value=True)
+
+    result = await client.update_records(
+        "res.partner",
+        updates=[(2, {"a": 1}), (1, {"a": 2}), (1, {"a": 1, "b": 3}), (2, {"c": 4})],
+        concurrency=4,
+    )
+
+    calls = [call.args[2] for call in client._execute_kw.await_args_list]
+    assert calls == [[[2], {"a": 1, "c": 4}], [[1], {"a": 1, "b": 3}]]
+    assert sorted(result["updated_ids"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_delete_records_by_domain(client):
+    """Test that a domain is resolved with search and unlinked in chunks."""
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        if method == "search_count":
+            return 3
+        if method == "search":
+            return [5, 6, 7]
+        return True
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+    domain = [["active", "=", False]]
+
+    dry_run = await client.delete_records("res.partner", domain=domain, dry_run=True)
+    result = await client.delete_records("res.partner", domain=domain, chunk_size=2)
+
+    assert dry_run == {"dry_run": True, "count": 3}
+    assert result["deleted_ids"] == [5, 6, 7]
+    assert result["calls"] == 2
+    methods = [call.args[1] for call in client._execute_kw.await_args_list]
+    assert methods == ["search_count", "search", "unlink", "unlink"]
+
+
+@pytest.mark.asyncio
+async def test_delete_records_refuses_empty_domain_without_allow_all(client):
+    """Test that an empty domain only deletes everything when confirmed."""
+    client._execute_kw = AsyncMock(side_effect=[2, [1, 2], True])
+
+    with pytest.raises(ValueError, match="allow_all"):
+        await client.delete_records("res.partner", domain=[])
+    client._execute_kw.assert_not_called()
+
+    assert await client.delete_records("res.partner", domain=[], dry_run=True) == {
+        "dry_run": True, "count": 2,
+    }
+    result = await client.delete_records("res.partner", domain=[], allow_all=True)
+    assert result["deleted_ids"] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_search_page_walks_keyset_cursor(client):
+    """Test that pages follow id > last_id and end with a null cursor."""
+    ids = list(range(1, 6))
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        last_id = args[0][-1][2]
+        page = [i for i in ids if i > last_id][: kwargs["limit"]]
+        return [{"id": i} for i in page]
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+
+    seen, cursor = [], None
+    while True:
+        page = await client.search_page("res.partner", page_size=2, cursor=cursor)
+        seen.extend(record["id"] for record in page["records"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ids
+    assert client._execute_kw.await_args.args[3]["order"] == "id asc"
+
+
+@pytest.mark.asyncio
+async def test_search_page_rejects_cursor_of_other_query(client):
+    """Test that a cursor cannot be reused with a different domain."""
+    cursor = _encode_cursor("res.partner", [], 2)
+
+    with pytest.raises(ValueError):
+        await client.search_page(
+            "res.partner", domain=[["active", "=", True]], cursor=cursor
+        )
+
+
+@pytest.mark.asyncio
+async def test_record_cache_rereads_only_changed_rows(settings):
+    """Test that cached rows are served until their write_date changes."""
+    settings.odoo_record_cache_size = 100
+    client = OdooClient(settings)
+    client._authenticated = True
+    client.uid = 2
+    write_dates = {1: "2024-01-01 00:00:00", 2: "2024-01-01 00:00:00"}
+    reads = []
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        if method == "fields_get":
+            return {"name": {"type": "char"}, "write_date": {"type": "datetime"}}
+        if method == "search_read":
+            return [{"id": i, "write_date": d} for i, d in write_dates.items()]
+        reads.append(args[0])
+        return [{"id": i, "name": f"v{write_dates[i]}"} for i in args[0]]
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+
+    first = await client.search_records("res.partner", fields=["name"])
+    write_dates[2] = "2024-02-01 00:00:00"
+    second = await client.search_records("res.partner", fields=["name"])
+
+    assert reads == [[1, 2], [2]]
+    assert second[0] == first[0]
+    assert second[1]["name"] == "v2024-02-01 00:00:00"
+    assert client.get_cache_stats()["records"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_count_records_many_uses_search_count(client):
+    """Test that several domains are counted with search_count each."""
+    client._execute_kw = AsyncMock(side_effect=lambda model, method, args: len(args[0]))
+
+    counts = await client.count_records_many(
+        "account.move",
+        {"all": [], "posted": [["state", "=", "posted"]]},
+    )
+
+    assert counts == {"all": 0, "posted": 1}
+    assert {call.args[1] for call in client._execute_kw.await_args_list} == {
+        "search_count"
+    }
+
+
+@pytest.mark.asyncio
+async def test_read_group_passes_grouping_and_clamps_limit(client):
+    """Test that read_group forwards its options and drops the context."""
+    client._execute_kw = AsyncMock(
+        return_value=[
+            {"account_id": [1, "Sales"], "debit": 10.0, "__count": 2, "__context": {}},
+        ]
+    )
+
+    groups = await client.read_group(
+        "account.move.line",
+        ["account_id", "date:month"],
+        aggregates=["debit:sum"],
+        lazy=False,
+        limit=100000,
+    )
+
+    assert groups == [{"account_id": [1, "Sales"], "debit": 10.0, "__count": 2}]
+    assert client._execute_kw.await_args.args[1:] == (
+        "read_group",
+        [[], ["debit:sum"], ["account_id", "date:month"]],
+        {"offset": 0, "limit": client.max_limit, "lazy": False},
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_searches_share_one_call(client):
+    """Test that identical in-flight searches are coalesced onto one call."""
+    release = asyncio.Event()
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        await release.wait()
+        return [{"id": 1}]
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+
+    searches = [
+        asyncio.ensure_future(client.search_records("res.partner", limit=5))
+        for _ in range(3)
+    ]
+    other = asyncio.ensure_future(client.search_records("res.partner", limit=6))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*searches, other)
+
+    assert results == [[{"id": 1}]] * 4
+    assert client._execute_kw.await_count == 2
+    stats = client.get_cache_stats()["coalescing"]
+    assert stats["executed"] == 2
+    assert stats["coalesced"] == 2
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_after_write_does_not_join_earlier_search(client):
+    """Test that a write stops later searches from joining an older call."""
+    release = asyncio.Event()
+
+    async def execute_kw(model, method, args, kwargs=None, **options):
+        if method == "search_read":
+            await release.wait()
+            return []
+        return True
+
+    client._execute_kw = AsyncMock(side_effect=execute_kw)
+
+    before = asyncio.ensure_future(client.search_records("res.partner"))
+    await asyncio.sleep(0)
+    await client.update_record("res.partner", 1, {"name": "New"})
+    after = asyncio.ensure_future(client.search_records("res.partner"))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(before, after)
+
+    methods = [call.args[1] for call in client._execute_kw.await_args_list]
+    assert sorted(methods) == ["search_read", "search_read", "write"]
@@ -0,0 +1,53 @@
+"""
+Tests for the per model and method call metrics.
+"""
+
+from odoo_mcp.metrics import MetricsRegistry, measure_payload, record_payload
+
+
+def test_registry_aggregates_calls_per_method():
+    """Test counters, percentiles and ordering of the snapshot."""
+    registry = MetricsRegistry()
+    for duration in (0.01, 0.02, 0.03, 0.04):
+        registry.observe("res.partner", "search_read", duration, bytes_received=100)
+    registry.observe("res.partner", "create", 0.5, failed=True, retries=2)
+
+    create, search = registry.snapshot()
+
+    assert create["method"] == "create"
+    assert (create["calls"], create["errors"], create["retries"]) == (1, 1, 2)
+    assert search["calls"] == 4
+    assert search["bytes_received"] == 400
+    assert search["latency_ms"]["p50"] == 30.0
+    assert search["latency_ms"]["max"] == 40.0
+
+
+def test_registry_renders_prometheus_histogram():
+    """Test the Prometheus text output."""
+    registry = MetricsRegistry()
+    registry.observe("sale.order", "read", 0.02)
+
+    text = registry.prometheus()
+
+    assert 'odoo_mcp_calls_total{model="sale.order",method="read"} 1' in text
+    assert 'odoo_mcp_call_duration_seconds_bucket{model="sale.order",method="read",le="0.01"} 0' in text
+    assert 'odoo_mcp_call_duration_seconds_bucket{model="sale.order",method="read",le="0.025"} 1' in text
+    assert 'odoo_mcp_call_duration_seconds_count{model="sale.order",method="read"} 1' in text
+
+
+def test_disabled_registry_records_nothing():
+    """Test that a disabled registry ignores calls."""
+    registry = MetricsRegistry(enabled=False)
+    registry.observe("res.partner", "read", 0.01)
+
+    assert registry.snapshot() == []
+
+
+def test_payload_sizes_are_scoped_to_the_measured_block():
+    """Test that payload sizes only count inside measure_payload."""
+    record_payload(10, 10)
+    with measure_payload() as sizes:
+        record_payload(5, 50)
+        record_payload(1, 2)
+
+    assert sizes == [6, 52]
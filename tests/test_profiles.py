@@ -0,0 +1,79 @@
+"""
+Tests for connection profiles.
+"""
+
+import pytest
+from odoo_mcp.config import Settings
+from odoo_mcp.profiles import ClientRegistry
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with the default profile and two named ones."""
+    return ClientRegistry(
+        Settings(
+            odoo_url="https://test.odoo.com",
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_profiles={
+                "acme": {"database": "acme"},
+                "eu": {
+                    "url": "https://eu.odoo.com",
+                    "database": "eu_prod",
+                    "username": "bot",
+                    "password": "secret",
+                },
+            },
+        )
+    )
+
+
+def test_profiles_inherit_default_connection_settings(registry):
+    """Test that omitted profile settings come from the default profile."""
+    assert registry.names() == ["default", "acme", "eu"]
+
+    acme = registry.settings_for("acme")
+    assert (acme.odoo_url, acme.odoo_database, acme.odoo_username) == (
+        "https://test.odoo.com", "acme", "test_user",
+    )
+    eu = registry.settings_for("eu")
+    assert (eu.odoo_url, eu.odoo_database, eu.odoo_password) == (
+        "https://eu.odoo.com", "eu_prod", "secret",
+    )
+
+
+@pytest.mark.asyncio
+async def test_clients_are_created_lazily_once_per_profile(registry):
+    """Test client creation, reuse and closing."""
+    assert not any(profile["active"] for profile in registry.describe())
+
+    default = registry.get()
+    assert registry.get("default") is default
+    assert registry.get("acme") is not default
+    assert registry.get("acme").database == "acme"
+    assert [p["name"] for p in registry.describe() if p["active"]] == ["default", "acme"]
+    assert all("password" not in profile for profile in registry.describe())
+
+    await registry.close()
+    assert registry.get() is not default
+
+
+def test_unknown_profile_raises(registry):
+    """Test that an unknown profile name lists the valid ones."""
+    with pytest.raises(ValueError, match="default, acme, eu"):
+        registry.get("missing")
+
+
+def test_prometheus_covers_every_active_profile(registry):
+    """Test that one scrape reports each active profile under its own label."""
+    registry.get()._metrics.observe("res.partner", "read", 0.01)
+    registry.get("acme")._metrics.observe("res.partner", "read", 0.02)
+
+    text = registry.prometheus()
+
+    assert text.count("# TYPE odoo_mcp_calls_total counter") == 1
+    assert 'odoo_mcp_calls_total{profile="default",model="res.partner",method="read"} 1' in text
+    assert 'odoo_mcp_calls_total{profile="acme",model="res.partner",method="read"} 1' in text
+    assert 'odoo_mcp_executor_workers{profile="acme"} 8' in text
+    assert 'profile="eu"' not in text
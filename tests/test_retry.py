@@ -0,0 +1,194 @@
+"""
+Tests for the retry policy and circuit breaker.
+"""
+
+import asyncio
+import xmlrpc.client
+
+import pytest
+from unittest.mock import AsyncMock
+from odoo_mcp.client import OdooClient
+from odoo_mcp.config import Settings
+from odoo_mcp.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, classify_error
+from odoo_mcp.transport import PoolExhaustedError
+
+
+@pytest.fixture
+def client():
+    """Create an authenticated client whose retries do not wait."""
+    client = OdooClient(
+        Settings(
+            odoo_url="https://test.odoo.com",
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_retry_delay=0,
+            odoo_circuit_failure_threshold=3,
+        )
+    )
+    client._authenticated = True
+    client.uid = 2
+    return client
+
+
+def test_classify_error():
+    """Test the classification of common failures."""
+    assert classify_error(ConnectionRefusedError()) == "unavailable"
+    assert classify_error(PoolExhaustedError()) == "saturated"
+    assert classify_error(asyncio.TimeoutError()) == "timeout"
+    assert classify_error(ConnectionResetError()) == "connection"
+    assert classify_error(xmlrpc.client.Fault(3, "Access Denied")) == "auth"
+    assert classify_error(xmlrpc.client.Fault(4, "You are not allowed to modify")) == "fault"
+    assert classify_error(
+        xmlrpc.client.Fault(1, "could not serialize access due to concurrent update")
+    ) == "conflict"
+    assert classify_error(
+        xmlrpc.client.ProtocolError("odoo", 503, "Service Unavailable", {})
+    ) == "unavailable"
+
+
+def test_ambiguous_failures_only_retry_idempotent_methods():
+    """Test that a timeout is retried for reads but never for create."""
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry("search_read", "timeout", 0)
+    assert not policy.should_retry("create", "timeout", 0)
+    assert not policy.should_retry("unlink", "connection", 0)
+    assert policy.should_retry("create", "unavailable", 0)
+    assert not policy.should_retry("read", "fault", 0)
+    assert not policy.should_retry("read", "timeout", 2)
+
+
+def test_backoff_is_bounded_and_jittered():
+    """Test that the backoff grows exponentially up to the maximum delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    assert all(0 <= policy.backoff(1) <= 2.0 for _ in range(50))
+    assert all(0 <= policy.backoff(10) <= 5.0 for _ in range(50))
+
+
+def test_circuit_breaker_opens_and_probes():
+    """Test the closed, open and half-open transitions."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_execute_kw_does_not_retry_faults_or_create(client):
+    """Test that faults and ambiguous create failures are raised at once."""
+    client._rpc = AsyncMock(side_effect=xmlrpc.client.Fault(2, "Invalid field 'bogus'"))
+    with pytest.raises(xmlrpc.client.Fault):
+        await client._execute_kw("res.partner", "read", [[1]])
+    assert client._rpc.await_count == 1
+
+    client._rpc = AsyncMock(side_effect=asyncio.TimeoutError())
+    with pytest.raises(asyncio.TimeoutError):
+        await client._execute_kw("res.partner", "create", [{"name": "A"}])
+    assert client._rpc.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_kw_opens_circuit_when_odoo_is_down(client):
+    """Test that repeated connection failures make calls fail fast."""
+    client._rpc = AsyncMock(side_effect=ConnectionRefusedError())
+
+    with pytest.raises(ConnectionRefusedError):
+        await client._execute_kw("res.partner", "read", [[1]])
+    assert client._rpc.await_count == 3
+
+    with pytest.raises(CircuitOpenError):
+        await client._execute_kw("res.partner", "read", [[1]])
+    assert client._rpc.await_count == 3
+    assert client.get_retry_stats()["circuit"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_local_saturation_does_not_open_circuit(client):
+    """Test that a full executor queue is retried without counting as an outage."""
+    client._rpc = AsyncMock(side_effect=PoolExhaustedError("queue full"))
+
+    for _ in range(2):
+        with pytest.raises(PoolExhaustedError):
+            await client._execute_kw("res.partner", "create", [{"name": "A"}])
+
+    assert client._rpc.await_count == 8
+    assert client.get_retry_stats()["circuit"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_leave_circuit_stuck(client):
+    """Test that a cancelled half-open probe lets the next call probe again."""
+    client._circuit = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    client._rpc = AsyncMock(side_effect=ConnectionRefusedError())
+    with pytest.raises(ConnectionRefusedError):
+        await client._execute_kw("res.partner", "create", [{"name": "A"}])
+    assert client.get_retry_stats()["circuit"]["state"] == "open"
+
+    async def hang(*args):
+        await asyncio.sleep(10)
+
+    client._rpc = hang
+    probe = asyncio.create_task(client._execute_kw("res.partner", "read", [[1]]))
+    await asyncio.sleep(0)
+    assert client.get_retry_stats()["circuit"]["state"] == "half_open"
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    client._rpc = AsyncMock(return_value=[{"id": 1}])
+    assert await client._execute_kw("res.partner", "read", [[1]]) == [{"id": 1}]
+    assert client.get_retry_stats()["circuit"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_execute_kw_reauthenticates_once_for_concurrent_calls(client):
+    """Test that rejected credentials trigger a single re-authentication."""
+    state = {"uid": 7}
+
+    async def rpc(endpoint, method, *args):
+        if endpoint == "common":
+            await asyncio.sleep(0.01)
+            return state["uid"]
+        if args[1] != state["uid"]:
+            raise xmlrpc.client.Fault(3, "Access Denied")
+        return [{"id": 1}]
+
+    client._rpc = AsyncMock(side_effect=rpc)
+
+    results = await asyncio.gather(
+        *(client._execute_kw("res.partner", "read", [[1]]) for _ in range(5))
+    )
+
+    assert results == [[{"id": 1}]] * 5
+    assert client.uid == 7
+    logins = [call for call in client._rpc.await_args_list if call.args[0] == "common"]
+    assert len(logins) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_kw_raises_when_reauthentication_is_rejected(client):
+    """Test that a call is replayed only once after re-authenticating."""
+
+    async def rpc(endpoint, method, *args):
+        if endpoint == "common":
+            return 2
+        raise xmlrpc.client.Fault(3, "Access Denied")
+
+    client._rpc = AsyncMock(side_effect=rpc)
+
+    with pytest.raises(xmlrpc.client.Fault):
+        await client._execute_kw("res.partner", "read", [[1]])
+    assert [call.args[0] for call in client._rpc.await_args_list] == [
+        "object", "common", "object",
+    ]
@@ -0,0 +1,137 @@
+"""
+Tests for the Odoo call scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+from odoo_mcp.client import OdooClient
+from odoo_mcp.config import Settings
+from odoo_mcp.scheduler import CallScheduler, TokenBucket, lane_for
+
+
+def test_lane_for():
+    """Test the lane of reads, writes and other methods."""
+    assert lane_for("search_read") == "read"
+    assert lane_for("write") == "write"
+    assert lane_for("action_confirm") == "method"
+
+
+@pytest.mark.asyncio
+async def test_waiting_reads_go_before_writes_and_methods():
+    """Test that a freed slot goes to the highest priority lane."""
+    scheduler = CallScheduler(max_concurrent=1)
+    order = []
+    release = asyncio.Event()
+
+    async def call(method):
+        async with scheduler.slot(method):
+            order.append(method)
+            await release.wait()
+
+    holder = asyncio.create_task(call("search"))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(call(method))
+        for method in ("action_post", "create", "read")
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.stats()["lanes"]["read"]["waiting"] == 1
+
+    release.set()
+    await asyncio.gather(holder, *waiting)
+
+    assert order == ["search", "read", "create", "action_post"]
+    assert scheduler.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lane_limit_keeps_room_for_reads():
+    """Test that capped writes cannot take every slot."""
+    scheduler = CallScheduler(max_concurrent=3, lane_limits={"write": 1})
+    release = asyncio.Event()
+
+    async def call(method):
+        async with scheduler.slot(method):
+            await release.wait()
+
+    tasks = [asyncio.create_task(call("write")) for _ in range(3)]
+    tasks.append(asyncio.create_task(call("read")))
+    await asyncio.sleep(0)
+
+    lanes = scheduler.stats()["lanes"]
+    assert (lanes["write"]["in_flight"], lanes["write"]["waiting"]) == (1, 2)
+    assert lanes["read"]["in_flight"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """Test that cancelling a waiting call leaves the slots consistent."""
+    scheduler = CallScheduler(max_concurrent=1)
+    release = asyncio.Event()
+
+    async def call(method):
+        async with scheduler.slot(method):
+            await release.wait()
+
+    holder = asyncio.create_task(call("read"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(call("read"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await holder
+
+    async with scheduler.slot("read"):
+        assert scheduler.stats()["in_flight"] == 1
+    assert scheduler.stats()["lanes"]["read"]["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate_after_burst():
+    """Test that calls beyond the burst wait for new tokens."""
+    bucket = TokenBucket(rate=100, burst=2)
+
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_client_calls_go_through_scheduler():
+    """Test that execute_kw requests are admitted by the scheduler."""
+    client = OdooClient(
+        Settings(
+            odoo_url="https://test.odoo.com",
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_max_concurrent_calls=2,
+        )
+    )
+    client._authenticated = True
+    client.uid = 2
+    in_flight = []
+
+    async def rpc(*args):
+        in_flight.append(client._scheduler.stats()["in_flight"])
+        await asyncio.sleep(0.001)
+        return []
+
+    client._rpc = rpc
+
+    await asyncio.gather(
+        *(client._execute_kw("res.partner", "search", [[]]) for _ in range(6))
+    )
+
+    assert max(in_flight) == 2
+    scheduler = client.get_metrics()["scheduler"]
+    assert scheduler["lanes"]["read"]["admitted"] == 6
+    assert scheduler["lanes"]["read"]["queued"] == 4
@@ -0,0 +1,52 @@
+"""
+Tests for the tool response serializer.
+"""
+
+import datetime
+import json
+import xmlrpc.client
+
+import pytest
+from odoo_mcp.serialization import ResponseSerializer, orjson
+
+
+BACKENDS = ["json"] + (["orjson"] if orjson is not None else [])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_serializer_encodes_xmlrpc_values(backend):
+    """Test that XML-RPC and datetime values get the same encoding everywhere."""
+    serializer = ResponseSerializer(compact=True, backend=backend)
+
+    payload = serializer.dumps({
+        "write_date": xmlrpc.client.DateTime("20240131T08:30:00"),
+        "create_date": datetime.datetime(2024, 1, 31, 8, 30),
+        "image": xmlrpc.client.Binary(b"\x89PNG"),
+        "name": "Café",
+    })
+
+    assert json.loads(payload) == {
+        "write_date": "2024-01-31 08:30:00",
+        "create_date": "2024-01-31 08:30:00",
+        "image": "iVBORw==",
+        "name": "Café",
+    }
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_serializer_compact_is_smaller(backend):
+    """Test that compact mode drops indentation but keeps the same data."""
+    value = {"records": [{"id": i, "name": f"R{i}"} for i in range(10)]}
+
+    pretty = ResponseSerializer(backend=backend).dumps(value)
+    compact = ResponseSerializer(compact=True, backend=backend).dumps(value)
+
+    assert json.loads(pretty) == json.loads(compact) == value
+    assert "\n" in pretty and "\n" not in compact
+    assert len(compact) < len(pretty)
+
+
+def test_serializer_rejects_unknown_backend():
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        ResponseSerializer(backend="simplejson")
@@ -0,0 +1,26 @@
+"""
+Tests for the HTTP deployment of the MCP server.
+"""
+
+import os
+
+for name, value in {
+    "ODOO_URL": "https://test.odoo.com",
+    "ODOO_DATABASE": "test_db",
+    "ODOO_USERNAME": "test_user",
+    "ODOO_PASSWORD": "test_password",
+}.items():
+    os.environ.setdefault(name, value)
+
+from starlette.testclient import TestClient
+from odoo_mcp import server
+
+
+def test_http_app_closes_clients_on_shutdown():
+    """Test that Odoo clients outlive MCP sessions and close with the app."""
+    with TestClient(server.create_http_app()):
+        client = server.clients.get()
+        assert server.clients.get() is client
+        assert server.clients.describe()[0]["active"]
+
+    assert not server.clients.describe()[0]["active"]
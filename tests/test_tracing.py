@@ -0,0 +1,111 @@
+"""
+Tests for the tracing hooks.
+"""
+
+import json
+
+import pytest
+from benchmarks.fake_odoo import FakeOdoo, start_fake_odoo
+from odoo_mcp.client import OdooClient
+from odoo_mcp.config import Settings
+from odoo_mcp.tracing import JsonlTraceWriter, TraceHook, get_tracer, traced_tool
+
+
+class RecordingHook(TraceHook):
+    """Hook keeping the finished spans."""
+
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+
+@pytest.fixture
+def hook():
+    """Register a recording hook on the global tracer for one test."""
+    hook = RecordingHook()
+    get_tracer().add_hook(hook)
+    yield hook
+    get_tracer().hooks.remove(hook)
+
+
+@pytest.fixture
+def fake_odoo_url():
+    """Start the stand-in Odoo server with a few partners."""
+    fake = FakeOdoo()
+    fake.seed("res.partner", 3)
+    server, url = start_fake_odoo(fake)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_execute_kw_spans_attempts_with_queueing_and_sizes(hook, fake_odoo_url):
+    """Test the odoo.execute_kw span and its per attempt odoo.rpc child."""
+    client = OdooClient(
+        Settings(
+            odoo_url=fake_odoo_url,
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+        )
+    )
+    client._authenticated = True
+    client.uid = 2
+
+    await client._execute_kw("res.partner", "search_read", [[]], {"fields": ["name"]})
+    await client.close()
+
+    rpc, call = hook.spans
+    assert call.name == "odoo.execute_kw"
+    assert call.attributes["model"] == "res.partner"
+    assert call.attributes["method"] == "search_read"
+    assert call.attributes["response_bytes"] > 0
+    assert call.outcome == "ok"
+    assert rpc.name == "odoo.rpc"
+    assert rpc.parent is call
+    assert rpc.attributes["attempt"] == 1
+    assert rpc.attributes["queue_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_traced_tool_records_errors(hook):
+    """Test that a tool span records the raised error."""
+
+    @traced_tool
+    async def broken_tool(model: str) -> str:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await broken_tool("res.partner")
+
+    (span,) = hook.spans
+    assert (span.name, span.attributes["tool"], span.outcome) == (
+        "mcp.tool", "broken_tool", "error"
+    )
+
+
+@pytest.mark.asyncio
+async def test_jsonl_writer_appends_one_line_per_span(tmp_path):
+    """Test the JSONL trace file contents."""
+    path = tmp_path / "trace.jsonl"
+    writer = JsonlTraceWriter(str(path))
+    tracer = get_tracer()
+    tracer.add_hook(writer)
+    try:
+        @traced_tool
+        async def echo_tool() -> str:
+            return "{}"
+
+        await echo_tool()
+    finally:
+        tracer.hooks.remove(writer)
+        writer.close()
+
+    (line,) = path.read_text().splitlines()
+    span = json.loads(line)
+    assert span["name"] == "mcp.tool"
+    assert span["parent_id"] is None
+    assert span["attributes"] == {"tool": "echo_tool", "response_bytes": 2}
@@ -0,0 +1,320 @@
+"""
+Tests for the pooled XML-RPC transports.
+"""
+
+import asyncio
+import threading
+import time
+import xmlrpc.client
+from socketserver import ThreadingMixIn
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+import pytest
+from benchmarks.fake_odoo import FakeOdoo, start_fake_odoo
+from odoo_mcp.client import OdooClient, OdooError
+from odoo_mcp.config import Settings
+from odoo_mcp.transport import (
+    AsyncXmlRpcTransport,
+    CallExecutor,
+    ConnectionPool,
+    JsonRpcTransport,
+    PoolExhaustedError,
+)
+
+
+class KeepAliveHandler(SimpleXMLRPCRequestHandler):
+    """Request handler that keeps HTTP/1.1 connections open."""
+
+    protocol_version = "HTTP/1.1"
+    rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+
+
+class ThreadedXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    """XML-RPC server handling each connection in its own thread."""
+
+    daemon_threads = True
+
+
+@pytest.fixture
+def server_url():
+    """Start a local XML-RPC server answering ``version``."""
+    server = ThreadedXMLRPCServer(
+        ("127.0.0.1", 0),
+        requestHandler=KeepAliveHandler,
+        logRequests=False,
+    )
+    server.register_function(lambda: {"server_version": "17.0"}, "version")
+
+    def fail():
+        raise xmlrpc.client.Fault(1, "Access denied")
+
+    server.register_function(fail, "fail")
+
+    def execute_kw(database, uid, password, model, method, args, kwargs):
+        time.sleep(0.01)
+        return [model, method, args]
+
+    server.register_function(execute_kw, "execute_kw")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_reuses_connections(server_url):
+    """Test that sequential calls reuse a single pooled proxy."""
+    pool = ConnectionPool(server_url, size=2, timeout=5)
+
+    for _ in range(3):
+        with pool.connection("common") as proxy:
+            assert proxy.version() == {"server_version": "17.0"}
+
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["reused"] == 2
+    assert stats["endpoints"]["common"] == {"in_use": 0, "idle": 1}
+    pool.close()
+
+
+def test_pool_checkout_times_out_when_exhausted(server_url):
+    """Test that checkout fails once every proxy is in use."""
+    pool = ConnectionPool(server_url, size=1, timeout=5, checkout_timeout=0.05)
+
+    pooled = pool.checkout("object")
+    with pytest.raises(PoolExhaustedError):
+        pool.checkout("object")
+    pool.checkin("object", pooled)
+
+    assert pool.stats()["waits"] == 1
+    pool.close()
+
+
+def test_pool_reaps_idle_connections(server_url):
+    """Test that idle connections past the idle timeout are closed."""
+    pool = ConnectionPool(server_url, size=2, timeout=5, idle_timeout=0)
+
+    with pool.connection("common") as proxy:
+        proxy.version()
+
+    time.sleep(0.01)
+    assert pool.reap_idle() == 1
+    assert pool.stats()["endpoints"]["common"]["idle"] == 0
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_async_transport_runs_concurrent_calls(server_url):
+    """Test concurrent calls over keep-alive asyncio connections."""
+    transport = AsyncXmlRpcTransport(server_url, size=2, timeout=5)
+
+    results = await asyncio.gather(
+        *(transport.call("common", "version") for _ in range(6))
+    )
+
+    assert results == [{"server_version": "17.0"}] * 6
+    stats = transport.stats()
+    assert stats["checkouts"] == 6
+    assert stats["created"] <= 2
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_async_transport_raises_faults(server_url):
+    """Test that XML-RPC faults surface as xmlrpc.client.Fault."""
+    transport = AsyncXmlRpcTransport(server_url, size=1, timeout=5)
+
+    with pytest.raises(xmlrpc.client.Fault):
+        await transport.call("common", "fail")
+
+    assert await transport.call("common", "version") == {"server_version": "17.0"}
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_client_concurrent_calls_share_pool(server_url):
+    """Test concurrent execute_kw calls from executor threads through the pool."""
+    client = OdooClient(
+        Settings(
+            odoo_url=server_url,
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_pool_size=3,
+        )
+    )
+    client._authenticated = True
+    client.uid = 2
+
+    results = await asyncio.gather(
+        *(client._execute_kw("res.partner", "read", [[i]]) for i in range(20))
+    )
+
+    assert results == [["res.partner", "read", [[i]]] for i in range(20)]
+    stats = client.get_pool_stats()
+    assert stats["checkouts"] == 20
+    assert stats["created"] <= 3
+    assert stats["endpoints"]["object"]["in_use"] == 0
+    assert stats["executor"]["max_workers"] == 3
+    assert stats["executor"]["completed"] == 20
+    assert stats["executor"]["peak_running"] <= 3
+    assert "odoo_mcp_executor_queued_calls 0\n" in client.get_metrics_prometheus()
+    await client.close()
+    assert client._executor._shutdown
+
+
+def test_call_executor_reports_queue_and_rejects_overflow():
+    """Test queued/running counts, wait time and the queue bound."""
+    executor = CallExecutor(max_workers=1, max_queue=1, thread_name_prefix="odoo-rpc-test")
+    release = threading.Event()
+
+    running = executor.submit(release.wait)
+    while executor.stats()["running"] == 0:
+        time.sleep(0.001)
+    queued = executor.submit(threading.current_thread)
+
+    stats = executor.stats()
+    assert (stats["running"], stats["queued"]) == (1, 1)
+    with pytest.raises(PoolExhaustedError):
+        executor.submit(time.sleep, 0)
+
+    time.sleep(0.02)
+    release.set()
+    assert running.result(timeout=5) is True
+    assert queued.result(timeout=5).name.startswith("odoo-rpc-test")
+
+    stats = executor.stats()
+    assert (stats["running"], stats["queued"]) == (0, 0)
+    assert (stats["completed"], stats["rejected"]) == (2, 1)
+    assert stats["wait_ms"]["max"] >= 20
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_call_executor_releases_cancelled_queued_calls():
+    """Test that a call cancelled while queued leaves the queue count."""
+    executor = CallExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    loop = asyncio.get_running_loop()
+
+    running = loop.run_in_executor(executor, release.wait)
+    while executor.stats()["running"] == 0:
+        await asyncio.sleep(0.001)
+    queued = loop.run_in_executor(executor, time.sleep, 0)
+    queued.cancel()
+    await asyncio.sleep(0)
+
+    stats = executor.stats()
+    assert (stats["queued"], stats["cancelled"]) == (0, 1)
+    # The queue bound is free again
+    release.set()
+    await running
+    await loop.run_in_executor(executor, time.sleep, 0)
+    executor.shutdown()
+
+
+@pytest.fixture
+def fake_odoo_url():
+    """Start the stand-in Odoo server with a few partners."""
+    fake = FakeOdoo()
+    fake.seed("res.partner", 5)
+    server, url = start_fake_odoo(fake)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_jsonrpc_transport_calls_object_service(fake_odoo_url):
+    """Test execute_kw over JSON-RPC and fault translation."""
+    transport = JsonRpcTransport(fake_odoo_url, size=2, timeout=5)
+
+    records = await transport.call(
+        "object", "execute_kw", "db", 2, "pw", "res.partner", "search_read",
+        [[]], {"fields": ["name"], "limit": 2},
+    )
+    assert [record["id"] for record in records] == [1, 2]
+
+    with pytest.raises(xmlrpc.client.Fault) as excinfo:
+        await transport.call(
+            "object", "execute_kw", "db", 2, "pw", "res.partner", "nope", [], {}
+        )
+    assert "does not exist" in excinfo.value.faultString
+    await transport.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "protocol,transport",
+    [("xmlrpc", "threaded"), ("xmlrpc", "asyncio"), ("jsonrpc", "asyncio")],
+)
+async def test_client_records_payload_metrics(fake_odoo_url, protocol, transport):
+    """Test that every transport reports request and response bytes."""
+    client = OdooClient(
+        Settings(
+            odoo_url=fake_odoo_url,
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_protocol=protocol,
+            odoo_transport=transport,
+        )
+    )
+
+    await client.search_records("res.partner", fields=["name"])
+
+    (search,) = client.get_metrics()["calls"]
+    assert (search["model"], search["method"]) == ("res.partner", "search_read")
+    assert search["calls"] == 1
+    assert search["bytes_sent"] > 0
+    assert search["bytes_received"] > search["bytes_sent"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_transport_raises_protocol_error_on_http_error(server_url):
+    """Test that non-200 answers raise ProtocolError like the threaded transport."""
+    transport = AsyncXmlRpcTransport(server_url, size=1, timeout=5)
+
+    with pytest.raises(xmlrpc.client.ProtocolError) as excinfo:
+        await transport.call("missing", "version")
+
+    assert excinfo.value.errcode == 404
+    await transport.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["threaded", "asyncio"])
+async def test_client_retries_injected_outage(transport):
+    """Test that a read survives a 503 from Odoo but a failed create is not replayed."""
+    fake = FakeOdoo()
+    fake.seed("res.partner", 3)
+    server, url = start_fake_odoo(fake)
+    client = OdooClient(
+        Settings(
+            odoo_url=url,
+            odoo_database="test_db",
+            odoo_username="test_user",
+            odoo_password="test_password",
+            odoo_transport=transport,
+            odoo_retry_delay=0.01,
+        )
+    )
+
+    try:
+        fake.fail_next("unavailable", 1)
+        records = await client.search_records("res.partner", fields=["name"])
+        assert len(records) == 3
+        assert client.get_retry_stats()["retries"] == 1
+
+        # The connection drops after the request was sent: create may have run.
+        # The transport replays once on a fresh connection (the reused one may
+        # just have gone stale); the client must not replay it again.
+        fake.fail_next("disconnect", 2)
+        with pytest.raises(OdooError):
+            await client.create_record("res.partner", {"name": "Once"})
+        assert client.get_retry_stats()["not_retried"] == 1
+    finally:
+        await client.close()
+        server.shutdown()
+        server.server_close()